@@ -2,7 +2,10 @@ from django.contrib.auth import login, logout
 from django.contrib.auth.forms import AuthenticationForm
 from django.shortcuts import redirect, render
 
+from interview_service.ratelimit import rate_limit
 
+
+@rate_limit("login", email_field="username")
 def login_view(request):
     """Login view for interviewers."""
     if request.user.is_authenticated:
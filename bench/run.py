@@ -0,0 +1,241 @@
+"""
+Drive the main endpoints under concurrent load and record latency percentiles.
+
+Usage:
+    python -m bench.run --base-url http://127.0.0.1:8001 --concurrency 16 --duration 20
+    python -m bench.run --compare bench/results/old.json bench/results/new.json
+
+Needs a server running with DJANGO_SETTINGS_MODULE=bench.settings and a
+state file written by `python -m bench.seed`. Results are saved as JSON
+under bench/results/, named after the current commit.
+"""
+
+import argparse
+import hashlib
+import hmac
+import http.client
+import json
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from bench.seed import STATE_FILE
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def build_scenarios(state):
+    """Return {name: callable(i) -> (method, path, headers, body)} for each endpoint."""
+    interviewer_ids = state["interviewer_ids"]
+
+    def webhook(i):
+        payload = json.dumps(
+            {
+                "id": f"evt_bench_{i}",
+                "object": "event",
+                "type": "checkout.session.completed",
+                "data": {
+                    "object": {
+                        "id": f"cs_bench_{i}",
+                        "payment_intent": f"pi_bench_{i}",
+                        "metadata": {"booking_id": str(state["webhook_booking_id"])},
+                    }
+                },
+            }
+        )
+        timestamp = int(time.time())
+        signature = hmac.new(
+            state["webhook_secret"].encode(),
+            f"{timestamp}.{payload}".encode(),
+            hashlib.sha256,
+        ).hexdigest()
+        headers = {
+            "Content-Type": "application/json",
+            "Stripe-Signature": f"t={timestamp},v1={signature}",
+        }
+        return "POST", "/bookings/webhook/stripe/", headers, payload.encode()
+
+    return {
+        "homepage": lambda i: ("GET", "/", {}, None),
+        "interviewer_list": lambda i: ("GET", "/interviewers/", {}, None),
+        "interviewer_grid_partial": lambda i: (
+            "GET",
+            f"/interviewers/?technology={state['technology']}",
+            {"HX-Request": "true"},
+            None,
+        ),
+        "interviewer_detail_modal": lambda i: (
+            "GET",
+            f"/interviewers/{interviewer_ids[i % len(interviewer_ids)]}/modal/",
+            {"HX-Request": "true"},
+            None,
+        ),
+        "dashboard_home": lambda i: ("GET", "/dashboard/", {"Cookie": state["session_cookie"]}, None),
+        "stripe_webhook": webhook,
+    }
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def run_scenario(base_url, make_request, concurrency, duration, warmup):
+    """Hammer one endpoint from `concurrency` keep-alive clients for `duration` seconds."""
+    url = urlsplit(base_url)
+    latencies, queries, statuses = [], [], {}
+    lock = threading.Lock()
+    counter = iter(range(sys.maxsize))
+
+    def worker(deadline, record):
+        conn = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=30)
+        try:
+            while time.perf_counter() < deadline:
+                method, path, headers, body = make_request(next(counter))
+                started = time.perf_counter()
+                try:
+                    conn.request(method, path, body=body, headers=headers)
+                    response = conn.getresponse()
+                    response.read()
+                except (OSError, http.client.HTTPException):
+                    conn.close()
+                    status, query_count = "error", None
+                else:
+                    status = response.status
+                    query_count = response.getheader("X-Bench-Queries")
+                elapsed = time.perf_counter() - started
+                if record:
+                    with lock:
+                        latencies.append(elapsed)
+                        statuses[status] = statuses.get(status, 0) + 1
+                        if query_count is not None:
+                            queries.append(int(query_count))
+        finally:
+            conn.close()
+
+    for phase_duration, record in ((warmup, False), (duration, True)):
+        deadline = time.perf_counter() + phase_duration
+        threads = [
+            threading.Thread(target=worker, args=(deadline, record)) for _ in range(concurrency)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / elapsed, 2),
+        "latency_ms": {
+            name: round(percentile(latencies, pct) * 1000, 2) if latencies else None
+            for name, pct in (("p50", 50), ("p95", 95), ("p99", 99))
+        },
+        "latency_max_ms": round(latencies[-1] * 1000, 2) if latencies else None,
+        "queries_per_request": round(sum(queries) / len(queries), 2) if queries else None,
+        "statuses": {str(status): count for status, count in statuses.items()},
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_results(results):
+    print(f"{'endpoint':<28}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'queries':>10}")
+    for name, result in results["endpoints"].items():
+        latency = result["latency_ms"]
+        print(
+            f"{name:<28}{result['throughput_rps']:>10}{latency['p50']!s:>10}"
+            f"{latency['p95']!s:>10}{latency['p99']!s:>10}{result['queries_per_request']!s:>10}"
+        )
+
+
+def _delta(before, after):
+    if not before or after is None:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def compare(baseline_path, candidate_path):
+    baseline = json.loads(Path(baseline_path).read_text())
+    candidate = json.loads(Path(candidate_path).read_text())
+    print(f"{baseline['revision']} -> {candidate['revision']}")
+    print(f"{'endpoint':<28}{'rps':>12}{'p95 ms':>12}{'queries':>20}")
+    for name, new in candidate["endpoints"].items():
+        old = baseline["endpoints"].get(name)
+        if not old:
+            continue
+        print(
+            f"{name:<28}"
+            f"{_delta(old['throughput_rps'], new['throughput_rps']):>12}"
+            f"{_delta(old['latency_ms']['p95'], new['latency_ms']['p95']):>12}"
+            f"{str(old['queries_per_request']) + ' -> ' + str(new['queries_per_request']):>20}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10, help="Measured seconds per endpoint.")
+    parser.add_argument("--warmup", type=float, default=2, help="Unmeasured seconds per endpoint.")
+    parser.add_argument("--endpoint", action="append", help="Only run these endpoints (repeatable).")
+    parser.add_argument("--output", help="Results file (default: bench/results/<revision>-<time>.json).")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CANDIDATE"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    if not STATE_FILE.exists():
+        parser.error(f"{STATE_FILE} not found; run `python -m bench.seed` first")
+    scenarios = build_scenarios(json.loads(STATE_FILE.read_text()))
+    selected = args.endpoint or list(scenarios)
+    unknown = set(selected) - scenarios.keys()
+    if unknown:
+        parser.error(f"unknown endpoints: {', '.join(sorted(unknown))}")
+
+    results = {
+        "revision": git_revision(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "base_url": args.base_url,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "endpoints": {},
+    }
+    for name in selected:
+        print(f"Running {name}...", file=sys.stderr)
+        results["endpoints"][name] = run_scenario(
+            args.base_url, scenarios[name], args.concurrency, args.duration, args.warmup
+        )
+
+    print_results(results)
+    output = Path(args.output) if args.output else RESULTS_DIR / (
+        f"{results['revision']}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"Results written to {output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Seed the benchmark dataset and write the driver's state file.
+
+Usage:
+    DJANGO_SETTINGS_MODULE=bench.settings python -m bench.seed [--interviewers N] [--bookings N]
+"""
+
+import argparse
+import json
+import os
+import random
+from datetime import timedelta
+from importlib import import_module
+from pathlib import Path
+
+STATE_FILE = Path(__file__).resolve().parent / ".state.json"
+PREFIX = "bench-"
+
+TECHNOLOGIES = ["Python", "Go", "Rust", "TypeScript", "React", "Java", "Kotlin", "C++", "Ruby", "SQL"]
+SUBJECTS = ["Frontend", "Backend", "System Design", "Machine Learning", "Fullstack"]
+
+
+def seed(interviewers, bookings, seed_value=508):
+    from django.conf import settings
+    from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+    from django.contrib.auth.models import User
+    from django.utils import timezone
+
+    from bookings.models import Booking
+    from interviewers.importer import InterviewerImporter
+    from interviewers.models import Interviewer
+
+    rng = random.Random(seed_value)
+
+    # Start from a clean slate; profiles and bookings cascade
+    User.objects.filter(username__startswith=PREFIX).delete()
+
+    InterviewerImporter().run(
+        (
+            i,
+            {
+                "username": f"{PREFIX}{i}",
+                "email": f"{PREFIX}{i}@example.com",
+                "first_name": "Bench",
+                "last_name": f"Interviewer {i}",
+                "bio": "Benchmark interviewer. " * 20,
+                "cal_event_type_id": f"{PREFIX}{i}/interview",
+                "hourly_rate": str(rng.choice([80, 100, 120, 150, 200])),
+                "companies": "Google, Meta, Stripe",
+                "technologies": rng.sample(TECHNOLOGIES, 3),
+                "subjects": rng.sample(SUBJECTS, 2),
+            },
+        )
+        for i in range(interviewers)
+    )
+
+    interviewer = Interviewer.objects.select_related("user").get(user__username=f"{PREFIX}0")
+    now = timezone.now()
+    Booking.objects.bulk_create(
+        (
+            Booking(
+                interviewer=interviewer,
+                customer_name=f"Customer {i}",
+                customer_email=f"customer{i}@example.com",
+                customer_background="Background",
+                interview_focus="System design and behavioural questions",
+                scheduled_at=now + timedelta(hours=rng.randint(-24 * 365, 24 * 30)),
+                status=rng.choice(Booking.Status.values),
+                amount_cents=15000,
+            )
+            for i in range(bookings)
+        ),
+        batch_size=1000,
+    )
+    webhook_booking = Booking.objects.create(
+        interviewer=interviewer,
+        customer_name="Webhook Customer",
+        customer_email="webhook@example.com",
+        customer_background="Background",
+        interview_focus="Focus",
+        scheduled_at=now + timedelta(days=7),
+        status=Booking.Status.PENDING,
+    )
+
+    # Log the dashboard interviewer in without going through the login form
+    user = interviewer.user
+    session = import_module(settings.SESSION_ENGINE).SessionStore()
+    session[SESSION_KEY] = str(user.pk)
+    session[BACKEND_SESSION_KEY] = "django.contrib.auth.backends.ModelBackend"
+    session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    session.save()
+
+    state = {
+        "session_cookie": f"{settings.SESSION_COOKIE_NAME}={session.session_key}",
+        "interviewer_ids": list(
+            Interviewer.objects.filter(user__username__startswith=PREFIX).values_list("id", flat=True)
+        ),
+        "technology": "python",
+        "webhook_booking_id": webhook_booking.id,
+        "webhook_secret": settings.STRIPE_WEBHOOK_SECRET,
+    }
+    STATE_FILE.write_text(json.dumps(state, indent=2))
+    return state
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interviewers", type=int, default=200)
+    parser.add_argument("--bookings", type=int, default=2000, help="Bookings for the dashboard interviewer.")
+    parser.add_argument("--seed", type=int, default=508, help="Random seed for reproducible data.")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "bench.settings")
+    import django
+
+    django.setup()
+    state = seed(args.interviewers, args.bookings, args.seed)
+    print(f"Seeded {len(state['interviewer_ids'])} interviewers; state written to {STATE_FILE}")
+
+
+if __name__ == "__main__":
+    main()
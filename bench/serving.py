@@ -0,0 +1,118 @@
+"""
+Compare gunicorn's defaults with the tuned gunicorn.conf.py.
+
+Usage:
+    DJANGO_SETTINGS_MODULE=bench.settings python -m bench.serving --concurrency 16 --duration 20
+
+Starts each serving profile in turn on a local port, records how long the
+first request to every endpoint takes right after boot, runs the normal
+benchmark scenarios against it, then prints the comparison. Needs the
+state file written by `python -m bench.seed`.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from bench.run import RESULTS_DIR, build_scenarios, compare, git_revision, print_results, run_scenario
+from bench.seed import STATE_FILE
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PROFILES = {
+    # One sync worker, no preload, no warmup: what the Dockerfile used to run
+    "defaults": ["gunicorn", "--config", os.devnull, "interview_service.wsgi:application"],
+    "tuned": ["gunicorn", "--config", str(ROOT / "gunicorn.conf.py")],
+}
+
+
+def wait_until_ready(host, port, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection(host, port, timeout=1)
+            conn.request("GET", "/metrics")
+            conn.getresponse().read()
+            conn.close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Server on port {port} did not start within {timeout}s")
+
+
+def first_request_ms(host, port, scenarios):
+    """Latency of the first request to each endpoint after boot (cold caches)."""
+    latencies = {}
+    for name, make_request in scenarios.items():
+        method, path, headers, body = make_request(0)
+        conn = http.client.HTTPConnection(host, port, timeout=30)
+        started = time.perf_counter()
+        conn.request(method, path, body=body, headers=headers)
+        conn.getresponse().read()
+        latencies[name] = round((time.perf_counter() - started) * 1000, 2)
+        conn.close()
+    return latencies
+
+
+def run_profile(name, args, scenarios, port):
+    command = PROFILES[name] + ["--bind", f"127.0.0.1:{port}"]
+    server = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_until_ready("127.0.0.1", port)
+        results = {
+            "revision": git_revision(),
+            "profile": name,
+            "started_at": datetime.now().isoformat(),
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "first_request_ms": first_request_ms("127.0.0.1", port, scenarios),
+            "endpoints": {},
+        }
+        for endpoint, make_request in scenarios.items():
+            print(f"[{name}] running {endpoint}...", file=sys.stderr)
+            results["endpoints"][endpoint] = run_scenario(
+                f"http://127.0.0.1:{port}", make_request, args.concurrency, args.duration, args.warmup
+            )
+        return results
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8002)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10, help="Measured seconds per endpoint.")
+    parser.add_argument("--warmup", type=float, default=2, help="Unmeasured seconds per endpoint.")
+    parser.add_argument("--endpoint", action="append", help="Only run these endpoints (repeatable).")
+    args = parser.parse_args()
+
+    if not STATE_FILE.exists():
+        parser.error(f"{STATE_FILE} not found; run `python -m bench.seed` first")
+    scenarios = build_scenarios(json.loads(STATE_FILE.read_text()))
+    if args.endpoint:
+        scenarios = {name: scenarios[name] for name in args.endpoint}
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    stamp = f"{git_revision()}-{datetime.now():%Y%m%d-%H%M%S}"
+    paths = {}
+    for name in PROFILES:
+        results = run_profile(name, args, scenarios, args.port)
+        print(f"\n{name}: first request after boot (ms) {results['first_request_ms']}")
+        print_results(results)
+        paths[name] = RESULTS_DIR / f"{stamp}-serving-{name}.json"
+        paths[name].write_text(json.dumps(results, indent=2))
+
+    print()
+    compare(paths["defaults"], paths["tuned"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""
+Benchmark settings.
+
+The dev database with local stand-ins for external services: emails are
+rendered and discarded, Stripe webhooks are signed locally with a fixed
+secret, and uploads go to the local filesystem instead of S3.
+"""
+
+from interview_service.settings.dev import *  # noqa: F403
+
+# DEBUG keeps every query in memory and adds browser-reload overhead
+DEBUG = False
+
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app != "django_browser_reload"]  # noqa: F405
+MIDDLEWARE = ["bench.middleware.QueryCountMiddleware"] + [  # noqa: F405
+    middleware for middleware in MIDDLEWARE if "browser_reload" not in middleware  # noqa: F405
+]
+
+# SMTP stand-in: templates are still rendered, nothing is sent
+EMAIL_BACKEND = "django.core.mail.backends.dummy.EmailBackend"
+
+# Stripe stand-in: the driver signs webhook payloads with this secret
+STRIPE_SECRET_KEY = "sk_test_bench"
+STRIPE_WEBHOOK_SECRET = "whsec_bench"
+
+# S3 stand-in
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
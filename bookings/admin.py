@@ -1,6 +1,40 @@
 from django.contrib import admin
+from django.db.models import Sum
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.html import format_html
 
-from .models import Booking
+from interview_service.pagination import EstimatedCountPaginator
+from interviewers.models import Interviewer
+
+from .export import stream_bookings_csv
+from .models import Booking, BookingDailyStats
+
+
+class InterviewerFilter(admin.SimpleListFilter):
+    """
+    Filter by interviewer without listing every interviewer in the sidebar.
+
+    Only the currently selected interviewer is shown; pick one by clicking
+    the interviewer column in the changelist.
+    """
+
+    title = "interviewer"
+    parameter_name = "interviewer"
+
+    def lookups(self, request, model_admin):
+        value = self.value()
+        if value and value.isdigit():
+            interviewer = Interviewer.objects.select_related("user").filter(pk=value).first()
+            if interviewer:
+                return [(value, str(interviewer))]
+        return []
+
+    def queryset(self, request, queryset):
+        value = self.value()
+        if value and value.isdigit():
+            return queryset.filter(interviewer_id=value)
+        return queryset
 
 
 @admin.register(Booking)
@@ -8,17 +42,38 @@ class BookingAdmin(admin.ModelAdmin):
     list_display = [
         "id",
         "customer_name",
-        "interviewer",
+        "interviewer_link",
         "scheduled_at",
         "status",
         "created_at",
     ]
-    list_filter = ["status", "interviewer", "scheduled_at"]
-    search_fields = ["customer_name", "customer_email", "interviewer__user__username"]
+    list_select_related = ["interviewer__user"]
+    list_filter = ["status", InterviewerFilter]
+    date_hierarchy = "scheduled_at"
+    # Prefix and exact matches only, so every term is served by the
+    # UPPER(...) indexes on Booking instead of a sequential scan. The
+    # interviewer's username is matched in the small users table and
+    # joined through the interviewer-leading booking indexes.
+    search_fields = [
+        "^customer_email",
+        "^customer_name",
+        "^interviewer__user__username",
+        "=stripe_checkout_session_id",
+        "=stripe_payment_intent_id",
+    ]
+    search_help_text = (
+        "Search by the start of a customer email or name, an interviewer's "
+        "username, or an exact Stripe ID."
+    )
+    autocomplete_fields = ["interviewer"]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    actions = ["export_csv"]
     readonly_fields = [
         "stripe_payment_intent_id",
         "stripe_checkout_session_id",
         "cal_booking_uid",
+        "amount_cents",
         "created_at",
         "updated_at",
     ]
@@ -41,7 +96,64 @@ class BookingAdmin(admin.ModelAdmin):
         ("Scheduling", {"fields": ["scheduled_at", "duration_minutes", "cal_booking_uid"]}),
         (
             "Payment",
-            {"fields": ["stripe_checkout_session_id", "stripe_payment_intent_id"]},
+            {"fields": ["amount_cents", "stripe_checkout_session_id", "stripe_payment_intent_id"]},
         ),
         ("Timestamps", {"fields": ["created_at", "updated_at"]}),
     ]
+
+    @admin.action(description="Export selected bookings as CSV")
+    def export_csv(self, request, queryset):
+        return stream_bookings_csv(
+            queryset, f"bookings-{timezone.localdate().isoformat()}.csv"
+        )
+
+    @admin.display(description="Interviewer")
+    def interviewer_link(self, obj):
+        url = reverse("admin:bookings_booking_changelist")
+        return format_html(
+            '<a href="{}?interviewer={}">{}</a>', url, obj.interviewer_id, obj.interviewer
+        )
+
+
+@admin.register(BookingDailyStats)
+class BookingDailyStatsAdmin(admin.ModelAdmin):
+    change_list_template = "admin/bookings/bookingdailystats/change_list.html"
+    list_display = [
+        "date",
+        "interviewer",
+        "bookings",
+        "completed",
+        "cancelled",
+        "revenue_cents",
+        "computed_at",
+    ]
+    list_select_related = ["interviewer__user"]
+    date_hierarchy = "date"
+    readonly_fields = [f.name for f in BookingDailyStats._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def changelist_view(self, request, extra_context=None):
+        response = super().changelist_view(request, extra_context)
+        try:
+            queryset = response.context_data["cl"].queryset
+        except (AttributeError, KeyError):
+            return response
+
+        # Revenue per day across the filtered interviewers, newest 60 days
+        chart = list(
+            queryset.order_by()
+            .values("date")
+            .annotate(bookings=Sum("bookings"), revenue_cents=Sum("revenue_cents"))
+            .order_by("-date")[:60]
+        )
+        chart.reverse()
+        response.context_data["chart"] = chart
+        response.context_data["chart_max"] = max(
+            (day["revenue_cents"] for day in chart), default=0
+        )
+        return response
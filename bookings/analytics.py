@@ -0,0 +1,152 @@
+"""Incremental booking analytics rollups."""
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, F, Max, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Floor, TruncDate
+from django.utils import timezone
+
+from interviewers.models import Interviewer
+
+from .models import Booking, BookingDailyStats
+
+# Re-scan this far behind the watermark so bookings committed while the
+# previous run was in flight are not missed.
+ROLLUP_OVERLAP = timedelta(minutes=5)
+
+PAID_STATUSES = [Booking.Status.CONFIRMED, Booking.Status.COMPLETED]
+
+
+def refresh_daily_stats(full=False):
+    """
+    Recompute the daily stats rows touched since the last run.
+
+    Finds the (interviewer, day) pairs of bookings updated after the
+    watermark, plus the days bookings were moved off or deleted from (see
+    mark_day_stale), re-aggregates just those days in one GROUP BY query
+    and upserts the results. With ``full=True`` every day is rebuilt.
+    Returns the number of rows written.
+    """
+    started_at = timezone.now()
+    bookings = Booking.objects.exclude(status=Booking.Status.PENDING)
+    stale = set(
+        BookingDailyStats.objects.filter(stale_since__isnull=False).values_list("interviewer_id", "date")
+    )
+    touched = set(stale)
+
+    if not full:
+        watermark = BookingDailyStats.objects.aggregate(Max("computed_at"))[
+            "computed_at__max"
+        ]
+        if watermark:
+            touched |= set(
+                Booking.objects.filter(updated_at__gte=watermark - ROLLUP_OVERLAP)
+                .annotate(date=TruncDate("scheduled_at"))
+                .values_list("interviewer_id", "date")
+                .distinct()
+            )
+            if not touched:
+                return 0
+            # Recompute a superset of the touched days; every row it yields
+            # is a complete, correct aggregate for its day.
+            bookings = bookings.filter(
+                interviewer_id__in={interviewer_id for interviewer_id, _ in touched},
+                scheduled_at__date__in={date for _, date in touched},
+            )
+
+    rows = (
+        bookings.annotate(date=TruncDate("scheduled_at"))
+        .values("interviewer_id", "date")
+        .annotate(
+            bookings=Count("id"),
+            confirmed=Count("id", filter=Q(status=Booking.Status.CONFIRMED)),
+            completed=Count("id", filter=Q(status=Booking.Status.COMPLETED)),
+            cancelled=Count("id", filter=Q(status=Booking.Status.CANCELLED)),
+            revenue_cents=Sum("amount_cents", filter=Q(status__in=PAID_STATUSES), default=0),
+        )
+        .order_by()
+    )
+
+    stats = [BookingDailyStats(computed_at=started_at, **row) for row in rows]
+
+    # Touched days left with only pending bookings are reset to zero
+    written = {(row.interviewer_id, row.date) for row in stats}
+    stats += [
+        BookingDailyStats(interviewer_id=interviewer_id, date=date, computed_at=started_at)
+        for interviewer_id, date in touched - written
+    ]
+
+    with transaction.atomic():
+        BookingDailyStats.objects.bulk_create(
+            stats,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=["interviewer", "date"],
+            update_fields=[
+                "bookings",
+                "confirmed",
+                "completed",
+                "cancelled",
+                "revenue_cents",
+                "computed_at",
+            ],
+        )
+        if stale:
+            # Marks made since the run began may belong to transactions
+            # this run couldn't see yet; they are recomputed again next time
+            BookingDailyStats.objects.filter(stale_since__lt=started_at - ROLLUP_OVERLAP).update(stale_since=None)
+    return len(stats)
+
+
+def mark_day_stale(interviewer_id, scheduled_at):
+    """
+    Have the next rollup recompute the day a booking was moved off or
+    deleted from. Its remaining bookings may not have changed, so the
+    watermark alone would never revisit it.
+    """
+    BookingDailyStats.objects.filter(
+        interviewer_id=interviewer_id, date=timezone.localdate(scheduled_at)
+    ).update(stale_since=timezone.now())
+
+
+def backfill_amounts(batch_size=1000):
+    """
+    Price bookings saved before amount_cents existed (left at 0) from the
+    interviewer's current rate, as Booking.calculate_amount_cents() does.
+    Their updated_at is bumped so the next rollup counts the revenue.
+    Returns the number of bookings updated.
+    """
+    rate = Subquery(Interviewer.objects.filter(pk=OuterRef("interviewer_id")).values("hourly_rate"))
+    updated = 0
+    last_pk = 0
+    while True:
+        # Walk by pk: a booking that still prices at 0 must not be picked again
+        batch = list(
+            Booking.objects.filter(amount_cents=0, pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not batch:
+            return updated
+        last_pk = batch[-1]
+        updated += Booking.objects.filter(pk__in=batch, amount_cents=0).update(
+            amount_cents=Floor(rate * F("duration_minutes") * 100 / 60),
+            updated_at=timezone.now(),
+        )
+
+
+def summarize(daily_stats):
+    """Total a queryset of daily stats rows into a single summary dict."""
+    totals = daily_stats.aggregate(
+        bookings=Sum("bookings", default=0),
+        completed=Sum("completed", default=0),
+        cancelled=Sum("cancelled", default=0),
+        revenue_cents=Sum("revenue_cents", default=0),
+    )
+    bookings = totals["bookings"]
+    totals["revenue"] = Decimal(totals["revenue_cents"]) / 100
+    totals["completion_rate"] = totals["completed"] / bookings if bookings else 0
+    totals["cancellation_rate"] = totals["cancelled"] / bookings if bookings else 0
+    return totals
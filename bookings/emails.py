@@ -1,9 +1,31 @@
 """Email notification functions for bookings."""
 
+import logging
+
 from django.conf import settings
 from django.core.mail import send_mail
 from django.template.loader import render_to_string
 
+from interview_service.metrics import external_call
+
+logger = logging.getLogger("bookings.emails")
+
+
+def _send_mail(**kwargs):
+    """
+    Send an email, logging a failure instead of raising it.
+
+    A booking must not fail because the mail server is down. The error is
+    caught here rather than with fail_silently so that external_call still
+    counts it.
+    """
+    try:
+        with external_call("smtp", "send_mail"):
+            send_mail(**kwargs)
+    except OSError:
+        # Includes smtplib.SMTPException
+        logger.exception("Could not send %r to %s", kwargs["subject"], kwargs["recipient_list"])
+
 
 def send_customer_confirmation(booking):
     """Send booking confirmation email to customer."""
@@ -29,13 +51,12 @@ We'll send you a calendar invite with the meeting link.
 Thank you for booking with 508.dev Interview Service!
     """
 
-    send_mail(
+    _send_mail(
         subject=subject,
         message=text_message.strip(),
         from_email=settings.DEFAULT_FROM_EMAIL,
         recipient_list=[booking.customer_email],
         html_message=html_message,
-        fail_silently=True,
     )
 
 
@@ -71,11 +92,10 @@ Additional Info:
 Log in to your dashboard to view more details and download their resume (if provided).
     """
 
-    send_mail(
+    _send_mail(
         subject=subject,
         message=text_message.strip(),
         from_email=settings.DEFAULT_FROM_EMAIL,
         recipient_list=[booking.interviewer.user.email],
         html_message=html_message,
-        fail_silently=True,
     )
@@ -0,0 +1,186 @@
+"""
+Live booking events, published with Postgres NOTIFY and streamed to
+browsers as server-sent events.
+
+publish_booking_event() sends a NOTIFY on BOOKING_CHANNEL from inside the
+transaction that changed the booking. Postgres delivers it only once that
+transaction commits, and to every worker, whichever one handled the webhook.
+
+Each ASGI worker process has one BookingEventHub. The hub holds a single
+LISTEN connection, outside the pool, and hands each event to the streams
+subscribed to that booking's interviewer or checkout session. A connected
+dashboard costs a queue, not a database connection.
+"""
+
+import asyncio
+import json
+import logging
+import weakref
+from collections import defaultdict
+from contextlib import asynccontextmanager
+
+import psycopg
+from django.core.handlers.asgi import ASGIRequest
+from django.db import connection, connections
+from django.http import HttpResponse, StreamingHttpResponse
+
+logger = logging.getLogger("bookings.events")
+
+BOOKING_CHANNEL = "booking_events"
+
+CONFIRMED = "confirmed"
+CANCELLED = "cancelled"
+RESCHEDULED = "rescheduled"
+
+# Comment lines keep idle streams open through nginx's proxy_read_timeout
+KEEPALIVE_SECONDS = 15
+RECONNECT_SECONDS = 5
+# Events a slow stream may fall behind by before newer ones are dropped
+QUEUE_SIZE = 100
+
+
+def publish_booking_event(booking, event):
+    """Tell every worker that `booking` was confirmed, cancelled or rescheduled."""
+    payload = json.dumps(
+        {
+            "event": event,
+            "booking": booking.pk,
+            "interviewer": booking.interviewer_id,
+            "checkout_session": booking.stripe_checkout_session_id,
+        }
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_notify(%s, %s)", [BOOKING_CHANNEL, payload])
+
+
+def interviewer_key(interviewer_id):
+    return ("interviewer", interviewer_id)
+
+
+def checkout_key(session_id):
+    return ("checkout", session_id)
+
+
+def _listen_params():
+    # The pool, cursor factory and adapters are for Django's sync connections
+    params = connections["default"].get_connection_params()
+    for key in ("cursor_factory", "context", "pool"):
+        params.pop(key, None)
+    return params
+
+
+class BookingEventHub:
+    """One LISTEN connection per event loop, fanned out to subscriber queues."""
+
+    def __init__(self):
+        self._subscribers = defaultdict(set)
+        self._listener = None
+        # Set while the LISTEN connection is up
+        self.listening = asyncio.Event()
+
+    @asynccontextmanager
+    async def subscribe(self, key):
+        """Yield a queue that receives the events for `key` while the block runs."""
+        queue = asyncio.Queue(QUEUE_SIZE)
+        self._subscribers[key].add(queue)
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        try:
+            yield queue
+        finally:
+            self._subscribers[key].discard(queue)
+            if not self._subscribers[key]:
+                del self._subscribers[key]
+
+    def dispatch(self, event):
+        for key in (interviewer_key(event.get("interviewer")), checkout_key(event.get("checkout_session"))):
+            for queue in self._subscribers.get(key, ()):
+                try:
+                    queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    logger.warning("Dropped a booking event for a slow stream")
+
+    async def _listen(self):
+        while True:
+            try:
+                conn = await psycopg.AsyncConnection.connect(**_listen_params(), autocommit=True)
+                async with conn:
+                    await conn.execute(f"LISTEN {BOOKING_CHANNEL}")
+                    self.listening.set()
+                    async for notify in conn.notifies():
+                        # One bad payload must not end the listener
+                        try:
+                            self.dispatch(json.loads(notify.payload))
+                        except Exception:
+                            logger.exception("Ignored booking event %r", notify.payload)
+            except psycopg.Error as e:
+                # Events sent while reconnecting are lost; pages show them on reload
+                logger.warning("Booking event listener disconnected: %s", e)
+            except Exception:
+                logger.exception("Booking event listener failed")
+            finally:
+                self.listening.clear()
+            await asyncio.sleep(RECONNECT_SECONDS)
+
+
+_hubs = weakref.WeakKeyDictionary()
+
+
+def get_hub():
+    """The hub of the running event loop (an ASGI worker has just one)."""
+    loop = asyncio.get_running_loop()
+    if loop not in _hubs:
+        _hubs[loop] = BookingEventHub()
+    return _hubs[loop]
+
+
+def sse_message(event, data):
+    """Format one server-sent event; `data` may span several lines."""
+    lines = "".join(f"data: {line}\n" for line in data.splitlines() or [""])
+    return f"event: {event}\n{lines}\n"
+
+
+async def event_stream(key, render, initial=None, once=False):
+    """
+    Stream the events for `key` as SSE, each turned into (event name, data)
+    by `await render(event)`; return None from it to skip an event.
+
+    `await initial()` may return a first message. It runs once the stream
+    is subscribed, so a change made just before cannot slip between the
+    two. With `once`, the stream ends after its first message.
+    """
+    async with get_hub().subscribe(key) as queue:
+        yield f"retry: {RECONNECT_SECONDS * 1000}\n\n"
+        message = await initial() if initial else None
+        if message is not None:
+            yield sse_message(*message)
+            if once:
+                return
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), KEEPALIVE_SECONDS)
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            message = await render(event)
+            if message is not None:
+                yield sse_message(*message)
+                if once:
+                    return
+
+
+def event_stream_response(request, key, render, initial=None, once=False):
+    """
+    An SSE response with the events for `key` (see event_stream).
+
+    Streams need an ASGI worker: a WSGI worker would hold a thread for
+    each open stream. Under WSGI the answer is 204, which tells
+    EventSource to stop reconnecting, and pages fall back to reloading.
+    """
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse(status=204)
+    response = StreamingHttpResponse(event_stream(key, render, initial, once), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Let nginx pass each event on as soon as it is written
+    response["X-Accel-Buffering"] = "no"
+    return response
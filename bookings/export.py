@@ -0,0 +1,78 @@
+"""Streaming CSV export of bookings."""
+
+import csv
+
+from django.http import StreamingHttpResponse
+
+EXPORT_CHUNK_SIZE = 2000
+
+
+def _dollars(cents):
+    return f"{cents // 100}.{cents % 100:02d}"
+
+
+def _isoformat(value):
+    return value.isoformat()
+
+
+# (CSV header, queryset lookup, formatter)
+EXPORT_COLUMNS = [
+    ("Booking ID", "id", None),
+    ("Scheduled At", "scheduled_at", _isoformat),
+    ("Duration (min)", "duration_minutes", None),
+    ("Status", "status", None),
+    ("Interviewer", "interviewer__user__username", None),
+    ("Customer Name", "customer_name", None),
+    ("Customer Email", "customer_email", None),
+    ("Amount (USD)", "amount_cents", _dollars),
+    ("Stripe Payment Intent", "stripe_payment_intent_id", None),
+    ("Created At", "created_at", _isoformat),
+]
+
+# Leading characters that make spreadsheet apps evaluate a cell as a formula
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class Echo:
+    """Pseudo-buffer that hands each written CSV line straight back."""
+
+    def write(self, value):
+        return value
+
+
+def _format_row(row):
+    cells = []
+    for (_, _, formatter), value in zip(EXPORT_COLUMNS, row):
+        if formatter is not None:
+            value = formatter(value)
+        if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+            value = f"'{value}"
+        cells.append(value)
+    return cells
+
+
+def iter_booking_rows(queryset):
+    """Yield CSV lines for `queryset`, reading it through a server-side cursor."""
+    writer = csv.writer(Echo())
+    yield writer.writerow([header for header, _, _ in EXPORT_COLUMNS])
+
+    rows = (
+        queryset.order_by("-scheduled_at", "-id")
+        .values_list(*[lookup for _, lookup, _ in EXPORT_COLUMNS])
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    for row in rows:
+        yield writer.writerow(_format_row(row))
+
+
+def stream_bookings_csv(queryset, filename):
+    """Return a StreamingHttpResponse that exports `queryset` as CSV."""
+    return StreamingHttpResponse(
+        iter_booking_rows(queryset),
+        content_type="text/csv",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            # Let nginx pass rows through as they are produced
+            "X-Accel-Buffering": "no",
+        },
+    )
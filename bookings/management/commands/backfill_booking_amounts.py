@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from bookings.analytics import backfill_amounts, refresh_daily_stats
+
+
+class Command(BaseCommand):
+    help = "Price bookings with no recorded amount from their interviewer's current rate."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Bookings updated per statement.",
+        )
+
+    def handle(self, *args, batch_size=1000, **options):
+        count = backfill_amounts(batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(f"Priced {count} bookings."))
+        if count:
+            rows = refresh_daily_stats()
+            self.stdout.write(self.style.SUCCESS(f"Refreshed {rows} daily stats rows."))
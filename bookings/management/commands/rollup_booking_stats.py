@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from bookings.analytics import refresh_daily_stats
+
+
+class Command(BaseCommand):
+    help = "Refresh the per-interviewer daily booking stats rollup."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Rebuild every day instead of only days touched since the last run.",
+        )
+
+    def handle(self, *args, full=False, **options):
+        count = refresh_daily_stats(full=full)
+        self.stdout.write(self.style.SUCCESS(f"Refreshed {count} daily stats rows."))
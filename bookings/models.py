@@ -1,4 +1,8 @@
+from decimal import Decimal
+
+from django.contrib.postgres.indexes import OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 from interviewers.models import Interviewer
 
@@ -63,18 +67,133 @@ class Booking(models.Model):
         blank=True,
         help_text="Cal.com booking UID",
     )
+    amount_cents = models.PositiveIntegerField(
+        default=0,
+        help_text="Price in cents, snapshotted from the interviewer's rate at creation",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-scheduled_at"]
+        indexes = [
+            # Keyset pagination of an interviewer's booking history
+            models.Index(
+                fields=["interviewer", "-scheduled_at", "-id"],
+                name="booking_history_idx",
+            ),
+            models.Index(
+                fields=["interviewer", "status", "-scheduled_at", "-id"],
+                name="booking_history_status_idx",
+            ),
+            # Incremental analytics rollups scan recently updated bookings
+            models.Index(fields=["updated_at"], name="booking_updated_idx"),
+            # Dashboard ETags: an index-only scan of one interviewer's bookings
+            models.Index(
+                fields=["interviewer", "updated_at", "scheduled_at"],
+                name="booking_freshness_idx",
+            ),
+            # The success page's status stream looks bookings up by session
+            models.Index(
+                fields=["stripe_checkout_session_id"],
+                name="booking_checkout_session_idx",
+            ),
+            # Admin date hierarchy and default ordering
+            models.Index(fields=["-scheduled_at"], name="booking_scheduled_idx"),
+            # Admin search: case-insensitive prefix and exact lookups
+            models.Index(
+                OpClass(Upper("customer_email"), name="text_pattern_ops"),
+                name="booking_email_search_idx",
+            ),
+            models.Index(
+                OpClass(Upper("customer_name"), name="text_pattern_ops"),
+                name="booking_name_search_idx",
+            ),
+            models.Index(
+                Upper("stripe_checkout_session_id"),
+                name="booking_checkout_search_idx",
+            ),
+            models.Index(
+                Upper("stripe_payment_intent_id"),
+                name="booking_payment_search_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Booking with {self.interviewer} on {self.scheduled_at}"
 
+    def save(self, *args, **kwargs):
+        if self._state.adding and not self.amount_cents:
+            self.amount_cents = self.calculate_amount_cents()
+        super().save(*args, **kwargs)
+
+    def calculate_amount_cents(self):
+        """Calculate the amount in cents from the interviewer's current rate."""
+        hourly_rate = Decimal(self.interviewer.hourly_rate)
+        return int(hourly_rate * self.duration_minutes * 100 / 60)
+
+
+class BookingDailyStats(models.Model):
+    """
+    Per-interviewer, per-day booking rollup.
+
+    Maintained incrementally by the ``rollup_booking_stats`` management
+    command so analytics read O(days) rows instead of scanning bookings.
+    Pending bookings (unpaid checkouts) are not counted.
+    """
+
+    interviewer = models.ForeignKey(
+        Interviewer,
+        on_delete=models.CASCADE,
+        related_name="daily_stats",
+    )
+    date = models.DateField(help_text="Day the sessions were scheduled for")
+    bookings = models.PositiveIntegerField(default=0)
+    confirmed = models.PositiveIntegerField(default=0)
+    completed = models.PositiveIntegerField(default=0)
+    cancelled = models.PositiveIntegerField(default=0)
+    revenue_cents = models.PositiveBigIntegerField(
+        default=0,
+        help_text="Revenue from confirmed and completed bookings",
+    )
+    computed_at = models.DateTimeField(
+        help_text="Start of the rollup run that last refreshed this row",
+    )
+    stale_since = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When a booking was moved off or deleted from this day; cleared by the rollup",
+    )
+
+    class Meta:
+        verbose_name_plural = "booking daily stats"
+        ordering = ["-date"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["interviewer", "date"],
+                name="unique_interviewer_daily_stats",
+            ),
+        ]
+        indexes = [
+            # The rollup's lookup of days to recompute
+            models.Index(
+                fields=["stale_since"],
+                condition=models.Q(stale_since__isnull=False),
+                name="daily_stats_stale_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.interviewer} on {self.date}"
+
+    @property
+    def revenue(self):
+        return Decimal(self.revenue_cents) / 100
+
+    @property
+    def completion_rate(self):
+        return self.completed / self.bookings if self.bookings else 0
+
     @property
-    def amount_cents(self):
-        """Calculate the amount in cents for Stripe."""
-        hourly_rate = self.interviewer.hourly_rate
-        hours = self.duration_minutes / 60
-        return int(hourly_rate * hours * 100)
+    def cancellation_rate(self):
+        return self.cancelled / self.bookings if self.bookings else 0
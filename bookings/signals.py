@@ -0,0 +1,35 @@
+"""Keep the booking analytics rollup in step with moved and deleted bookings."""
+
+from django.db.models.signals import post_delete, pre_save
+from django.dispatch import receiver
+
+from interview_service.db_router import PRIMARY
+from interviewers.models import Interviewer
+
+from .analytics import mark_day_stale
+from .models import Booking
+
+
+@receiver(pre_save, sender=Booking)
+def booking_saving(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and not {"interviewer", "scheduled_at"} & set(update_fields):
+        return
+    # From the primary: the row this save replaces, not a replica's copy
+    previous = (
+        Booking.objects.using(PRIMARY)
+        .filter(pk=instance.pk)
+        .values_list("interviewer_id", "scheduled_at")
+        .first()
+    )
+    if previous is not None and previous != (instance.interviewer_id, instance.scheduled_at):
+        mark_day_stale(*previous)
+
+
+@receiver(post_delete, sender=Booking)
+def booking_deleted(sender, instance, origin=None, **kwargs):
+    # Deleting an interviewer deletes their rollup rows too
+    if isinstance(origin, Interviewer):
+        return
+    mark_day_stale(instance.interviewer_id, instance.scheduled_at)
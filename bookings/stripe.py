@@ -1,12 +1,25 @@
 """Stripe checkout session management."""
 
-import stripe
 from django.conf import settings
 from django.urls import reverse
 
-stripe.api_key = settings.STRIPE_SECRET_KEY
+from interview_service.metrics import external_call
 
 
+def stripe_client():
+    """
+    Return the configured Stripe SDK module.
+
+    The SDK takes most of a second to import, so it is loaded on first use
+    rather than by every worker and management command at startup.
+    """
+    import stripe
+
+    stripe.api_key = settings.STRIPE_SECRET_KEY
+    return stripe
+
+
+@external_call("stripe", "checkout.session.create")
 def create_checkout_session(booking, request):
     """
     Create a Stripe checkout session for a booking.
@@ -20,7 +33,7 @@ def create_checkout_session(booking, request):
         reverse("bookings:cancel") + f"?booking_id={booking.id}"
     )
 
-    session = stripe.checkout.Session.create(
+    session = stripe_client().checkout.Session.create(
         payment_method_types=["card"],
         line_items=[
             {
@@ -48,6 +61,7 @@ def create_checkout_session(booking, request):
     return session
 
 
+@external_call("stripe", "checkout.session.retrieve")
 def retrieve_checkout_session(session_id):
     """Retrieve a Stripe checkout session by ID."""
-    return stripe.checkout.Session.retrieve(session_id)
+    return stripe_client().checkout.Session.retrieve(session_id)
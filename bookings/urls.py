@@ -9,6 +9,7 @@ urlpatterns = [
     path("<int:interviewer_id>/form/", views.booking_form, name="form"),
     path("<int:interviewer_id>/create/", views.create_booking, name="create"),
     path("success/", views.checkout_success, name="success"),
+    path("success/status/", views.checkout_status, name="checkout_status"),
     path("cancel/", views.checkout_cancel, name="cancel"),
     path("webhook/stripe/", webhooks.stripe_webhook, name="stripe_webhook"),
 ]
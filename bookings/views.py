@@ -2,14 +2,24 @@ from datetime import datetime
 
 from django.conf import settings
 from django.contrib import messages
+from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect, render
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.utils.http import urlencode
 from django.views.decorators.http import require_POST
 
+from interview_service.ratelimit import rate_limit
 from interviewers.models import Interviewer
 
+from .events import CANCELLED, CONFIRMED, checkout_key, event_stream_response, publish_booking_event
 from .models import Booking
 from .stripe import create_checkout_session, retrieve_checkout_session
 
+# Checkout outcomes the success page shows in place of "Payment Received"
+FINAL_CHECKOUT_STATUSES = {Booking.Status.CONFIRMED, Booking.Status.CANCELLED}
+EVENT_STATUSES = {CONFIRMED: Booking.Status.CONFIRMED, CANCELLED: Booking.Status.CANCELLED}
+
 
 def booking_start(request, interviewer_id):
     """Show cal.com embed for selecting a time slot."""
@@ -52,6 +62,7 @@ def booking_form(request, interviewer_id):
 
 
 @require_POST
+@rate_limit("booking", email_field="customer_email")
 def create_booking(request, interviewer_id):
     """Create a booking and redirect to Stripe checkout."""
     interviewer = get_object_or_404(Interviewer, pk=interviewer_id, is_active=True)
@@ -109,16 +120,45 @@ def checkout_success(request):
 
         if booking_id:
             booking = Booking.objects.get(id=booking_id)
-            # The webhook will handle status update, but we can show the booking info
+            # The webhook confirms the booking; until it lands the page
+            # subscribes to the status stream
+            confirmed = booking.status == Booking.Status.CONFIRMED
+            cancelled = booking.status == Booking.Status.CANCELLED
+            status_url = None
+            if booking.status not in FINAL_CHECKOUT_STATUSES:
+                status_url = f"{reverse('bookings:checkout_status')}?{urlencode({'session_id': session_id})}"
             return render(
                 request,
                 "bookings/success.html",
-                {"booking": booking},
+                {"booking": booking, "confirmed": confirmed, "cancelled": cancelled, "status_url": status_url},
             )
     except Exception:
         pass
 
-    return render(request, "bookings/success.html", {"booking": None})
+    return render(request, "bookings/success.html", {"booking": None, "confirmed": True})
+
+
+async def checkout_status(request):
+    """Stream the checkout's booking status to the success page until it is confirmed or cancelled."""
+    session_id = request.GET.get("session_id", "")
+    bookings = Booking.objects.filter(stripe_checkout_session_id=session_id).exclude(stripe_checkout_session_id="")
+    if not await bookings.aexists():
+        raise Http404("Unknown checkout session")
+
+    def status_message(status):
+        if status not in FINAL_CHECKOUT_STATUSES:
+            return None
+        context = {"confirmed": status == Booking.Status.CONFIRMED, "cancelled": status == Booking.Status.CANCELLED}
+        return "status", render_to_string("bookings/partials/checkout_status.html", context)
+
+    async def render_event(event):
+        return status_message(EVENT_STATUSES.get(event["event"]))
+
+    async def current_status():
+        # The webhook may have landed before this stream subscribed
+        return status_message(await bookings.values_list("status", flat=True).afirst())
+
+    return event_stream_response(request, checkout_key(session_id), render_event, current_status, once=True)
 
 
 def checkout_cancel(request):
@@ -130,6 +170,7 @@ def checkout_cancel(request):
             booking = Booking.objects.get(id=booking_id, status=Booking.Status.PENDING)
             booking.status = Booking.Status.CANCELLED
             booking.save()
+            publish_booking_event(booking, CANCELLED)
         except Booking.DoesNotExist:
             pass
 
@@ -1,13 +1,18 @@
 """Stripe webhook handlers."""
 
-import stripe
+import time
+
 from django.conf import settings
 from django.http import HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 
+from interview_service.metrics import WEBHOOK_LAG
+
 from .emails import send_customer_confirmation, send_interviewer_notification
+from .events import CONFIRMED, publish_booking_event
 from .models import Booking
+from .stripe import stripe_client
 
 
 @csrf_exempt
@@ -16,6 +21,7 @@ def stripe_webhook(request):
     """Handle Stripe webhook events."""
     payload = request.body
     sig_header = request.META.get("HTTP_STRIPE_SIGNATURE", "")
+    stripe = stripe_client()
 
     try:
         event = stripe.Webhook.construct_event(
@@ -31,6 +37,10 @@ def stripe_webhook(request):
         session = event["data"]["object"]
         handle_checkout_completed(session)
 
+    # Time from Stripe creating the event until we are done with it
+    if "created" in event:
+        WEBHOOK_LAG.labels(event["type"]).observe(max(0, time.time() - event["created"]))
+
     return HttpResponse(status=200)
 
 
@@ -50,6 +60,7 @@ def handle_checkout_completed(session):
     booking.status = Booking.Status.CONFIRMED
     booking.stripe_payment_intent_id = session.get("payment_intent", "")
     booking.save()
+    publish_booking_event(booking, CONFIRMED)
 
     # Send confirmation emails
     send_customer_confirmation(booking)
@@ -2,10 +2,17 @@
 
 import pytest
 from django.contrib.auth.models import User
+from django.core.cache import cache
 
 from tests.factories import BookingFactory, InterviewerFactory
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache; the catalog caches query results."""
+    cache.clear()
+
+
 @pytest.fixture
 def user(db):
     """Create a test user."""
@@ -0,0 +1,52 @@
+"""Keyset (seek) pagination helpers for the dashboard."""
+
+from datetime import datetime
+
+from django.db.models import Q
+from django.utils.encoding import force_str
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+
+
+def encode_cursor(value, pk):
+    """Encode a (datetime, pk) position as an opaque URL-safe cursor."""
+    return urlsafe_base64_encode(f"{value.isoformat()}|{pk}".encode())
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Returns a (datetime, pk) tuple, or None if the cursor is malformed.
+    """
+    try:
+        value, pk = force_str(urlsafe_base64_decode(cursor)).split("|")
+        return datetime.fromisoformat(value), int(pk)
+    except (TypeError, ValueError):
+        return None
+
+
+def keyset_page(queryset, field, cursor=None, page_size=20):
+    """
+    Return one page of `queryset` ordered by (`field`, pk) descending.
+
+    Seeks past `cursor` with an indexed range predicate instead of OFFSET,
+    so every page costs the same regardless of how deep it is.
+    Returns a (rows, next_cursor) tuple; next_cursor is None on the last page.
+    """
+    queryset = queryset.order_by(f"-{field}", "-pk")
+
+    position = decode_cursor(cursor) if cursor else None
+    if position:
+        value, pk = position
+        queryset = queryset.filter(
+            Q(**{f"{field}__lt": value}) | Q(**{field: value, "pk__lt": pk})
+        )
+
+    rows = list(queryset[: page_size + 1])
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, field), last.pk)
+
+    return rows, next_cursor
@@ -6,7 +6,11 @@ app_name = "dashboard"
 
 urlpatterns = [
     path("", views.dashboard_home, name="home"),
+    path("events/", views.booking_events, name="booking_events"),
+    path("earnings/", views.earnings, name="earnings"),
     path("profile/", views.profile_edit, name="profile"),
+    path("bookings/", views.booking_history, name="booking_history"),
+    path("bookings/export/", views.booking_export, name="booking_export"),
     path("bookings/<int:pk>/", views.booking_detail, name="booking_detail"),
     path("bookings/<int:pk>/complete/", views.booking_complete, name="booking_complete"),
 ]
@@ -1,13 +1,64 @@
+from datetime import timedelta
+
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.db.models import Count, Max, Min, Q
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
+from django.template.loader import render_to_string
 from django.utils import timezone
+from django.views.decorators.cache import cache_control
 
+from bookings.analytics import summarize
+from bookings.events import event_stream_response, interviewer_key
+from bookings.export import stream_bookings_csv
 from bookings.models import Booking
-from interviewers.models import InterviewSubject, Technology
+from interview_service.decorators import conditional_page
+from interviewers.models import Interviewer
+from interviewers.taxonomy import get_taxonomy
+
+from .pagination import keyset_page
+
+BOOKING_HISTORY_PAGE_SIZE = 20
+EARNINGS_PERIODS = [30, 90, 365]
+UPCOMING_STATUSES = [Booking.Status.CONFIRMED, Booking.Status.PENDING]
+UPCOMING_LIMIT = 10
+
+
+def home_validators(request):
+    """
+    Everything the dashboard home shows, summarised in one query: the
+    profile, the latest booking change, and the next upcoming booking, so
+    the page also changes when that one moves into the past.
+    """
+    state = (
+        Interviewer.objects.filter(user=request.user)
+        .values("pk", "updated_at")
+        .annotate(
+            bookings_updated=Max("bookings__updated_at"),
+            booking_count=Count("bookings"),
+            next_booking=Min("bookings__scheduled_at", filter=Q(bookings__scheduled_at__gte=timezone.now())),
+        )
+        .first()
+    )
+    if state is None:
+        # No profile: the view redirects
+        return None, None
+    return (tuple(state.values()), request.user.get_full_name()), None
+
+
+def upcoming_bookings_for(interviewer_id):
+    """The next UPCOMING_LIMIT bookings on the dashboard home, soonest first."""
+    return Booking.objects.filter(
+        interviewer_id=interviewer_id,
+        scheduled_at__gte=timezone.now(),
+        status__in=UPCOMING_STATUSES,
+    ).order_by("scheduled_at")[:UPCOMING_LIMIT]
 
 
 @login_required
+@cache_control(private=True, no_cache=True)
+@conditional_page(home_validators)
 def dashboard_home(request):
     """Dashboard home with upcoming interviews."""
     # Check if user is an interviewer
@@ -16,11 +67,7 @@ def dashboard_home(request):
         return redirect("pages:home")
 
     interviewer = request.user.interviewer
-    upcoming_bookings = Booking.objects.filter(
-        interviewer=interviewer,
-        scheduled_at__gte=timezone.now(),
-        status__in=[Booking.Status.CONFIRMED, Booking.Status.PENDING],
-    ).order_by("scheduled_at")[:10]
+    upcoming_bookings = upcoming_bookings_for(interviewer.pk)
 
     past_bookings = Booking.objects.filter(
         interviewer=interviewer,
@@ -38,6 +85,133 @@ def dashboard_home(request):
     )
 
 
+@login_required
+async def booking_events(request):
+    """Stream the interviewer's booking changes to the dashboard home as HTMX swaps."""
+    user = await request.auser()
+    interviewer_id = await Interviewer.objects.filter(user=user).values_list("pk", flat=True).afirst()
+    if interviewer_id is None:
+        return HttpResponse(status=204)
+
+    async def render_event(event):
+        # Re-render the whole list: the changed booking may belong anywhere
+        # in it, or leave it empty
+        upcoming = [booking async for booking in upcoming_bookings_for(interviewer_id)]
+        html = render_to_string(
+            "dashboard/partials/upcoming_bookings.html", {"upcoming_bookings": upcoming, "oob": True}
+        )
+        return "booking", html
+
+    return event_stream_response(request, interviewer_key(interviewer_id), render_event)
+
+
+@login_required
+def booking_history(request):
+    """Full booking history with status filters and keyset pagination."""
+    if not hasattr(request.user, "interviewer"):
+        messages.error(request, "You don't have an interviewer profile.")
+        return redirect("pages:home")
+
+    interviewer = request.user.interviewer
+    bookings = Booking.objects.filter(interviewer=interviewer)
+
+    status = request.GET.get("status", "")
+    if status not in Booking.Status.values:
+        status = ""
+    if status:
+        bookings = bookings.filter(status=status)
+
+    page, next_cursor = keyset_page(
+        bookings.only(
+            "id",
+            "customer_name",
+            "scheduled_at",
+            "duration_minutes",
+            "status",
+            "interview_focus",
+        ),
+        "scheduled_at",
+        cursor=request.GET.get("cursor"),
+        page_size=BOOKING_HISTORY_PAGE_SIZE,
+    )
+
+    context = {
+        "bookings": page,
+        "next_cursor": next_cursor,
+        "selected_status": status,
+    }
+
+    # For HTMX requests (filter change or "load more"), return just the rows
+    if request.headers.get("HX-Request"):
+        return render(request, "dashboard/partials/booking_rows.html", context)
+
+    # All per-status counts in a single aggregate query
+    counts = Booking.objects.filter(interviewer=interviewer).aggregate(
+        total=Count("id"),
+        **{
+            value: Count("id", filter=Q(status=value))
+            for value in Booking.Status.values
+        },
+    )
+    context["interviewer"] = interviewer
+    context["total_count"] = counts["total"]
+    context["status_counts"] = [
+        (value, label, counts[value]) for value, label in Booking.Status.choices
+    ]
+
+    return render(request, "dashboard/bookings.html", context)
+
+
+@login_required
+def booking_export(request):
+    """Stream the interviewer's bookings as CSV, honouring the status filter."""
+    if not hasattr(request.user, "interviewer"):
+        messages.error(request, "You don't have an interviewer profile.")
+        return redirect("pages:home")
+
+    bookings = Booking.objects.filter(interviewer=request.user.interviewer)
+    status = request.GET.get("status", "")
+    if status in Booking.Status.values:
+        bookings = bookings.filter(status=status)
+
+    return stream_bookings_csv(
+        bookings, f"bookings-{timezone.localdate().isoformat()}.csv"
+    )
+
+
+@login_required
+def earnings(request):
+    """Earnings and booking analytics from the daily stats rollup."""
+    if not hasattr(request.user, "interviewer"):
+        messages.error(request, "You don't have an interviewer profile.")
+        return redirect("pages:home")
+
+    interviewer = request.user.interviewer
+    try:
+        days = int(request.GET.get("days", EARNINGS_PERIODS[0]))
+    except ValueError:
+        days = EARNINGS_PERIODS[0]
+    if days not in EARNINGS_PERIODS:
+        days = EARNINGS_PERIODS[0]
+
+    since = timezone.localdate() - timedelta(days=days)
+    daily_stats = interviewer.daily_stats.filter(date__gt=since)
+    rows = list(daily_stats)
+
+    return render(
+        request,
+        "dashboard/earnings.html",
+        {
+            "interviewer": interviewer,
+            "daily_stats": rows,
+            "max_revenue_cents": max((row.revenue_cents for row in rows), default=0),
+            "totals": summarize(daily_stats),
+            "days": days,
+            "periods": EARNINGS_PERIODS,
+        },
+    )
+
+
 @login_required
 def profile_edit(request):
     """Edit interviewer profile."""
@@ -46,8 +220,9 @@ def profile_edit(request):
         return redirect("pages:home")
 
     interviewer = request.user.interviewer
-    technologies = Technology.objects.all()
-    subjects = InterviewSubject.objects.all()
+    taxonomy = get_taxonomy()
+    technologies = taxonomy.technologies
+    subjects = taxonomy.subjects
 
     if request.method == "POST":
         # Update profile fields
@@ -61,11 +236,11 @@ def profile_edit(request):
 
         # Update technologies
         tech_ids = request.POST.getlist("technologies")
-        interviewer.technologies.set(Technology.objects.filter(id__in=tech_ids))
+        interviewer.technologies.set(taxonomy.known_technology_ids(tech_ids))
 
         # Update subjects
         subject_ids = request.POST.getlist("subjects")
-        interviewer.subjects.set(InterviewSubject.objects.filter(id__in=subject_ids))
+        interviewer.subjects.set(taxonomy.known_subject_ids(subject_ids))
 
         interviewer.save()
         messages.success(request, "Profile updated successfully!")
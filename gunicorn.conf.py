@@ -0,0 +1,99 @@
+"""
+Gunicorn configuration, loaded automatically when gunicorn starts in the project root.
+
+Every setting can be overridden from the environment:
+
+    GUNICORN_WORKER_CLASS  gthread (default), uvicorn, or a worker class path
+    GUNICORN_WORKERS       default: 2 x CPUs + 1 (gthread), CPUs + 1 (uvicorn)
+    GUNICORN_THREADS       threads per gthread worker (default 4)
+    GUNICORN_MAX_REQUESTS  recycle a worker after this many requests (default 2000, 0 = never)
+    GUNICORN_PRELOAD       load and warm the app once in the master (default true)
+    GUNICORN_BIND, GUNICORN_TIMEOUT, GUNICORN_KEEPALIVE
+"""
+
+import os
+import shutil
+
+# Workers write Prometheus samples here and /metrics merges them. Must be
+# set, and the directory must exist, before anything imports
+# prometheus_client: with preload the app (and its metrics) is loaded before
+# on_starting runs. Files left over from a previous run would be merged into
+# this one.
+PROMETHEUS_MULTIPROC_DIR = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus-multiproc"
+)
+shutil.rmtree(PROMETHEUS_MULTIPROC_DIR, ignore_errors=True)
+os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+
+WORKER_CLASSES = {
+    "gthread": "gthread",
+    "sync": "sync",
+    "uvicorn": "uvicorn_worker.UvicornWorker",
+}
+
+
+def cpu_count():
+    """CPUs this container may actually use: affinity, capped by a cgroup v2 quota."""
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+    except (OSError, ValueError):
+        return cpus
+    if quota == "max":
+        return cpus
+    return max(1, min(cpus, int(int(quota) / int(period))))
+
+
+_worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+worker_class = WORKER_CLASSES.get(_worker_class, _worker_class)
+_asgi = "uvicorn" in worker_class.lower()
+
+wsgi_app = "interview_service.asgi:application" if _asgi else "interview_service.wsgi:application"
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+# Threads overlap database, Stripe and S3 waits; an ASGI worker has its own
+# event loop (sync views still run in its thread pool)
+workers = int(os.environ.get("GUNICORN_WORKERS", cpu_count() + 1 if _asgi else 2 * cpu_count() + 1))
+threads = int(os.environ.get("GUNICORN_THREADS", "4"))
+
+# Recycle workers to cap slow memory growth; jitter keeps them from all
+# restarting at the same moment
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = max_requests // 10
+
+preload_app = os.environ.get("GUNICORN_PRELOAD", "true").lower() == "true"
+
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = 30
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", "5"))
+# Worker heartbeats on tmpfs; Docker's overlay filesystem can stall them
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG")
+errorlog = "-"
+
+
+def on_starting(server):
+    if server.cfg.preload_app:
+        # The app is already loaded; build the caches every worker will
+        # inherit. No database connections may cross the fork.
+        from interview_service.warmup import warm_up
+
+        elapsed, templates = warm_up(databases=False)
+        server.log.info("Warmed up master in %.0fms (%d templates)", elapsed, templates)
+
+
+def post_worker_init(worker):
+    # Runs before the worker accepts connections; with preload only the
+    # database check is left to do
+    from interview_service.warmup import warm_up
+
+    elapsed, templates = warm_up()
+    worker.log.info("Warmed up worker in %.0fms (%d templates)", elapsed, templates)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,40 @@
+"""Cache backends that count hits and misses for the cache_requests_total metric."""
+
+from django.core.cache.backends import locmem, redis
+
+from .metrics import record_cache_lookups
+
+_MISSING = object()
+
+
+class InstrumentedCacheMixin:
+    """
+    Count get() hits and misses.
+
+    Backends are not told their alias, so the metric label comes from an
+    optional METRICS_NAME key in the CACHES entry (default: "default").
+    """
+
+    def __init__(self, location, params):
+        super().__init__(location, params)
+        self.metrics_name = params.get("METRICS_NAME", "default")
+
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version)
+        hit = value is not _MISSING
+        record_cache_lookups(self.metrics_name, int(hit), int(not hit))
+        return value if hit else default
+
+
+class LocMemCache(InstrumentedCacheMixin, locmem.LocMemCache):
+    # The inherited get_many() goes through get(), so it is already counted
+    pass
+
+
+class RedisCache(InstrumentedCacheMixin, redis.RedisCache):
+    def get_many(self, keys, version=None):
+        # One MGET that bypasses get()
+        keys = list(keys)
+        found = super().get_many(keys, version)
+        record_cache_lookups(self.metrics_name, len(found), len(keys) - len(found))
+        return found
@@ -0,0 +1,100 @@
+"""
+Send reads to Postgres replicas and writes to the primary.
+
+Replicas are the entries in DATABASES whose TEST MIRROR is "default" (see
+`replica_databases`). Only reads made while handling a GET or HEAD request go
+to a replica; everything else - unsafe requests, reads after a write in the
+same request, management commands, tests - uses the primary.
+
+Replicas lag the primary slightly. ReplicaRoutingMiddleware sets a cookie
+after any request that wrote to the database, and requests carrying it read
+from the primary for DB_REPLICA_PIN_SECONDS, so people see their own
+changes (a profile edit, a new booking) straight away.
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.conf import settings
+
+PRIMARY = "default"
+
+# Apps whose rows must never be read stale: a session written on login has
+# to be there on the very next request
+PRIMARY_ONLY_APPS = {"sessions"}
+
+
+@dataclass
+class RoutingState:
+    use_primary: bool
+    wrote: bool = False
+
+
+# No state outside a request: every query goes to the primary
+_state = ContextVar("db_routing_state", default=None)
+
+
+@contextmanager
+def route_reads(use_primary):
+    """Route reads for the enclosed block; yields the state the router updates."""
+    state = RoutingState(use_primary)
+    token = _state.set(state)
+    try:
+        yield state
+    finally:
+        _state.reset(token)
+
+
+def replica_aliases():
+    return [
+        alias
+        for alias, config in settings.DATABASES.items()
+        if config.get("TEST", {}).get("MIRROR") == PRIMARY
+    ]
+
+
+def replica_databases(primary, hosts):
+    """
+    DATABASES entries for read replicas of `primary`, one per "host[:port]".
+
+    Replicas share the primary's credentials and pool settings. Under test
+    they mirror the primary instead of getting a test database of their own.
+    """
+    replicas = {}
+    for number, address in enumerate(hosts, start=1):
+        host, _, port = address.partition(":")
+        replicas[f"replica_{number}"] = {
+            **primary,
+            "HOST": host,
+            "PORT": port or primary.get("PORT", "5432"),
+            "TEST": {"MIRROR": PRIMARY},
+        }
+    return replicas
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or state.use_primary or model._meta.app_label in PRIMARY_ONLY_APPS:
+            return PRIMARY
+        replicas = replica_aliases()
+        return random.choice(replicas) if replicas else PRIMARY
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            # Later reads in this request must see the write
+            state.use_primary = True
+            state.wrote = True
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in replica_aliases():
+            return False
+        return None
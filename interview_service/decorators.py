@@ -0,0 +1,82 @@
+"""View decorators shared by the apps."""
+
+from functools import wraps
+from hashlib import md5
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+
+
+def public_page(view):
+    """
+    Serve a catalog page to anonymous visitors without touching the session.
+
+    A visitor without a session cookie can't be logged in, so `request.user`
+    is set to AnonymousUser up front. The page then renders without loading
+    the session or a CSRF token. The response has no Set-Cookie and no Vary:
+    Cookie, and shared caches (nginx) may keep it for
+    PUBLIC_PAGE_CACHE_SECONDS. Browsers always revalidate it, so nobody sees
+    a stale logged-out navbar after logging in.
+
+    Visitors with a session get the normal page, marked private. A 304 for
+    an anonymous visitor is public too, so nginx can revalidate its copy.
+    """
+
+    @wraps(view)
+    def wrapped(request, *args, **kwargs):
+        if settings.SESSION_COOKIE_NAME in request.COOKIES:
+            response = view(request, *args, **kwargs)
+            patch_cache_control(response, private=True)
+            return response
+
+        request.user = AnonymousUser()
+        response = view(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            patch_cache_control(
+                response, public=True, max_age=0, s_maxage=settings.PUBLIC_PAGE_CACHE_SECONDS
+            )
+        return response
+
+    return wrapped
+
+
+def conditional_page(validators):
+    """
+    Answer repeat requests with 304 Not Modified without rendering the page.
+
+    `validators(request, *args, **kwargs)` takes the view's arguments and
+    returns `(parts, last_modified)`: values that change whenever the page
+    would, and the time of the last change. Either may be None; with no
+    parts the view runs as usual. It is called once per request, so it
+    should cost no more than one indexed query.
+
+    The ETag also covers what the page shows about the visitor: the HTMX
+    partial or the full page, and for logged-in users who they are and the
+    CSRF token rendered into it.
+    """
+
+    def get_validators(request, *args, **kwargs):
+        if not hasattr(request, "_page_validators"):
+            request._page_validators = validators(request, *args, **kwargs)
+        return request._page_validators
+
+    def etag(request, *args, **kwargs):
+        parts, _ = get_validators(request, *args, **kwargs)
+        if parts is None:
+            return None
+        if request.user.is_authenticated:
+            if "CSRF_COOKIE" not in request.META:
+                # This render issues the token; the next request can match
+                return None
+            viewer = (request.user.pk, request.META["CSRF_COOKIE"])
+        else:
+            viewer = "anonymous"
+        key = repr((parts, request.headers.get("HX-Request", ""), viewer))
+        return md5(key.encode(), usedforsecurity=False).hexdigest()
+
+    def last_modified(request, *args, **kwargs):
+        return get_validators(request, *args, **kwargs)[1]
+
+    return condition(etag_func=etag, last_modified_func=last_modified)
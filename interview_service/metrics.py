@@ -0,0 +1,241 @@
+"""
+Prometheus metrics and the /metrics endpoint.
+
+Under gunicorn every worker process records into its own files in
+PROMETHEUS_MULTIPROC_DIR (set up by gunicorn.conf.py) and /metrics merges
+them, so a scrape sees the whole server no matter which worker answers it.
+Without that variable (runserver, tests) the default in-process registry
+is used.
+"""
+
+import os
+from contextlib import contextmanager
+from ipaddress import ip_address, ip_network
+from time import perf_counter
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from .timing import measure
+
+# Page latency from a few ms (cached partials) up to gunicorn's timeout
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250, 500)
+# Stripe retries and delivers late events for up to three days
+WEBHOOK_LAG_BUCKETS = (1, 5, 15, 60, 300, 900, 3600, 6 * 3600, 24 * 3600, 72 * 3600)
+
+REQUEST_LATENCY = Histogram(
+    "django_request_duration_seconds",
+    "Time spent handling a request, by URL name.",
+    ["view", "method"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUESTS = Counter(
+    "django_requests_total",
+    "Requests handled, by URL name and response status.",
+    ["view", "method", "status"],
+)
+REQUEST_QUERIES = Histogram(
+    "django_request_db_queries",
+    "Database queries run per request, by URL name.",
+    ["view"],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+EXTERNAL_LATENCY = Histogram(
+    "external_call_duration_seconds",
+    "Latency of calls to external services (Stripe, SMTP, S3).",
+    ["service", "operation"],
+    buckets=LATENCY_BUCKETS,
+)
+EXTERNAL_ERRORS = Counter(
+    "external_call_errors_total",
+    "Calls to external services that raised, by exception type.",
+    ["service", "operation", "error"],
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache lookups by cache alias and result (hit or miss).",
+    ["cache", "result"],
+)
+CACHE_FILLS = Counter(
+    "cache_fills_total",
+    "Single-flight cache lookups by cached value and outcome: hit, stale "
+    "(served while another request refills), refill, fill, wait (for "
+    "another request's fill) or timeout.",
+    ["name", "outcome"],
+)
+RATE_LIMITED = Counter(
+    "rate_limited_requests_total",
+    "Requests refused with 429 by a rate limit, by scope and bucket (ip or email).",
+    ["scope", "bucket"],
+)
+REQUEST_QUEUE_TIME = Histogram(
+    "request_queue_seconds",
+    "Time from nginx receiving a request to a worker starting on it.",
+    buckets=LATENCY_BUCKETS,
+)
+LOAD_SHED = Counter(
+    "load_shed_requests_total",
+    "Low-priority requests refused with 503 because they queued too long.",
+)
+WEBHOOK_LAG = Histogram(
+    "stripe_webhook_lag_seconds",
+    "Delay between Stripe creating an event and this app processing it.",
+    ["event_type"],
+    buckets=WEBHOOK_LAG_BUCKETS,
+)
+
+# Connection pool state, sampled after each request. Gauges are summed over
+# live worker processes, so utilization is
+# (db_pool_connections - db_pool_connections_idle) / db_pool_connections_max.
+POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Open connections in the pool.",
+    ["alias"],
+    multiprocess_mode="livesum",
+)
+POOL_IDLE = Gauge(
+    "db_pool_connections_idle",
+    "Open connections not checked out.",
+    ["alias"],
+    multiprocess_mode="livesum",
+)
+POOL_MAX = Gauge(
+    "db_pool_connections_max",
+    "Pool capacity.",
+    ["alias"],
+    multiprocess_mode="livesum",
+)
+POOL_WAITING = Gauge(
+    "db_pool_requests_waiting",
+    "Threads waiting for a connection.",
+    ["alias"],
+    multiprocess_mode="livesum",
+)
+POOL_REQUESTS = Counter(
+    "db_pool_requests_total",
+    "Connections checked out of the pool.",
+    ["alias"],
+)
+POOL_QUEUED = Counter(
+    "db_pool_requests_queued_total",
+    "Checkouts that had to wait for a connection.",
+    ["alias"],
+)
+POOL_WAIT = Counter(
+    "db_pool_wait_seconds_total",
+    "Time spent waiting for a connection.",
+    ["alias"],
+)
+POOL_ERRORS = Counter(
+    "db_pool_errors_total",
+    "Pool failures: checkout timeouts, failed connects and connections lost on check.",
+    ["alias", "kind"],
+)
+
+# psycopg_pool error counters -> POOL_ERRORS kind label
+_POOL_ERROR_STATS = {
+    "requests_errors": "timeout",
+    "connections_errors": "connect",
+    "connections_lost": "lost",
+}
+
+
+@contextmanager
+def external_call(service, operation):
+    """
+    Time a call to an external service and count its failures.
+
+    The time is also added to the request's Server-Timing under `service`.
+    Usable as a decorator.
+    """
+    started = perf_counter()
+    try:
+        with measure(service):
+            yield
+    except Exception as e:
+        EXTERNAL_ERRORS.labels(service, operation, type(e).__name__).inc()
+        raise
+    finally:
+        EXTERNAL_LATENCY.labels(service, operation).observe(perf_counter() - started)
+
+
+def record_cache_lookups(cache, hits, misses):
+    if hits:
+        CACHE_REQUESTS.labels(cache, "hit").inc(hits)
+    if misses:
+        CACHE_REQUESTS.labels(cache, "miss").inc(misses)
+
+
+def record_pool_stats():
+    """Export the psycopg pool statistics of every database in this process."""
+    for conn in connections.all(initialized_only=True):
+        # Not `conn.pool`: reading it creates the pool of a database this
+        # process never used (a replica nobody read from yet)
+        pool = getattr(conn, "_connection_pools", {}).get(conn.alias)
+        if pool is None:
+            continue
+        alias = conn.alias
+        # pop_stats() resets the counters, so each call adds only new activity
+        stats = pool.pop_stats()
+        POOL_CONNECTIONS.labels(alias).set(stats.get("pool_size", 0))
+        POOL_IDLE.labels(alias).set(stats.get("pool_available", 0))
+        POOL_MAX.labels(alias).set(stats.get("pool_max", 0))
+        POOL_WAITING.labels(alias).set(stats.get("requests_waiting", 0))
+        POOL_REQUESTS.labels(alias).inc(stats.get("requests_num", 0))
+        POOL_QUEUED.labels(alias).inc(stats.get("requests_queued", 0))
+        POOL_WAIT.labels(alias).inc(stats.get("requests_wait_ms", 0) / 1000)
+        for stat, kind in _POOL_ERROR_STATS.items():
+            if stats.get(stat):
+                POOL_ERRORS.labels(alias, kind).inc(stats[stat])
+
+
+def view_label(request):
+    """URL name of the matched view; unmatched requests (404s) share one label."""
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "<unresolved>"
+    return match.view_name or match._func_path
+
+
+def metrics_allowed(request):
+    """
+    Whether `request` may read the metrics: it carries METRICS_TOKEN as a
+    bearer token, or comes straight from an address in METRICS_ALLOWED_IPS.
+    Requests relayed by nginx (X-Real-IP or X-Forwarded-For set) need the
+    token, whatever the proxy's own address.
+    """
+    token = settings.METRICS_TOKEN
+    if token and constant_time_compare(request.headers.get("Authorization", ""), f"Bearer {token}"):
+        return True
+    if "X-Real-IP" in request.headers or "X-Forwarded-For" in request.headers:
+        return False
+    try:
+        address = ip_address(request.META.get("REMOTE_ADDR", ""))
+    except ValueError:
+        return False
+    return any(address in ip_network(network, strict=False) for network in settings.METRICS_ALLOWED_IPS)
+
+
+def metrics_view(request):
+    """Expose all metrics in the Prometheus text format."""
+    if not metrics_allowed(request):
+        return HttpResponseForbidden()
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
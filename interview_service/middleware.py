@@ -0,0 +1,264 @@
+"""Project-wide middleware."""
+
+import logging
+import random
+import re
+from contextlib import ExitStack
+from time import perf_counter, strftime, time
+from uuid import uuid4
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse
+
+from .db_router import replica_aliases, route_reads
+from .metrics import (
+    LOAD_SHED,
+    REQUEST_LATENCY,
+    REQUEST_QUERIES,
+    REQUEST_QUEUE_TIME,
+    REQUESTS,
+    record_pool_stats,
+    view_label,
+)
+from .profiling import Sampler, save_profile
+from .timing import RequestTimings, activate
+
+logger = logging.getLogger("interview_service.timing")
+profiling_logger = logging.getLogger("interview_service.profiling")
+
+# Fingerprints listed in the slow-request log, slowest first
+SLOW_REQUEST_TOP_QUERIES = 10
+
+# Holds the time until which a client reads from the primary database
+PIN_PRIMARY_COOKIE = "db_pin"
+
+
+class MetricsMiddleware:
+    """
+    Record Prometheus request metrics, labelled by URL name.
+
+    Sits outside ServerTimingMiddleware and reads its query count from
+    `request.timings`. Also samples the database pools after each request.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        started = perf_counter()
+        response = self.get_response(request)
+        elapsed = perf_counter() - started
+
+        view = view_label(request)
+        REQUEST_LATENCY.labels(view, request.method).observe(elapsed)
+        REQUESTS.labels(view, request.method, response.status_code).inc()
+        timings = getattr(request, "timings", None)
+        if timings is not None:
+            REQUEST_QUERIES.labels(view).observe(timings.query_count)
+        record_pool_stats()
+        return response
+
+
+class LoadSheddingMiddleware:
+    """
+    Turn away low-priority requests while the workers are backed up.
+
+    nginx stamps each request with `X-Request-Start: t=<epoch seconds>`;
+    the gap until a worker picks the request up is how long it queued.
+    While that exceeds LOAD_SHED_QUEUE_MS, requests whose path matches
+    LOAD_SHED_PATHS (the public catalog and API) get 503 with Retry-After
+    before any view runs, so checkout and webhooks behind them are reached
+    sooner. nginx serves its cached copy of a catalog page for the 503.
+
+    Requests without the header (runserver, tests, the internal cache
+    refresh server) are never shed.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.paths = re.compile(settings.LOAD_SHED_PATHS)
+
+    def __call__(self, request):
+        queued = self.queue_seconds(request)
+        if queued is not None:
+            REQUEST_QUEUE_TIME.observe(queued)
+            if (
+                settings.LOAD_SHED_QUEUE_MS
+                and queued * 1000 > settings.LOAD_SHED_QUEUE_MS
+                and self.paths.match(request.path_info)
+            ):
+                LOAD_SHED.inc()
+                response = HttpResponse("The site is busy. Please try again shortly.", status=503)
+                response["Retry-After"] = str(settings.LOAD_SHED_RETRY_AFTER)
+                return response
+        return self.get_response(request)
+
+    @staticmethod
+    def queue_seconds(request):
+        header = request.headers.get("X-Request-Start", "")
+        try:
+            started = float(header.removeprefix("t="))
+        except ValueError:
+            return None
+        # nginx and Django share the host clock; clamp small negative skew
+        return max(0.0, time() - started)
+
+
+class ServerTimingMiddleware:
+    """
+    Time each request's database, template and outbound work.
+
+    Every query on every configured database goes through an execute
+    wrapper; template rendering and calls to Stripe, SMTP and S3 report
+    through `interview_service.timing.measure`. The totals are returned in
+    a Server-Timing header (visible in the browser's network panel).
+
+    Requests slower than SLOW_REQUEST_MS are logged with their queries
+    grouped by normalized SQL. A query shape that runs REPEATED_QUERY_THRESHOLD
+    times or more in one request is flagged as a likely N+1 even when the
+    request is fast.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        timings = request.timings = RequestTimings()
+        started = perf_counter()
+        with activate(timings), ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(timings.record_query))
+            response = self.get_response(request)
+        total = (perf_counter() - started) * 1000
+
+        response["Server-Timing"] = timings.header(total)
+        self.log(request, response, timings, total)
+        return response
+
+    def log(self, request, response, timings, total):
+        repeated = timings.repeated_queries(settings.REPEATED_QUERY_THRESHOLD)
+        slow = total >= settings.SLOW_REQUEST_MS
+        if not slow and not repeated:
+            return
+
+        breakdown = ", ".join(
+            f"{name} {duration:.0f}ms" for name, duration in timings.durations.items()
+        )
+        lines = [
+            f"{'Slow request' if slow else 'Repeated queries in'} {request.method} "
+            f"{request.path} -> {response.status_code} in {total:.0f}ms "
+            f"({timings.query_count} queries; {breakdown or 'no db, template or outbound time'})"
+        ]
+        if slow:
+            queries = sorted(timings.queries.items(), key=lambda item: item[1][1], reverse=True)
+            queries = queries[:SLOW_REQUEST_TOP_QUERIES]
+        else:
+            queries = sorted(repeated.items(), key=lambda item: item[1][0], reverse=True)
+        for sql, (count, duration) in queries:
+            marker = "  [possible N+1]" if sql in repeated else ""
+            lines.append(f"  {count:>4}x {duration:8.1f}ms  {sql}{marker}")
+
+        logger.warning(
+            "\n".join(lines),
+            extra={
+                "path": request.path,
+                "status_code": response.status_code,
+                "duration_ms": round(total, 1),
+                "query_count": timings.query_count,
+                "repeated_queries": len(repeated),
+            },
+        )
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Let GET and HEAD requests read from the database replicas.
+
+    A request that writes sets a short-lived cookie; while it is valid the
+    client's requests read from the primary, so a change is visible on the
+    next page even if the replicas haven't caught up. See
+    `interview_service.db_router`.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with route_reads(use_primary=not self.may_use_replica(request)) as state:
+            response = self.get_response(request)
+        if state.wrote and settings.DB_REPLICA_PIN_SECONDS and replica_aliases():
+            response.set_cookie(
+                PIN_PRIMARY_COOKIE,
+                str(int(time()) + settings.DB_REPLICA_PIN_SECONDS),
+                max_age=settings.DB_REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    @staticmethod
+    def may_use_replica(request):
+        if request.method not in ("GET", "HEAD"):
+            return False
+        try:
+            pinned_until = int(request.COOKIES.get(PIN_PRIMARY_COOKIE, 0))
+        except ValueError:
+            return True
+        return pinned_until <= time()
+
+
+class ProfilingMiddleware:
+    """
+    Run the sampling profiler around selected requests.
+
+    Staff can profile any request by sending an `X-Profile: 1` header or
+    adding `?_profile=1`. The response body is then replaced by the
+    collapsed-stack profile, which opens as a flame graph in speedscope.
+    The original status is kept in X-Profiled-Status.
+
+    Independently, PROFILE_SAMPLE_RATE profiles that fraction of all
+    requests and only writes them to PROFILE_DIR. All profiles are saved
+    there, and only the newest PROFILE_KEEP files are kept.
+
+    Must come after AuthenticationMiddleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        on_demand = self.requested(request)
+        sampled = not on_demand and random.random() < settings.PROFILE_SAMPLE_RATE
+        if not (on_demand or sampled):
+            return self.get_response(request)
+
+        with Sampler(interval=settings.PROFILE_INTERVAL_MS / 1000) as sampler:
+            response = self.get_response(request)
+
+        profile = sampler.collapsed()
+        view = re.sub(r"[^\w.-]+", "-", view_label(request)).strip("-")
+        name = f"{strftime('%Y%m%d-%H%M%S')}-{view}-{uuid4().hex[:8]}.folded"
+        path = save_profile(settings.PROFILE_DIR, name, profile, settings.PROFILE_KEEP)
+        profiling_logger.info(
+            "Profiled %s %s (%d samples) -> %s", request.method, request.path, sampler.samples, path
+        )
+        if sampled:
+            return response
+
+        return HttpResponse(
+            profile,
+            content_type="text/plain; charset=utf-8",
+            headers={
+                "Content-Disposition": f'attachment; filename="{name}"',
+                "X-Profiled-Status": str(response.status_code),
+                "X-Profile-Samples": str(sampler.samples),
+            },
+        )
+
+    @staticmethod
+    def requested(request):
+        if request.headers.get("X-Profile") != "1" and request.GET.get("_profile") != "1":
+            return False
+        # Only look the user up (a session query) once a profile is asked for
+        return request.user.is_staff
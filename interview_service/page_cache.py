@@ -0,0 +1,123 @@
+"""
+Refresh nginx's copies of the catalog pages when the catalog changes.
+
+When an interviewer, technology or subject is saved, the pages nginx
+micro-caches for PUBLIC_PAGE_CACHE_SECONDS (see nginx.conf) are fetched
+again through its internal refresh server at PAGE_CACHE_REFRESH_URL, and
+the fresh copies replace the cached ones. Open-source nginx has no purge
+command. The prerendered site is rebuilt by its own process instead
+(`prerender_site --watch`, see pages.prerender), which follows the catalog
+version.
+
+Refreshing happens on a background thread after the transaction commits,
+and changes that arrive within PAGE_CACHE_REFRESH_DELAY of each other
+share one pass. Pages not refreshed here, such as combined filters, expire
+on their own.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import sleep, time
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.urls import reverse
+
+from .metrics import external_call
+from .middleware import PIN_PRIMARY_COOKIE
+
+logger = logging.getLogger("interview_service.page_cache")
+
+REFRESH_TIMEOUT = 10
+
+
+def catalog_paths(interviewer_ids=()):
+    """Every cached page that lists interviewers, plus the given detail modals."""
+    from interviewers.taxonomy import get_taxonomy
+
+    taxonomy = get_taxonomy()
+    list_url = reverse("interviewers:list")
+    paths = [reverse("pages:home"), reverse("interviewers:featured"), list_url]
+    paths += [f"{list_url}?technology={tech.slug}" for tech in taxonomy.technologies]
+    paths += [f"{list_url}?subject={subject.slug}" for subject in taxonomy.subjects]
+    paths += [reverse("interviewers:detail_modal", kwargs={"pk": pk}) for pk in sorted(interviewer_ids)]
+    return paths
+
+
+def refresh_catalog(interviewer_ids=()):
+    """
+    Re-fetch the catalog pages through nginx, as full pages and as HTMX
+    partials. Return the number of pages that could not be fetched.
+    """
+    base = settings.PAGE_CACHE_REFRESH_URL.rstrip("/")
+    headers = {
+        "Host": settings.PAGE_CACHE_REFRESH_HOST,
+        # Render from the primary; a lagging replica would cache stale pages
+        "Cookie": f"{PIN_PRIMARY_COOKIE}={int(time()) + 60}",
+    }
+    failed = 0
+    for path in catalog_paths(interviewer_ids):
+        for extra in ({}, {"HX-Request": "true"}):
+            request = Request(base + path, headers={**headers, **extra})
+            try:
+                with external_call("nginx", "refresh"):
+                    try:
+                        urlopen(request, timeout=REFRESH_TIMEOUT).close()
+                    except HTTPError as e:
+                        # e.g. the modal of a deactivated interviewer; it
+                        # stays cached until it expires
+                        e.close()
+            except OSError as e:
+                logger.warning("Could not refresh %s: %s", path, e)
+                failed += 1
+    return failed
+
+
+class CatalogRefresher:
+    """Collects catalog changes and refreshes the cache once per burst."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self._interviewer_ids = set()
+        self._scheduled = False
+        self._executor = None
+
+    def schedule(self, interviewer_id=None):
+        with self._lock:
+            if interviewer_id is not None:
+                self._interviewer_ids.add(interviewer_id)
+            if self._scheduled:
+                return
+            self._scheduled = True
+            if self._executor is None:
+                # Created on first use so no thread is forked from the master
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-cache")
+        self._executor.submit(self.run)
+
+    def run(self):
+        # Let the rest of the save (m2m changes after the row) arrive first
+        sleep(settings.PAGE_CACHE_REFRESH_DELAY)
+        with self._lock:
+            interviewer_ids, self._interviewer_ids = self._interviewer_ids, set()
+            self._scheduled = False
+        try:
+            started = time()
+            failed = refresh_catalog(interviewer_ids)
+            logger.info("Refreshed cached catalog pages in %.1fs (%d failed)", time() - started, failed)
+        except Exception:
+            logger.exception("Catalog page refresh failed")
+        finally:
+            # Hand this thread's database connection back to the pool
+            connections.close_all()
+
+
+refresher = CatalogRefresher()
+
+
+def purge_catalog(interviewer_id=None):
+    """Refresh nginx's cached catalog pages once the current transaction commits."""
+    if settings.PAGE_CACHE_REFRESH_URL:
+        transaction.on_commit(lambda: refresher.schedule(interviewer_id))
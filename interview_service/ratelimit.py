@@ -0,0 +1,136 @@
+"""
+Token-bucket rate limits kept in the shared cache.
+
+Each bucket holds up to N tokens and refills at N per period, so a limit of
+"5/m" allows a burst of five and then one more every twelve seconds. Limits
+are set per scope and key in RATE_LIMITS, e.g. "login:ip" and
+"login:email"; an empty limit turns that bucket off.
+
+With Redis the bucket is updated by a Lua script, which makes each take
+atomic across workers. The in-process cache used without Redis takes a
+lock, which is enough for one process. When the cache is unreachable,
+requests are let through.
+"""
+
+import logging
+import math
+from functools import wraps
+from hashlib import md5
+from threading import Lock
+from time import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.redis import RedisCache
+from django.http import HttpResponse
+
+from .metrics import RATE_LIMITED
+
+logger = logging.getLogger("interview_service.ratelimit")
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# KEYS[1]: bucket; ARGV: capacity, tokens per second, now.
+# Returns {1 if a token was taken, tokens left as a string}.
+TAKE_TOKEN_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(bucket[1]) or capacity
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local taken = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    taken = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {taken, tostring(tokens)}
+"""
+
+_local_lock = Lock()
+
+
+def parse_rate(rate):
+    """'5/m' -> (capacity 5, 5/60 tokens per second); None for an empty rate."""
+    if not rate:
+        return None
+    count, _, period = rate.partition("/")
+    capacity = int(count)
+    return capacity, capacity / PERIODS[period]
+
+
+def take_token(key, capacity, rate, now=None):
+    """
+    Take a token from the bucket at `key`. Return None if one was taken,
+    else the seconds until the next token.
+    """
+    now = time() if now is None else now
+    if isinstance(cache, RedisCache):
+        client = cache._cache.get_client(key, write=True)
+        taken, tokens = client.eval(
+            TAKE_TOKEN_SCRIPT, 1, cache.make_and_validate_key(key), capacity, rate, now
+        )
+        tokens = float(tokens)
+    else:
+        with _local_lock:
+            tokens, updated = cache.get(key, (capacity, now))
+            tokens = min(capacity, tokens + max(0, now - updated) * rate)
+            taken = tokens >= 1
+            if taken:
+                tokens -= 1
+            cache.set(key, (tokens, now), math.ceil(capacity / rate) + 1)
+    return None if taken else (1 - tokens) / rate
+
+
+def client_ip(request):
+    """The client's address; behind nginx it comes from RATE_LIMIT_CLIENT_IP_HEADER."""
+    header = settings.RATE_LIMIT_CLIENT_IP_HEADER
+    return (header and request.META.get(header)) or request.META.get("REMOTE_ADDR", "")
+
+
+def rate_limit(scope, email_field=None, methods=("POST",)):
+    """
+    Throttle a view per client IP and, with `email_field`, per submitted
+    address, using the RATE_LIMITS entries "<scope>:ip" and "<scope>:email".
+
+    Throttled requests get 429 with Retry-After and are counted in
+    rate_limited_requests_total. Only `methods` are limited.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapped(request, *args, **kwargs):
+            if request.method not in methods:
+                return view(request, *args, **kwargs)
+
+            buckets = [("ip", client_ip(request))]
+            if email_field:
+                email = request.POST.get(email_field, "").strip().lower()
+                if email:
+                    buckets.append(("email", email))
+
+            for kind, value in buckets:
+                limit = parse_rate(settings.RATE_LIMITS.get(f"{scope}:{kind}"))
+                if limit is None:
+                    continue
+                # Hashed: addresses may hold characters cache keys can't
+                digest = md5(value.encode(), usedforsecurity=False).hexdigest()
+                try:
+                    wait = take_token(f"ratelimit:{scope}:{kind}:{digest}", *limit)
+                except Exception:
+                    logger.exception("Rate limit check failed; letting the request through")
+                    continue
+                if wait is not None:
+                    RATE_LIMITED.labels(scope, kind).inc()
+                    response = HttpResponse("Too many requests. Please try again shortly.", status=429)
+                    response["Retry-After"] = str(math.ceil(wait))
+                    return response
+
+            return view(request, *args, **kwargs)
+
+        return wrapped
+
+    return decorator
@@ -18,6 +18,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # Local apps
     "accounts",
     "interviewers",
@@ -27,11 +28,16 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "interview_service.middleware.MetricsMiddleware",
+    "interview_service.middleware.LoadSheddingMiddleware",
+    "interview_service.middleware.ServerTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "interview_service.middleware.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "interview_service.middleware.ProfilingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -40,7 +46,9 @@ ROOT_URLCONF = "interview_service.urls"
 
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "BACKEND": "interview_service.template_backends.DjangoTemplates",
+        # Keep the engine alias Django would give its own backend
+        "NAME": "django",
         "DIRS": [BASE_DIR / "templates"],
         "APP_DIRS": True,
         "OPTIONS": {
@@ -56,6 +64,95 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "interview_service.wsgi.application"
 
+# Database connections come from a psycopg pool in each worker process (see
+# DATABASES in dev/prod). Keep gunicorn workers x DB_POOL_MAX_SIZE, plus the
+# rollups service, below Postgres' max_connections (100 by default).
+DB_POOL = {
+    "min_size": int(os.environ.get("DB_POOL_MIN_SIZE", "1")),
+    # One connection per gthread thread (GUNICORN_THREADS)
+    "max_size": int(os.environ.get("DB_POOL_MAX_SIZE", "4")),
+    # Seconds a request waits for a free connection before failing
+    "timeout": float(os.environ.get("DB_POOL_TIMEOUT", "10")),
+    # Shrink back to min_size when idle; recycle long-lived connections
+    "max_idle": 300,
+    "max_lifetime": 1800,
+}
+# Runaway queries are cancelled instead of holding a pooled connection.
+# manage.py replaces it with DB_COMMAND_STATEMENT_TIMEOUT_MS (default 0, no
+# limit) so migrations, rollups and backfills aren't cut off.
+DB_STATEMENT_TIMEOUT_MS = int(os.environ.get("DB_STATEMENT_TIMEOUT_MS", "30000"))
+DB_OPTIONS = {
+    "pool": DB_POOL,
+    "options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}",
+}
+
+# Read replicas: comma-separated "host[:port]" entries sharing the primary's
+# credentials. GET requests read from a replica unless the client wrote in
+# the last DB_REPLICA_PIN_SECONDS (see interview_service.db_router).
+DB_REPLICA_HOSTS = [host for host in os.environ.get("DB_REPLICA_HOSTS", "").split(",") if host]
+DB_REPLICA_PIN_SECONDS = int(os.environ.get("DB_REPLICA_PIN_SECONDS", "10"))
+DATABASE_ROUTERS = ["interview_service.db_router.PrimaryReplicaRouter"]
+
+# Cache; the instrumented backends feed the cache hit ratio metric. Without
+# REDIS_URL each process has its own in-memory cache.
+REDIS_URL = os.environ.get("REDIS_URL", "")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "interview_service.cache.RedisCache",
+            "LOCATION": REDIS_URL,
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "interview_service.cache.LocMemCache",
+        },
+    }
+
+# Sessions exist only for logged-in users (see public_page). With a shared
+# cache they are read from it and written through to the database; a
+# per-process cache could keep serving a session after logout elsewhere.
+SESSION_ENGINE = (
+    "django.contrib.sessions.backends.cached_db" if REDIS_URL else "django.contrib.sessions.backends.db"
+)
+
+# Catalog query results are cached this long (interviewers.catalog); catalog
+# changes replace them sooner
+CATALOG_CACHE_SECONDS = int(os.environ.get("CATALOG_CACHE_SECONDS", "300"))
+# Token-bucket limits per scope and bucket ("count/s|m|h|d"; empty = off).
+# See interview_service.ratelimit.
+RATE_LIMITS = {
+    "login:ip": os.environ.get("RATE_LIMIT_LOGIN_IP", "20/m"),
+    "login:email": os.environ.get("RATE_LIMIT_LOGIN_EMAIL", "5/m"),
+    "booking:ip": os.environ.get("RATE_LIMIT_BOOKING_IP", "10/m"),
+    "booking:email": os.environ.get("RATE_LIMIT_BOOKING_EMAIL", "5/m"),
+}
+# META key holding the client address when behind a proxy; nginx sets X-Real-IP
+RATE_LIMIT_CLIENT_IP_HEADER = os.environ.get("RATE_LIMIT_CLIENT_IP_HEADER", "")
+# /metrics answers direct requests from these addresses or networks, and
+# any request with "Authorization: Bearer <METRICS_TOKEN>"
+METRICS_ALLOWED_IPS = [ip for ip in os.environ.get("METRICS_ALLOWED_IPS", "127.0.0.1,::1").split(",") if ip]
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+# Catalog and API requests that waited longer than this for a worker get a
+# 503 (0 = never); checkout, webhooks and dashboards are always served
+LOAD_SHED_QUEUE_MS = int(os.environ.get("LOAD_SHED_QUEUE_MS", "0"))
+LOAD_SHED_RETRY_AFTER = int(os.environ.get("LOAD_SHED_RETRY_AFTER", "5"))
+# Paths that may be shed: the homepage, the catalog and the JSON API
+LOAD_SHED_PATHS = r"^/($|interviewers/|api/)"
+# Anonymous catalog pages may be kept this long by shared caches (nginx)
+PUBLIC_PAGE_CACHE_SECONDS = int(os.environ.get("PUBLIC_PAGE_CACHE_SECONDS", "60"))
+# nginx's internal refresh server; catalog changes re-fetch the cached pages
+# through it (see interview_service.page_cache). Empty: nothing to refresh.
+PAGE_CACHE_REFRESH_URL = os.environ.get("PAGE_CACHE_REFRESH_URL", "")
+PAGE_CACHE_REFRESH_HOST = os.environ.get(
+    "PAGE_CACHE_REFRESH_HOST", ALLOWED_HOSTS[0] if ALLOWED_HOSTS else "localhost"
+)
+PAGE_CACHE_REFRESH_DELAY = float(os.environ.get("PAGE_CACHE_REFRESH_DELAY", "1"))
+# Static copies of the catalog for nginx (`manage.py prerender_site`,
+# rebuilt after catalog changes by `prerender_site --watch`)
+PRERENDER_ROOT = os.environ.get("PRERENDER_ROOT", "")
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -98,3 +195,16 @@ CAL_COM_API_KEY = os.environ.get("CAL_COM_API_KEY", "")
 # Email settings
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 DEFAULT_FROM_EMAIL = os.environ.get("DEFAULT_FROM_EMAIL", "noreply@508.dev")
+
+# Request timing: log requests slower than this, and any request that runs
+# the same query shape this many times (see ServerTimingMiddleware)
+SLOW_REQUEST_MS = int(os.environ.get("SLOW_REQUEST_MS", "500"))
+REPEATED_QUERY_THRESHOLD = int(os.environ.get("REPEATED_QUERY_THRESHOLD", "10"))
+
+# Sampling profiler (see ProfilingMiddleware). Staff can profile any request
+# on demand; set PROFILE_SAMPLE_RATE (e.g. 0.001) to also profile a random
+# fraction of all requests.
+PROFILE_SAMPLE_RATE = float(os.environ.get("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_INTERVAL_MS = float(os.environ.get("PROFILE_INTERVAL_MS", "5"))
+PROFILE_DIR = Path(os.environ.get("PROFILE_DIR", BASE_DIR / "profiles"))
+PROFILE_KEEP = int(os.environ.get("PROFILE_KEEP", "200"))
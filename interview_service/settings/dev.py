@@ -2,6 +2,8 @@
 Development settings.
 """
 
+from interview_service.db_router import replica_databases
+
 from .base import *  # noqa: F403
 
 DEBUG = True
@@ -17,8 +19,12 @@ DATABASES = {
         "PASSWORD": os.environ.get("POSTGRES_PASSWORD", "postgres"),
         "HOST": os.environ.get("POSTGRES_HOST", "localhost"),
         "PORT": os.environ.get("POSTGRES_PORT", "5432"),
+        # Validate pooled connections before handing them out
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": DB_OPTIONS,  # noqa: F405
     }
 }
+DATABASES.update(replica_databases(DATABASES["default"], DB_REPLICA_HOSTS))  # noqa: F405
 
 # Django browser reload
 INSTALLED_APPS += ["django_browser_reload"]  # noqa: F405
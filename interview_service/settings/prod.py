@@ -2,6 +2,8 @@
 Production settings.
 """
 
+from interview_service.db_router import replica_databases
+
 from .base import *  # noqa: F403
 
 DEBUG = False
@@ -13,6 +15,23 @@ X_FRAME_OPTIONS = "DENY"
 SECURE_SSL_REDIRECT = os.environ.get("SECURE_SSL_REDIRECT", "true").lower() == "true"
 SESSION_COOKIE_SECURE = True
 CSRF_COOKIE_SECURE = True
+# nginx overwrites X-Real-IP with the connecting address (nginx.conf)
+RATE_LIMIT_CLIENT_IP_HEADER = os.environ.get("RATE_LIMIT_CLIENT_IP_HEADER", "HTTP_X_REAL_IP")
+# Prometheus scrapes web:8000/metrics (and the other web services) over
+# plain HTTP from inside the compose network
+SECURE_REDIRECT_EXEMPT = [r"^metrics$"]
+ALLOWED_HOSTS += [  # noqa: F405
+    host for host in os.environ.get("METRICS_HOSTS", "web,web-payments,web-events").split(",") if host
+]
+METRICS_ALLOWED_IPS = [
+    ip
+    for ip in os.environ.get(
+        "METRICS_ALLOWED_IPS", "127.0.0.0/8,::1,10.0.0.0/8,172.16.0.0/12,192.168.0.0/16"
+    ).split(",")
+    if ip
+]
+# nginx sends X-Request-Start, so queueing can be measured and shed
+LOAD_SHED_QUEUE_MS = int(os.environ.get("LOAD_SHED_QUEUE_MS", "500"))
 
 # Database
 DATABASES = {
@@ -23,15 +42,26 @@ DATABASES = {
         "PASSWORD": os.environ.get("POSTGRES_PASSWORD"),
         "HOST": os.environ.get("POSTGRES_HOST"),
         "PORT": os.environ.get("POSTGRES_PORT", "5432"),
+        # Validate pooled connections before handing them out
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": DB_OPTIONS,  # noqa: F405
     }
 }
+DATABASES.update(replica_databases(DATABASES["default"], DB_REPLICA_HOSTS))  # noqa: F405
 
 # WhiteNoise for static files
-MIDDLEWARE.insert(1, "whitenoise.middleware.WhiteNoiseMiddleware")  # noqa: F405
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+MIDDLEWARE.insert(  # noqa: F405
+    MIDDLEWARE.index("django.middleware.security.SecurityMiddleware") + 1,  # noqa: F405
+    "whitenoise.middleware.WhiteNoiseMiddleware",
+)
 
-# MinIO / S3 storage for media files
-DEFAULT_FILE_STORAGE = "storages.backends.s3boto3.S3Boto3Storage"
+# MinIO / S3 storage for media files; the subclass reports S3 time per request
+STORAGES = {
+    "default": {"BACKEND": "interview_service.storage.S3Storage"},
+    # Interviewer photos (see interviewers.models.public_storage)
+    "public": {"BACKEND": "interview_service.storage.PublicS3Storage"},
+    "staticfiles": {"BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"},
+}
 AWS_ACCESS_KEY_ID = os.environ.get("MINIO_ACCESS_KEY")
 AWS_SECRET_ACCESS_KEY = os.environ.get("MINIO_SECRET_KEY")
 AWS_STORAGE_BUCKET_NAME = os.environ.get("MINIO_BUCKET_NAME", "interview-service")
@@ -0,0 +1,95 @@
+"""
+Cache fills that run once, however many requests miss at the same time.
+
+When a cached value expires or its version changes, every worker that asks
+for it misses together and would run the same queries. get_or_fill() lets
+one of them refill the entry under a short lock in the shared cache:
+
+- After a version change (or with nothing cached) the others wait for the
+  new value, polling the cache and retrying the lock, so nobody is served
+  data from before the change and a freed lock is taken over at once.
+- When an entry of the current version merely expires, the others keep
+  serving the old value until the refill lands (stale-while-revalidate).
+
+Lifetimes are jittered so entries filled together don't expire together.
+"""
+
+import random
+from time import sleep, time
+from uuid import uuid4
+
+from django.core.cache import cache
+
+from .metrics import CACHE_FILLS
+
+# Longer than any fill should take; a crashed filler frees the lock by then
+FILL_LOCK_SECONDS = 10
+# How long waiting requests poll before filling the entry themselves
+FILL_WAIT_SECONDS = 5
+FILL_POLL_INTERVAL = 0.05
+# Lifetimes vary by up to this fraction either way
+TTL_JITTER = 0.1
+
+
+def jittered(seconds):
+    return seconds * random.uniform(1 - TTL_JITTER, 1 + TTL_JITTER)
+
+
+def get_or_fill(key, fill, timeout, version=None, stale=None, name="default"):
+    """
+    Return the cached value for `key`, calling `fill()` at most once across
+    workers when it is missing, expired or of another `version`.
+
+    The value is fresh for about `timeout` seconds and then served stale for
+    up to `stale` more (default: `timeout`) while one request refills it.
+    `name` labels the cache_fills_total metric.
+    """
+    entry = cache.get(key)
+    if entry is not None and entry[0] == version:
+        _, fresh_until, value = entry
+        if time() < fresh_until:
+            CACHE_FILLS.labels(name, "hit").inc()
+            return value
+        lock = _acquire(key)
+        if lock is None:
+            CACHE_FILLS.labels(name, "stale").inc()
+            return value
+        CACHE_FILLS.labels(name, "refill").inc()
+        return _fill(key, lock, fill, timeout, version, stale)
+
+    deadline = time() + FILL_WAIT_SECONDS
+    while True:
+        # The lock holder may be refilling another version, or its fill may
+        # fail; whoever takes the lock next fills this one
+        lock = _acquire(key)
+        if lock is not None:
+            CACHE_FILLS.labels(name, "fill").inc()
+            return _fill(key, lock, fill, timeout, version, stale)
+        if time() >= deadline:
+            break
+        sleep(FILL_POLL_INTERVAL)
+        entry = cache.get(key)
+        if entry is not None and entry[0] == version:
+            CACHE_FILLS.labels(name, "wait").inc()
+            return entry[2]
+
+    # The filler is stuck or gone; don't hold this request any longer
+    CACHE_FILLS.labels(name, "timeout").inc()
+    return fill()
+
+
+def _acquire(key):
+    token = uuid4().hex
+    return token if cache.add(f"{key}:lock", token, FILL_LOCK_SECONDS) else None
+
+
+def _fill(key, lock, fill, timeout, version, stale):
+    try:
+        value = fill()
+        fresh = jittered(timeout)
+        cache.set(key, (version, time() + fresh, value), fresh + (timeout if stale is None else stale))
+        return value
+    finally:
+        # Only release our own lock, not one taken after ours expired
+        if cache.get(f"{key}:lock") == lock:
+            cache.delete(f"{key}:lock")
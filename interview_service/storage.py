@@ -0,0 +1,27 @@
+"""S3 media storage that reports upload and download latency."""
+
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from .metrics import external_call
+
+
+class S3Storage(S3Boto3Storage):
+    def _save(self, name, content):
+        with external_call("s3", "upload"):
+            return super()._save(name, content)
+
+    def _open(self, name, mode="rb"):
+        with external_call("s3", "download"):
+            return super()._open(name, mode)
+
+
+class PublicS3Storage(S3Storage):
+    """
+    Unsigned URLs for files the bucket lets anyone read (interviewers/).
+
+    Profile photos appear on cached and prerendered public pages, where a
+    signed URL would expire. Everything else, resumes included, keeps the
+    default storage's signed URLs.
+    """
+
+    querystring_auth = False
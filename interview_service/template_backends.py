@@ -0,0 +1,19 @@
+"""Django template backend that reports render time to the request timings."""
+
+from django.template.backends import django
+
+from .timing import measure
+
+
+class Template(django.Template):
+    def render(self, context=None, request=None):
+        with measure("tpl"):
+            return super().render(context, request)
+
+
+class DjangoTemplates(django.DjangoTemplates):
+    def from_string(self, template_code):
+        return Template(super().from_string(template_code).template, self)
+
+    def get_template(self, template_name):
+        return Template(super().get_template(template_name).template, self)
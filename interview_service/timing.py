@@ -0,0 +1,109 @@
+"""
+Per-request timing of database, template and outbound work.
+
+ServerTimingMiddleware activates a RequestTimings for each request; code
+that calls out of the process wraps the call in `measure(name)` so its
+time shows up in the Server-Timing header and the slow-request log.
+Outside a request `measure` does nothing.
+"""
+
+import re
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+_current = ContextVar("request_timings", default=None)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|%\(\w+\)s")
+_IN_LIST = re.compile(r"\bIN \(\?(?:\s*,\s*\?)*\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(r"\bVALUES \([^()]*\)(?:\s*,\s*\([^()]*\))*", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(sql):
+    """
+    Normalize SQL so queries that differ only in their values compare equal.
+
+    Literals and placeholders become `?`, IN lists and VALUES rows collapse
+    to `(...)`, and whitespace is squeezed.
+    """
+    sql = _STRING.sub("?", sql)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    sql = _VALUES_LIST.sub("VALUES (...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+class RequestTimings:
+    """Durations (ms) by name plus per-fingerprint query stats for one request."""
+
+    def __init__(self):
+        self.durations = defaultdict(float)
+        self.query_count = 0
+        # fingerprint -> [count, total ms]
+        self.queries = defaultdict(lambda: [0, 0.0])
+        self._active = set()
+
+    def record_query(self, execute, sql, params, many, context):
+        """`connection.execute_wrapper` hook that times every query."""
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = (perf_counter() - started) * 1000
+            self.durations["db"] += elapsed
+            self.query_count += 1
+            stats = self.queries[fingerprint(sql)]
+            stats[0] += 1
+            stats[1] += elapsed
+
+    def repeated_queries(self, threshold):
+        """Fingerprints run at least `threshold` times: the usual N+1 signature."""
+        return {sql: stats for sql, stats in self.queries.items() if stats[0] >= threshold}
+
+    def header(self, total):
+        """Render the Server-Timing header value."""
+        metrics = []
+        for name, duration in self.durations.items():
+            metric = f"{name};dur={duration:.1f}"
+            if name == "db":
+                metric += f';desc="{self.query_count} queries"'
+            metrics.append(metric)
+        metrics.append(f"total;dur={total:.1f}")
+        return ", ".join(metrics)
+
+
+@contextmanager
+def measure(name):
+    """
+    Add the time spent in the block to the current request under `name`.
+
+    Usable as a decorator. Nested blocks with the same name are counted
+    once, so a template that renders another template is not double counted.
+    """
+    timings = _current.get()
+    if timings is None or name in timings._active:
+        yield
+        return
+
+    timings._active.add(name)
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        timings.durations[name] += (perf_counter() - started) * 1000
+        timings._active.discard(name)
+
+
+@contextmanager
+def activate(timings):
+    """Make `timings` the current request's recorder for the block."""
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
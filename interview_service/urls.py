@@ -7,6 +7,8 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 
+from .metrics import metrics_view
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("", include("pages.urls")),
@@ -14,6 +16,8 @@ urlpatterns = [
     path("bookings/", include("bookings.urls")),
     path("accounts/", include("accounts.urls")),
     path("dashboard/", include("dashboard.urls")),
+    path("api/v1/", include("interviewers.api_urls")),
+    path("metrics", metrics_view, name="metrics"),
 ]
 
 if settings.DEBUG:
@@ -0,0 +1,61 @@
+"""
+Warm a freshly started process before it accepts traffic.
+
+Called from gunicorn.conf.py. With preload_app the shared parts (URL
+resolver, compiled templates, the Stripe SDK) are built once in the master
+and inherited by every worker, which then only checks its databases.
+Without preload every worker does all of it.
+"""
+
+from pathlib import Path
+from time import perf_counter
+
+from django.db import connections
+from django.template import TemplateDoesNotExist, TemplateSyntaxError, engines
+from django.urls import get_resolver
+
+
+def warm_up(databases=True):
+    """
+    Populate process-wide caches and optionally check each database.
+
+    Returns (milliseconds taken, templates compiled).
+    """
+    started = perf_counter()
+    # Builds the reverse() and resolve() lookup tables for every URL
+    get_resolver().reverse_dict
+    templates = compile_templates()
+
+    # Imported lazily for manage.py and tests; a web process will need it
+    from bookings.stripe import stripe_client
+
+    stripe_client()
+
+    if databases:
+        # Fail before taking traffic if a database is unreachable. Request
+        # threads open their own connections, so don't hold these open.
+        for alias in connections:
+            with connections[alias].cursor() as cursor:
+                cursor.execute("SELECT 1")
+        connections.close_all()
+
+    return (perf_counter() - started) * 1000, templates
+
+
+def compile_templates():
+    """
+    Compile every template into the cached loader; return how many.
+
+    A no-op in effect when the cached loader is off (DEBUG), since
+    templates are then re-read on every render anyway.
+    """
+    count = 0
+    for engine in engines.all():
+        for directory in engine.template_dirs:
+            for path in Path(directory).rglob("*.html"):
+                try:
+                    engine.get_template(path.relative_to(directory).as_posix())
+                except (TemplateDoesNotExist, TemplateSyntaxError):
+                    continue
+                count += 1
+    return count
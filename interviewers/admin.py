@@ -1,5 +1,7 @@
 from django.contrib import admin
 
+from interview_service.pagination import EstimatedCountPaginator
+
 from .models import Interviewer, InterviewSubject, Technology
 
 
@@ -20,9 +22,15 @@ class InterviewSubjectAdmin(admin.ModelAdmin):
 @admin.register(Interviewer)
 class InterviewerAdmin(admin.ModelAdmin):
     list_display = ["display_name", "hourly_rate", "is_active", "created_at"]
+    list_select_related = ["user"]
     list_filter = ["is_active", "technologies", "subjects"]
-    search_fields = ["user__username", "user__first_name", "user__last_name", "bio"]
+    # Prefix matches on user names only; bio is free text and would force
+    # a sequential scan for every search (and every autocomplete lookup).
+    search_fields = ["^user__username", "^user__first_name", "^user__last_name"]
+    autocomplete_fields = ["user"]
     filter_horizontal = ["technologies", "subjects"]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     readonly_fields = ["created_at", "updated_at"]
     fieldsets = [
         (None, {"fields": ["user", "is_active"]}),
@@ -31,3 +39,7 @@ class InterviewerAdmin(admin.ModelAdmin):
         ("Skills", {"fields": ["technologies", "subjects"]}),
         ("Timestamps", {"fields": ["created_at", "updated_at"]}),
     ]
+
+    def get_queryset(self, request):
+        # Autocomplete results render __str__, which reads the user
+        return super().get_queryset(request).select_related("user")
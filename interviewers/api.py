@@ -0,0 +1,120 @@
+"""
+Read-only JSON API over the interviewer catalog, for partner sites.
+
+Served from cached catalog queries (interviewers.catalog) with the same
+ETags as the HTML views, and encoded with orjson. List pages are keyset
+queries, cached per filter, cursor and page size.
+
+    GET /api/v1/interviewers/?technology=&subject=&fields=&limit=&cursor=
+    GET /api/v1/interviewers/<pk>/?fields=
+"""
+
+import orjson
+from django.http import HttpResponse
+from django.urls import reverse
+from django.utils.http import urlencode
+from django.views.decorators.http import require_safe
+
+from dashboard.pagination import decode_cursor
+from interview_service.decorators import conditional_page, public_page
+
+from . import catalog
+from .catalog import catalog_validators, interviewer_validators
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def _photo(interviewer):
+    # Only the uploaded image exists today; resized variants can join it
+    return {"original": interviewer.photo.url} if interviewer.photo else None
+
+
+# Field name -> how to read it from an Interviewer with user, technologies
+# and subjects loaded
+FIELDS = {
+    "id": lambda i: i.pk,
+    "name": lambda i: i.display_name,
+    "bio": lambda i: i.bio,
+    "hourly_rate": lambda i: str(i.hourly_rate),
+    "companies": lambda i: i.company_list,
+    "technologies": lambda i: [{"slug": t.slug, "name": t.name} for t in i.technologies.all()],
+    "subjects": lambda i: [{"slug": s.slug, "name": s.name} for s in i.subjects.all()],
+    "photo": _photo,
+}
+
+
+class JSONResponse(HttpResponse):
+    """A JSON response encoded with orjson, readable from any origin."""
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(orjson.dumps(data), **kwargs)
+        self["Access-Control-Allow-Origin"] = "*"
+
+
+def _error(message, status):
+    return JSONResponse({"error": message}, status=status)
+
+
+def _selected_fields(request):
+    """The requested fields in FIELDS order, or None if any is unknown."""
+    names = request.GET.get("fields")
+    if not names:
+        return list(FIELDS)
+    requested = {name.strip() for name in names.split(",") if name.strip()}
+    if not requested <= FIELDS.keys():
+        return None
+    return [name for name in FIELDS if name in requested]
+
+
+def _serialize(interviewer, fields):
+    return {name: FIELDS[name](interviewer) for name in fields}
+
+
+@require_safe
+@public_page
+@conditional_page(catalog_validators)
+def interviewer_list(request):
+    """One page of active interviewers, newest first."""
+    fields = _selected_fields(request)
+    if fields is None:
+        return _error(f"Unknown field; choose from {', '.join(FIELDS)}", 400)
+    try:
+        limit = min(int(request.GET.get("limit", DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+    except ValueError:
+        return _error("limit must be a number", 400)
+    if limit < 1:
+        return _error("limit must be positive", 400)
+
+    position = None
+    cursor = request.GET.get("cursor")
+    if cursor:
+        position = decode_cursor(cursor)
+        if position is None:
+            return _error("Invalid cursor", 400)
+
+    page, next_cursor = catalog.interviewer_page(
+        request.GET.get("technology"), request.GET.get("subject"), position, limit
+    )
+    next_url = None
+    if next_cursor:
+        query = request.GET.copy()
+        query["cursor"] = next_cursor
+        next_url = f"{reverse('api:interviewer_list')}?{urlencode(query, doseq=True)}"
+
+    return JSONResponse({"results": [_serialize(i, fields) for i in page], "next": next_url})
+
+
+@require_safe
+@public_page
+@conditional_page(interviewer_validators)
+def interviewer_detail(request, pk):
+    """One active interviewer."""
+    fields = _selected_fields(request)
+    if fields is None:
+        return _error(f"Unknown field; choose from {', '.join(FIELDS)}", 400)
+    interviewer = catalog.get_interviewer(pk)
+    if interviewer is None:
+        return _error("Not found", 404)
+    return JSONResponse(_serialize(interviewer, fields))
@@ -0,0 +1,10 @@
+from django.urls import path
+
+from . import api
+
+app_name = "api"
+
+urlpatterns = [
+    path("interviewers/", api.interviewer_list, name="interviewer_list"),
+    path("interviewers/<int:pk>/", api.interviewer_detail, name="interviewer_detail"),
+]
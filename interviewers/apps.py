@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class InterviewersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "interviewers"
+
+    def ready(self):
+        from . import signals  # noqa: F401
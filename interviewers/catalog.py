@@ -0,0 +1,161 @@
+"""
+Change tracking and cached queries for the public catalog.
+
+Interviewer rows carry updated_at, but some changes don't touch it: a
+renamed technology, a deleted interviewer, a user's new name. Every such
+change stamps CATALOG_VERSION_KEY in the shared cache with the time it
+was committed. Together, max(updated_at) and that stamp tell whether
+anything in the catalog changed, without rendering it.
+
+The catalog views read their rows through the functions at the bottom,
+cached per catalog version with single-flight fills, so a change costs one
+set of queries however many workers serve the next requests. Fills read
+from the primary: the version is bumped when the primary commits, and a
+lagging replica would have the old rows cached under the new version.
+"""
+
+
+from datetime import UTC, datetime
+from time import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Max
+
+from dashboard.pagination import encode_cursor, keyset_page
+from interview_service.db_router import route_reads
+from interview_service.page_cache import purge_catalog
+from interview_service.single_flight import get_or_fill
+
+from .models import Interviewer
+from .taxonomy import get_taxonomy
+
+FEATURED_COUNT = 6
+
+CATALOG_VERSION_KEY = "catalog:version"
+
+
+def catalog_version():
+    """Time of the last catalog change, as a Unix timestamp."""
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        # Evicted or never set: treat the catalog as changed just now.
+        # add() keeps whichever worker got there first.
+        cache.add(CATALOG_VERSION_KEY, time(), timeout=None)
+        version = cache.get(CATALOG_VERSION_KEY, time())
+    return version
+
+
+def bump_catalog_version():
+    cache.set(CATALOG_VERSION_KEY, time(), timeout=None)
+
+
+def catalog_changed(interviewer_id=None):
+    """
+    Record a catalog change once the current transaction commits, and
+    refresh the cached and prerendered pages.
+
+    Stamping before the commit would let a request in between pair the new
+    version with the old rows.
+    """
+    transaction.on_commit(bump_catalog_version)
+    purge_catalog(interviewer_id)
+
+
+def catalog_validators(request, *args, **kwargs):
+    """ETag parts and Last-Modified for pages that list interviewers."""
+    updated = Interviewer.objects.aggregate(updated=Max("updated_at"))["updated"]
+    version = catalog_version()
+    last_modified = datetime.fromtimestamp(version, tz=UTC)
+    if updated is not None:
+        last_modified = max(last_modified, updated)
+    return (updated, version), last_modified
+
+
+def interviewer_validators(request, pk):
+    """ETag parts and Last-Modified for one interviewer's detail modal."""
+    updated = Interviewer.objects.filter(pk=pk, is_active=True).values_list("updated_at", flat=True).first()
+    if updated is None:
+        # Let the view answer with its 404
+        return None, None
+    version = catalog_version()
+    return (pk, updated, version), max(updated, datetime.fromtimestamp(version, tz=UTC))
+
+
+def _cached(name, key, fill):
+    def fill_from_primary():
+        with route_reads(use_primary=True):
+            return fill()
+
+    return get_or_fill(
+        f"catalog:{key}",
+        fill_from_primary,
+        settings.CATALOG_CACHE_SECONDS,
+        version=catalog_version(),
+        name=name,
+    )
+
+
+def active_interviewers():
+    # Subjects are only shown in the modal and the API, but cost one query per fill
+    return (
+        Interviewer.objects.filter(is_active=True)
+        .select_related("user")
+        .prefetch_related("technologies", "subjects")
+    )
+
+
+def _filtered(tech_slug, subject_slug):
+    """Active interviewers with the technology and subject slugs, or None if either is unknown."""
+    taxonomy = get_taxonomy()
+    tech_id = taxonomy.technology_ids.get(tech_slug) if tech_slug else None
+    subject_id = taxonomy.subject_ids.get(subject_slug) if subject_slug else None
+    if (tech_slug and tech_id is None) or (subject_slug and subject_id is None):
+        return None
+    interviewers = active_interviewers()
+    if tech_id:
+        interviewers = interviewers.filter(technologies=tech_id)
+    if subject_id:
+        interviewers = interviewers.filter(subjects=subject_id)
+    return interviewers
+
+
+def list_interviewers(tech_slug=None, subject_slug=None):
+    """Active interviewers, optionally filtered by technology and subject slug."""
+    interviewers = _filtered(tech_slug, subject_slug)
+    if interviewers is None:
+        # An unknown slug matches nothing
+        return []
+    return _cached("catalog_list", f"list:{tech_slug or ''}:{subject_slug or ''}", lambda: list(interviewers))
+
+
+def interviewer_page(tech_slug=None, subject_slug=None, position=None, page_size=20):
+    """
+    One page of list_interviewers() newest first, after the decoded cursor
+    `position`, as (interviewers, next cursor). Each page is a keyset query
+    of its own, cached per filters, position and size.
+    """
+    interviewers = _filtered(tech_slug, subject_slug)
+    if interviewers is None:
+        return [], None
+    cursor = encode_cursor(*position) if position else None
+    return _cached(
+        "catalog_page",
+        f"page:{tech_slug or ''}:{subject_slug or ''}:{page_size}:{cursor or ''}",
+        lambda: keyset_page(interviewers, "created_at", cursor=cursor, page_size=page_size),
+    )
+
+
+def featured_interviewers():
+    return _cached("catalog_featured", "featured", lambda: list(active_interviewers()[:FEATURED_COUNT]))
+
+
+def get_interviewer(pk):
+    """The active interviewer `pk`, or None."""
+    return _cached(
+        "catalog_interviewer",
+        f"interviewer:{pk}",
+        lambda: active_interviewers().filter(pk=pk).first(),
+    )
+
@@ -0,0 +1,202 @@
+"""Bulk import of interviewer profiles and taxonomy."""
+
+import csv
+import json
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from django.utils.text import slugify
+
+from .catalog import catalog_changed
+from .models import Interviewer, InterviewSubject, Technology
+from .taxonomy import taxonomy_changed
+
+REQUIRED_FIELDS = ["username", "cal_event_type_id", "hourly_rate"]
+USER_FIELDS = ["email", "first_name", "last_name"]
+PROFILE_FIELDS = ["bio", "cal_event_type_id", "hourly_rate", "companies", "is_active"]
+TRUE_VALUES = {"1", "true", "yes", "y", "t"}
+
+# Separator for list columns (technologies, subjects) in CSV input
+CSV_LIST_SEPARATOR = ";"
+
+
+class RecordError(ValueError):
+    """Raised when an input record cannot be imported."""
+
+
+def read_records(path, fmt=None):
+    """
+    Stream records from a CSV or JSON Lines file.
+
+    Yields (line_number, record) pairs without loading the file into memory.
+    In CSV input, technologies and subjects are ';'-separated names.
+    """
+    fmt = fmt or ("csv" if str(path).endswith(".csv") else "jsonl")
+    with open(path, newline="", encoding="utf-8") as handle:
+        if fmt == "csv":
+            reader = csv.DictReader(handle)
+            for record in reader:
+                for key in ("technologies", "subjects"):
+                    if key in record:
+                        record[key] = [
+                            name.strip()
+                            for name in (record[key] or "").split(CSV_LIST_SEPARATOR)
+                            if name.strip()
+                        ]
+                yield reader.line_num, record
+        else:
+            for number, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield number, json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise RecordError(f"Line {number}: invalid JSON ({e.msg})") from e
+
+
+def _clean(number, record):
+    """Validate one raw record and normalize its values."""
+    missing = [field for field in REQUIRED_FIELDS if not str(record.get(field) or "").strip()]
+    if missing:
+        raise RecordError(f"Line {number}: missing {', '.join(missing)}")
+
+    try:
+        hourly_rate = Decimal(str(record["hourly_rate"]))
+    except InvalidOperation as e:
+        raise RecordError(f"Line {number}: invalid hourly_rate {record['hourly_rate']!r}") from e
+
+    is_active = record.get("is_active", True)
+    if isinstance(is_active, str):
+        is_active = is_active.strip().lower() in TRUE_VALUES if is_active.strip() else True
+
+    companies = record.get("companies") or ""
+    if isinstance(companies, list):
+        companies = ", ".join(companies)
+
+    return {
+        "username": str(record["username"]).strip(),
+        "email": record.get("email") or "",
+        "first_name": record.get("first_name") or "",
+        "last_name": record.get("last_name") or "",
+        "bio": record.get("bio") or "",
+        "cal_event_type_id": str(record["cal_event_type_id"]).strip(),
+        "hourly_rate": hourly_rate,
+        "companies": companies,
+        "is_active": bool(is_active),
+        # None means "leave existing links alone"
+        "technologies": record.get("technologies"),
+        "subjects": record.get("subjects"),
+    }
+
+
+class InterviewerImporter:
+    """
+    Upsert interviewers in batches with a constant number of queries each.
+
+    Users and profiles are upserted with bulk_create(update_conflicts=True);
+    missing technologies and subjects are created in bulk; m2m links are
+    replaced with one delete and one bulk insert per through table.
+    """
+
+    def __init__(self, batch_size=1000):
+        self.batch_size = batch_size
+        # name -> id, shared across batches so known taxonomy costs nothing
+        self.taxonomy_ids = {Technology: {}, InterviewSubject: {}}
+        self.imported = 0
+        self.batches = 0
+
+    def run(self, records):
+        records = iter(records)
+        while batch := list(islice(records, self.batch_size)):
+            self.import_batch([_clean(number, record) for number, record in batch])
+        return self.imported
+
+    @transaction.atomic
+    def import_batch(self, rows):
+        # Later rows win if a username appears twice in one batch
+        rows = list({row["username"]: row for row in rows}.values())
+
+        users = User.objects.bulk_create(
+            [
+                User(
+                    username=row["username"],
+                    password=make_password(None),
+                    **{field: row[field] for field in USER_FIELDS},
+                )
+                for row in rows
+            ],
+            update_conflicts=True,
+            unique_fields=["username"],
+            update_fields=USER_FIELDS,
+        )
+
+        interviewers = Interviewer.objects.bulk_create(
+            [
+                Interviewer(
+                    user_id=user.pk,
+                    **{field: row[field] for field in PROFILE_FIELDS},
+                )
+                for user, row in zip(users, rows)
+            ],
+            update_conflicts=True,
+            unique_fields=["user"],
+            update_fields=PROFILE_FIELDS + ["updated_at"],
+        )
+
+        self._replace_links(Interviewer.technologies, Technology, "technologies", interviewers, rows)
+        self._replace_links(Interviewer.subjects, InterviewSubject, "subjects", interviewers, rows)
+
+        # Signals don't fire for bulk writes
+        catalog_changed()
+
+        self.imported += len(rows)
+        self.batches += 1
+
+    def _taxonomy_ids(self, model, names):
+        """Return a name -> id map for `names`, creating any that are missing."""
+        known = self.taxonomy_ids[model]
+        missing = set(names) - known.keys()
+        if missing:
+            known.update(model.objects.filter(name__in=missing).values_list("name", "id"))
+            new = [model(name=name, slug=slugify(name)) for name in missing - known.keys()]
+            if new:
+                try:
+                    with transaction.atomic():
+                        model.objects.bulk_create(new)
+                except IntegrityError as e:
+                    raise RecordError(
+                        f"Could not create {model._meta.verbose_name_plural} "
+                        f"{sorted(obj.name for obj in new)}: a slug is already taken"
+                    ) from e
+                known.update((obj.name, obj.pk) for obj in new)
+                # Workers keep a snapshot of the taxonomy; without this a new
+                # slug would match nothing until they reload it
+                taxonomy_changed()
+        return known
+
+    def _replace_links(self, descriptor, model, key, interviewers, rows):
+        updates = [
+            (interviewer.pk, row[key])
+            for interviewer, row in zip(interviewers, rows)
+            if row[key] is not None
+        ]
+        if not updates:
+            return
+
+        ids = self._taxonomy_ids(model, {name for _, names in updates for name in names})
+        through = descriptor.through
+        source = f"{descriptor.field.m2m_field_name()}_id"
+        target = f"{descriptor.field.m2m_reverse_field_name()}_id"
+
+        through.objects.filter(**{f"{source}__in": [pk for pk, _ in updates]}).delete()
+        through.objects.bulk_create(
+            [
+                through(**{source: pk, target: ids[name]})
+                for pk, names in updates
+                for name in set(names)
+            ],
+            ignore_conflicts=True,
+        )
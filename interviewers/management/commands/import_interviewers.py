@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from interviewers.importer import InterviewerImporter, RecordError, read_records
+
+
+class Command(BaseCommand):
+    help = (
+        "Import interviewers, their users, technologies and subjects from a CSV "
+        "or JSON Lines file. Existing users (matched by username) are updated."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to a .csv or .jsonl file.")
+        parser.add_argument(
+            "--format",
+            choices=["csv", "jsonl"],
+            help="Input format (defaults to the file extension).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Records upserted per transaction (default: 1000).",
+        )
+
+    def handle(self, *args, path, format=None, batch_size=1000, **options):
+        importer = InterviewerImporter(batch_size=batch_size)
+        try:
+            count = importer.run(read_records(path, format))
+        except (OSError, RecordError) as e:
+            raise CommandError(str(e)) from e
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Imported {count} interviewers in {importer.batches} batches.")
+        )
@@ -0,0 +1,278 @@
+import random
+from contextlib import contextmanager
+from datetime import timedelta
+from decimal import Decimal
+from time import perf_counter
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from bookings.models import Booking, BookingDailyStats
+from interviewers.catalog import catalog_changed
+from interviewers.models import Interviewer, InterviewSubject, Technology
+from interviewers.taxonomy import taxonomy_changed
+
+PREFIX = "scale-"
+
+TECHNOLOGIES = [
+    "Python", "JavaScript", "TypeScript", "React", "Java", "Go", "SQL", "Node.js",
+    "AWS", "Kubernetes", "C++", "C#", "Rust", "Kotlin", "Swift", "Ruby", "Rails",
+    "Django", "FastAPI", "Vue", "Angular", "Next.js", "GraphQL", "PostgreSQL",
+    "Redis", "Kafka", "Spark", "PyTorch", "TensorFlow", "Terraform", "Docker",
+    "Scala", "Elixir", "PHP", "Haskell", "Flutter", "React Native", "GCP", "Azure", "Linux",
+]
+SUBJECTS = [
+    "Frontend", "Backend", "Fullstack", "System Design", "Data Structures & Algorithms",
+    "Machine Learning", "Mobile", "DevOps", "Data Engineering", "Behavioral",
+]
+COMPANIES = [
+    "Google", "Meta", "Amazon", "Apple", "Microsoft", "Stripe", "Netflix", "Airbnb",
+    "Uber", "Shopify", "Datadog", "Cloudflare", "Spotify", "Coinbase", "Startups",
+]
+FIRST_NAMES = ["Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie", "Avery", "Quinn"]
+LAST_NAMES = ["Chen", "Garcia", "Kim", "Nguyen", "Patel", "Smith", "Okafor", "Silva", "Novak", "Sato"]
+RATES = [Decimal(rate) for rate in (60, 80, 100, 120, 150, 180, 200, 250)]
+DURATIONS = ([60] * 8) + [30, 90]
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a production-sized synthetic dataset (interviewers, taxonomy "
+        "links and bookings) with Postgres COPY. Deterministic for a given --seed; "
+        "previously generated rows are replaced."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--interviewers", type=int, default=20_000)
+        parser.add_argument("--bookings", type=int, default=1_000_000)
+        parser.add_argument("--seed", type=int, default=508, help="Random seed (default: 508).")
+
+    def handle(self, *args, interviewers, bookings, seed, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("seed_scale requires PostgreSQL (it loads data with COPY).")
+
+        self.rng = random.Random(seed)
+        self.now = timezone.now().replace(minute=0, second=0, microsecond=0)
+        started = perf_counter()
+
+        with transaction.atomic():
+            # Check foreign keys as rows arrive rather than at commit: Postgres
+            # refuses to build an index while trigger events are pending, and
+            # deferred delete checks would run after indexes were dropped.
+            with connection.cursor() as cursor:
+                cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+                # Index rebuilds over millions of rows outlast the web timeout
+                cursor.execute("SET LOCAL statement_timeout = 0")
+            # Generated rows are replaced on every run
+            self.clear()
+            technology_ids = self.taxonomy(Technology, TECHNOLOGIES)
+            subject_ids = self.taxonomy(InterviewSubject, SUBJECTS)
+            interviewer_rates = self.interviewers(interviewers)
+            self.links(Interviewer.technologies.through, "technology_id", interviewer_rates, technology_ids, 2, 6)
+            self.links(Interviewer.subjects.through, "interviewsubject_id", interviewer_rates, subject_ids, 1, 3)
+            with self.indexes_dropped(Booking):
+                self.bookings(interviewer_rates, bookings)
+            # COPY and bulk writes skip the signals that version the cached
+            # taxonomy and catalog
+            taxonomy_changed()
+            catalog_changed()
+
+        with connection.cursor() as cursor:
+            for model in (User, Interviewer, Booking, Interviewer.technologies.through, Interviewer.subjects.through):
+                cursor.execute(f"ANALYZE {connection.ops.quote_name(model._meta.db_table)}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {interviewers} interviewers and {bookings} bookings "
+                f"in {perf_counter() - started:.1f}s."
+            )
+        )
+
+    def copy(self, model, columns, rows):
+        """Stream `rows` into `model`'s table with COPY ... FROM STDIN."""
+        table = connection.ops.quote_name(model._meta.db_table)
+        column_list = ", ".join(connection.ops.quote_name(column) for column in columns)
+        with connection.cursor() as cursor:
+            with cursor.copy(f"COPY {table} ({column_list}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row(row)
+
+    @contextmanager
+    def indexes_dropped(self, model):
+        """
+        Drop `model`'s secondary indexes for the duration of a bulk load.
+
+        Building each index once over the loaded table is far cheaper than
+        maintaining it row by row. Runs inside the command's transaction,
+        so a failed load never leaves the table without its indexes.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT i.indexname, i.indexdef FROM pg_indexes i
+                JOIN pg_class c ON c.relname = i.indexname
+                JOIN pg_index x ON x.indexrelid = c.oid
+                WHERE i.tablename = %s AND NOT x.indisprimary AND NOT x.indisunique
+                """,
+                [model._meta.db_table],
+            )
+            indexes = cursor.fetchall()
+            for name, _ in indexes:
+                cursor.execute(f"DROP INDEX {connection.ops.quote_name(name)}")
+        yield
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL maintenance_work_mem = '256MB'")
+            for _, definition in indexes:
+                cursor.execute(definition)
+
+    def clear(self):
+        """Delete previously generated rows, children first so deletes stay set-based."""
+        interviewer_ids = Interviewer.objects.filter(user__username__startswith=PREFIX).values("id")
+        for model in (
+            Booking,
+            BookingDailyStats,
+            Interviewer.technologies.through,
+            Interviewer.subjects.through,
+        ):
+            model.objects.filter(interviewer_id__in=interviewer_ids).delete()
+        User.objects.filter(username__startswith=PREFIX).delete()
+
+    def taxonomy(self, model, names):
+        model.objects.bulk_create(
+            [model(name=name, slug=slugify(name)) for name in names],
+            ignore_conflicts=True,
+        )
+        return list(model.objects.filter(name__in=names).order_by("name").values_list("id", flat=True))
+
+    def interviewers(self, count):
+        """Create users and profiles; return [(interviewer_id, hourly_rate)] in creation order."""
+        rng = self.rng
+        self.copy(
+            User,
+            ["username", "email", "first_name", "last_name", "password", "is_staff", "is_active", "is_superuser", "date_joined"],
+            (
+                (
+                    f"{PREFIX}{i}",
+                    f"{PREFIX}{i}@example.com",
+                    rng.choice(FIRST_NAMES),
+                    rng.choice(LAST_NAMES),
+                    "!",  # Unusable password
+                    False,
+                    True,
+                    False,
+                    self.now,
+                )
+                for i in range(count)
+            ),
+        )
+        user_ids = list(
+            User.objects.filter(username__startswith=PREFIX).order_by("id").values_list("id", flat=True)
+        )
+
+        rates = [rng.choice(RATES) for _ in user_ids]
+        self.copy(
+            Interviewer,
+            ["user_id", "bio", "photo", "cal_event_type_id", "hourly_rate", "is_active", "companies", "created_at", "updated_at"],
+            (
+                (
+                    user_id,
+                    "Senior engineer with years of interviewing experience.",
+                    "",
+                    f"{PREFIX}{user_id}/interview",
+                    rate,
+                    rng.random() < 0.9,
+                    ", ".join(rng.sample(COMPANIES, rng.randint(1, 4))),
+                    self.now - timedelta(days=rng.randint(0, 730)),
+                    self.now,
+                )
+                for user_id, rate in zip(user_ids, rates)
+            ),
+        )
+        interviewer_ids = Interviewer.objects.filter(user_id__in=user_ids).order_by("user_id").values_list("id", flat=True)
+        return list(zip(interviewer_ids, rates))
+
+    def links(self, through, target, interviewer_rates, target_ids, low, high):
+        # Popular skills are linked far more often (Zipf-like weights)
+        weights = [1 / (rank + 1) for rank in range(len(target_ids))]
+        rng = self.rng
+
+        def rows():
+            for interviewer_id, _ in interviewer_rates:
+                picked = set(rng.choices(target_ids, weights=weights, k=rng.randint(low, high)))
+                for target_id in picked:
+                    yield interviewer_id, target_id
+
+        self.copy(through, ["interviewer_id", target], rows())
+
+    def bookings(self, interviewer_rates, count):
+        rng = self.rng
+        # A few interviewers take most of the bookings (Pareto popularity)
+        weights = [rng.paretovariate(1.2) for _ in interviewer_rates]
+
+        def status_for(scheduled_at):
+            roll = rng.random()
+            if scheduled_at < self.now:
+                if roll < 0.85:
+                    return Booking.Status.COMPLETED
+                return Booking.Status.CANCELLED if roll < 0.95 else Booking.Status.CONFIRMED
+            if roll < 0.85:
+                return Booking.Status.CONFIRMED
+            return Booking.Status.PENDING if roll < 0.95 else Booking.Status.CANCELLED
+
+        def rows():
+            chunk = 10_000
+            for offset in range(0, count, chunk):
+                for interviewer_id, rate in rng.choices(
+                    interviewer_rates, weights=weights, k=min(chunk, count - offset)
+                ):
+                    # Two years of history and two months ahead, business hours
+                    day = self.now - timedelta(days=rng.randint(-60, 730))
+                    scheduled_at = day.replace(hour=rng.randint(13, 23))
+                    duration = rng.choice(DURATIONS)
+                    created_at = scheduled_at - timedelta(hours=rng.randint(2, 24 * 30))
+                    yield (
+                        interviewer_id,
+                        f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                        f"customer{rng.randrange(count)}@example.com",
+                        "Mid-level engineer preparing for interviews.",
+                        "Mock interview with feedback.",
+                        "",
+                        "",
+                        "",
+                        scheduled_at,
+                        duration,
+                        "",
+                        "",
+                        status_for(scheduled_at),
+                        "",
+                        int(rate * duration * 100 / 60),
+                        min(created_at, self.now),
+                        min(scheduled_at, self.now),
+                    )
+
+        self.copy(
+            Booking,
+            [
+                "interviewer_id",
+                "customer_name",
+                "customer_email",
+                "customer_background",
+                "interview_focus",
+                "target_companies",
+                "additional_info",
+                "resume",
+                "scheduled_at",
+                "duration_minutes",
+                "stripe_payment_intent_id",
+                "stripe_checkout_session_id",
+                "status",
+                "cal_booking_uid",
+                "amount_cents",
+                "created_at",
+                "updated_at",
+            ],
+            rows(),
+        )
@@ -1,7 +1,14 @@
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.files.storage import default_storage, storages
 from django.db import models
 
 
+def public_storage():
+    """The "public" storage if configured (unsigned URLs in production), else the default."""
+    return storages["public"] if "public" in settings.STORAGES else default_storage
+
+
 class Technology(models.Model):
     """Technologies that interviewers are proficient in (React, Python, etc.)"""
 
@@ -34,7 +41,7 @@ class Interviewer(models.Model):
 
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="interviewer")
     bio = models.TextField(help_text="Brief biography and experience")
-    photo = models.ImageField(upload_to="interviewers/", blank=True)
+    photo = models.ImageField(upload_to="interviewers/", storage=public_storage, blank=True)
     cal_event_type_id = models.CharField(
         max_length=100,
         help_text="Cal.com Event Type ID for booking",
@@ -67,6 +74,16 @@ class Interviewer(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Catalog ETags and Last-Modified read max(updated_at)
+            models.Index(fields=["updated_at"], name="interviewer_updated_idx"),
+            # API pages: active interviewers by (created_at, pk) descending
+            models.Index(
+                fields=["-created_at", "-id"],
+                condition=models.Q(is_active=True),
+                name="interviewer_active_created_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.get_full_name() or self.user.username}"
@@ -0,0 +1,44 @@
+"""Keep caches of the public catalog in step with catalog changes."""
+
+from django.contrib.auth.models import User
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .catalog import catalog_changed
+from .models import Interviewer, InterviewSubject, Technology
+from .taxonomy import taxonomy_changed
+
+
+@receiver(post_save, sender=Interviewer)
+@receiver(post_delete, sender=Interviewer)
+def interviewer_changed(sender, instance, **kwargs):
+    catalog_changed(instance.pk)
+
+
+@receiver(m2m_changed, sender=Interviewer.technologies.through)
+@receiver(m2m_changed, sender=Interviewer.subjects.through)
+def interviewer_links_changed(sender, instance, action, reverse, **kwargs):
+    if not action.startswith("post_"):
+        return
+    # From the technology/subject side, `instance` is not an interviewer
+    catalog_changed(None if reverse else instance.pk)
+
+
+@receiver(post_save, sender=Technology)
+@receiver(post_delete, sender=Technology)
+@receiver(post_save, sender=InterviewSubject)
+@receiver(post_delete, sender=InterviewSubject)
+def technology_or_subject_changed(sender, **kwargs):
+    taxonomy_changed()
+    catalog_changed()
+
+
+@receiver(post_save, sender=User)
+def user_changed(sender, instance, created, update_fields=None, **kwargs):
+    # Interviewers are shown under their user's name. Logins only touch
+    # last_login, and a new user has no profile yet.
+    if created or update_fields == frozenset({"last_login"}):
+        return
+    interviewer_id = Interviewer.objects.filter(user=instance).values_list("pk", flat=True).first()
+    if interviewer_id is not None:
+        catalog_changed(interviewer_id)
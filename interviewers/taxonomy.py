@@ -0,0 +1,98 @@
+"""
+A process-local snapshot of the technologies and subjects.
+
+The taxonomy changes a few times a year but is read by every catalog page
+and profile form. Each worker keeps one immutable snapshot of both tables,
+with slug→id maps for filtering, and reloads it when the version stamped in
+the shared cache under TAXONOMY_VERSION_KEY changes. Saving or deleting a
+technology or subject stamps a new version once the transaction commits, so
+every worker picks up the change on its next request. Snapshots are read
+from the primary, since one loaded from a lagging replica would be kept
+under the new version until the next change.
+"""
+
+from dataclasses import dataclass
+from threading import Lock
+from time import time
+from types import MappingProxyType
+
+from django.core.cache import cache
+from django.db import transaction
+
+from interview_service.db_router import PRIMARY
+
+from .models import InterviewSubject, Technology
+
+TAXONOMY_VERSION_KEY = "taxonomy:version"
+
+
+@dataclass(frozen=True)
+class Taxonomy:
+    version: float
+    technologies: tuple
+    subjects: tuple
+    technology_ids: MappingProxyType
+    subject_ids: MappingProxyType
+
+    @classmethod
+    def load(cls, version):
+        technologies = tuple(Technology.objects.using(PRIMARY))
+        subjects = tuple(InterviewSubject.objects.using(PRIMARY))
+        return cls(
+            version=version,
+            technologies=technologies,
+            subjects=subjects,
+            technology_ids=MappingProxyType({t.slug: t.pk for t in technologies}),
+            subject_ids=MappingProxyType({s.slug: s.pk for s in subjects}),
+        )
+
+    def known_technology_ids(self, ids):
+        """The ids in `ids` (e.g. form values) that name a technology."""
+        return _known(ids, self.technology_ids.values())
+
+    def known_subject_ids(self, ids):
+        return _known(ids, self.subject_ids.values())
+
+
+_snapshot = None
+_lock = Lock()
+
+
+def get_taxonomy():
+    """The current snapshot, reloaded if another worker changed the taxonomy."""
+    global _snapshot
+    version = cache.get(TAXONOMY_VERSION_KEY)
+    if version is None:
+        # Evicted or never set; add() keeps whichever worker got there first
+        cache.add(TAXONOMY_VERSION_KEY, time(), timeout=None)
+        version = cache.get(TAXONOMY_VERSION_KEY, 0)
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.version == version:
+        return snapshot
+    with _lock:
+        # Another thread may have loaded it while we waited
+        if _snapshot is None or _snapshot.version != version:
+            _snapshot = Taxonomy.load(version)
+        return _snapshot
+
+
+def bump_taxonomy_version():
+    cache.set(TAXONOMY_VERSION_KEY, time(), timeout=None)
+
+
+def taxonomy_changed():
+    """Have every worker reload the taxonomy once the current transaction commits."""
+    transaction.on_commit(bump_taxonomy_version)
+
+
+def _known(ids, known):
+    known = set(known)
+    result = []
+    for value in ids:
+        try:
+            pk = int(value)
+        except (TypeError, ValueError):
+            continue
+        if pk in known:
+            result.append(pk)
+    return result
@@ -1,24 +1,22 @@
-from django.shortcuts import get_object_or_404, render
+from django.http import Http404
+from django.shortcuts import render
+from django.views.decorators.vary import vary_on_headers
 
-from .models import Interviewer, InterviewSubject, Technology
+from interview_service.decorators import conditional_page, public_page
 
+from . import catalog
+from .catalog import catalog_validators, interviewer_validators
+from .taxonomy import get_taxonomy
 
+
+@public_page
+@vary_on_headers("HX-Request")
+@conditional_page(catalog_validators)
 def interviewer_list(request):
     """List all active interviewers with optional filtering."""
-    interviewers = Interviewer.objects.filter(is_active=True)
-
-    # Filter by technology
     tech_slug = request.GET.get("technology")
-    if tech_slug:
-        interviewers = interviewers.filter(technologies__slug=tech_slug)
-
-    # Filter by subject
     subject_slug = request.GET.get("subject")
-    if subject_slug:
-        interviewers = interviewers.filter(subjects__slug=subject_slug)
-
-    technologies = Technology.objects.all()
-    subjects = InterviewSubject.objects.all()
+    interviewers = catalog.list_interviewers(tech_slug, subject_slug)
 
     # For HTMX partial requests, return just the grid
     if request.headers.get("HX-Request"):
@@ -28,32 +26,38 @@ def interviewer_list(request):
             {"interviewers": interviewers},
         )
 
+    taxonomy = get_taxonomy()
     return render(
         request,
         "interviewers/list.html",
         {
             "interviewers": interviewers,
-            "technologies": technologies,
-            "subjects": subjects,
+            "technologies": taxonomy.technologies,
+            "subjects": taxonomy.subjects,
             "selected_tech": tech_slug,
             "selected_subject": subject_slug,
         },
     )
 
 
+@public_page
+@conditional_page(catalog_validators)
 def featured_interviewers(request):
     """Return featured interviewers for HTMX partial load."""
-    interviewers = Interviewer.objects.filter(is_active=True)[:6]
     return render(
         request,
         "interviewers/partials/grid.html",
-        {"interviewers": interviewers},
+        {"interviewers": catalog.featured_interviewers()},
     )
 
 
+@public_page
+@conditional_page(interviewer_validators)
 def interviewer_detail_modal(request, pk):
     """Return interviewer detail modal for HTMX."""
-    interviewer = get_object_or_404(Interviewer, pk=pk, is_active=True)
+    interviewer = catalog.get_interviewer(pk)
+    if interviewer is None:
+        raise Http404("No Interviewer matches the given query.")
     return render(
         request,
         "interviewers/detail_modal.html",
@@ -7,6 +7,9 @@ import sys
 def main():
     """Run administrative tasks."""
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", "interview_service.settings.dev")
+    # Commands (migrations, rollups, backfills) may legitimately run longer
+    # than a web request; they get their own statement timeout, none by default
+    os.environ["DB_STATEMENT_TIMEOUT_MS"] = os.environ.get("DB_COMMAND_STATEMENT_TIMEOUT_MS", "0")
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
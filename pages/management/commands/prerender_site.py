@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from pages.prerender import prerender_site, watch_catalog
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the homepage, interviewer list, every filtered grid and every "
+        "detail modal to static files for nginx, then switch to the new build."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            help="Output root (default: PRERENDER_ROOT). The build is linked as <output>/current.",
+        )
+        parser.add_argument(
+            "--watch",
+            type=float,
+            metavar="SECONDS",
+            help="Keep running and rebuild whenever the catalog changes, checking this often.",
+        )
+
+    def handle(self, *args, output=None, watch=None, **options):
+        if not (output or settings.PRERENDER_ROOT):
+            raise CommandError("Set PRERENDER_ROOT or pass --output.")
+        if watch:
+            watch_catalog(watch, output)
+            return
+        build, count = prerender_site(output)
+        self.stdout.write(self.style.SUCCESS(f"Prerendered {count} files into {build}."))
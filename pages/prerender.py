@@ -0,0 +1,154 @@
+"""
+Render the public catalog to static files that nginx serves directly.
+
+A build under PRERENDER_ROOT looks like this, with "_" standing for an
+empty filter:
+
+    index.html                              /
+    interviewers/index.html                 /interviewers/
+    interviewers/featured.html              /interviewers/featured/
+    interviewers/grid/<tech>/<subject>.html /interviewers/?technology=&subject= (HTMX)
+    interviewers/<pk>/modal.html            /interviewers/<pk>/modal/
+
+Every build is written to a fresh directory under builds/. The `current`
+symlink is then switched with a single rename, so nginx only ever sees a
+complete build. Anything without a file (a filtered full page, logged-in
+visitors) goes to Django as before.
+
+watch_catalog() rebuilds whenever the catalog version changes. It runs in
+its own process (`prerender_site --watch`), away from the web workers: a
+full build renders every grid and modal.
+"""
+
+import fcntl
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from time import sleep, time
+
+from django.conf import settings
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+
+from interviewers.catalog import catalog_version
+from interviewers.models import Interviewer
+from interviewers.taxonomy import get_taxonomy
+
+logger = logging.getLogger("pages.prerender")
+
+ANY = "_"
+# The previous build stays around for requests that are still reading it
+KEEP_BUILDS = 2
+
+
+def prerender_site(root=None):
+    """Build the catalog and make it current; return (build directory, files written)."""
+    root = Path(root or settings.PRERENDER_ROOT)
+    builds = root / "builds"
+    builds.mkdir(parents=True, exist_ok=True)
+
+    # One build at a time per host, whichever process triggered it
+    with open(root / ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        # Named so that builds sort oldest first
+        build = Path(tempfile.mkdtemp(prefix=f"{datetime.now():%Y%m%d-%H%M%S-%f}-", dir=builds))
+        try:
+            # mkdtemp creates it private; nginx runs as another user
+            build.chmod(0o755)
+            count = render_catalog(build)
+        except BaseException:
+            shutil.rmtree(build, ignore_errors=True)
+            raise
+        _make_current(root / "current", build)
+        _prune(builds, build)
+    return build, count
+
+
+def watch_catalog(interval, root=None):
+    """
+    Build the catalog, then build it again each time the catalog version
+    changes, checking every `interval` seconds. Runs until interrupted.
+    """
+    built = None
+    while True:
+        # Read before building, so a change made during the build is picked
+        # up by the next check
+        version = catalog_version()
+        if version != built:
+            started = time()
+            try:
+                build, count = prerender_site(root)
+            except Exception:
+                logger.exception("Prerendering the catalog failed; keeping the previous build")
+            else:
+                built = version
+                logger.info("Prerendered %d catalog files into %s in %.1fs", count, build, time() - started)
+        sleep(interval)
+
+
+def render_catalog(build):
+    """Write every prerendered page into `build`; return how many files."""
+    factory = RequestFactory()
+    files = {
+        "index.html": _render_view(factory, reverse("pages:home")),
+        "interviewers/index.html": _render_view(factory, reverse("interviewers:list")),
+        "interviewers/featured.html": _render_view(factory, reverse("interviewers:featured"), htmx=True),
+    }
+
+    # One query set for every grid and modal instead of one per page
+    interviewers = list(
+        Interviewer.objects.filter(is_active=True)
+        .select_related("user")
+        .prefetch_related("technologies", "subjects")
+    )
+    request = factory.get(reverse("interviewers:list"))
+    tech_slugs = {i.pk: {t.slug for t in i.technologies.all()} for i in interviewers}
+    subject_slugs = {i.pk: {s.slug for s in i.subjects.all()} for i in interviewers}
+
+    taxonomy = get_taxonomy()
+    for tech in ["", *taxonomy.technology_ids]:
+        for subject in ["", *taxonomy.subject_ids]:
+            matches = [
+                i
+                for i in interviewers
+                if (not tech or tech in tech_slugs[i.pk]) and (not subject or subject in subject_slugs[i.pk])
+            ]
+            files[f"interviewers/grid/{tech or ANY}/{subject or ANY}.html"] = render_to_string(
+                "interviewers/partials/grid.html", {"interviewers": matches}, request
+            )
+
+    for interviewer in interviewers:
+        files[f"interviewers/{interviewer.pk}/modal.html"] = render_to_string(
+            "interviewers/detail_modal.html", {"interviewer": interviewer}, request
+        )
+
+    for name, content in files.items():
+        path = build / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    return len(files)
+
+
+def _render_view(factory, path, htmx=False):
+    # Exactly what an anonymous visitor gets from the live view
+    request = factory.get(path, headers={"HX-Request": "true"} if htmx else {})
+    response = resolve(path).func(request)
+    return response.content.decode(response.charset)
+
+
+def _make_current(link, build):
+    staged = link.with_name(f".{link.name}-{os.getpid()}")
+    staged.unlink(missing_ok=True)
+    # Relative, so the link also resolves where nginx mounts the volume
+    staged.symlink_to(build.relative_to(link.parent))
+    os.replace(staged, link)
+
+
+def _prune(builds, current):
+    old = sorted(path for path in builds.iterdir() if path != current)
+    for path in old[: max(0, len(old) - (KEEP_BUILDS - 1))]:
+        shutil.rmtree(path, ignore_errors=True)
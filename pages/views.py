@@ -1,8 +1,10 @@
 from django.shortcuts import render
 
+from interview_service.decorators import public_page
 from interviewers.models import Interviewer
 
 
+@public_page
 def home(request):
     """Homepage view."""
     featured_interviewers = Interviewer.objects.filter(is_active=True)[:6]
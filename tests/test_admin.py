@@ -0,0 +1,127 @@
+"""Tests for the Django admin at scale."""
+
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from bookings.models import Booking
+from interview_service import pagination
+from tests.factories import BookingFactory, InterviewerFactory
+
+
+@pytest.fixture
+def admin_client(client, db):
+    admin = User.objects.create_superuser("admin", "admin@example.com", "testpass123")
+    client.force_login(admin)
+    return client
+
+
+def bulk_bookings(interviewers, count):
+    """Insert `count` bookings spread across `interviewers` without factories."""
+    now = timezone.now()
+    Booking.objects.bulk_create(
+        (
+            Booking(
+                interviewer=interviewers[i % len(interviewers)],
+                customer_name=f"Customer {i}",
+                customer_email=f"customer{i}@example.com",
+                customer_background="Background",
+                interview_focus="Focus",
+                scheduled_at=now - timedelta(hours=i),
+                status=Booking.Status.CONFIRMED,
+                amount_cents=15000,
+            )
+            for i in range(count)
+        ),
+        batch_size=5000,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {Booking._meta.db_table}")
+
+
+@pytest.mark.django_db
+class TestBookingAdmin:
+    def test_changelist_queries_on_a_large_table(self, admin_client, monkeypatch):
+        # A lower threshold exercises the estimated count without inserting
+        # production-sized data on every run
+        monkeypatch.setattr(pagination, "ESTIMATE_THRESHOLD", 1_000)
+        interviewers = InterviewerFactory.create_batch(3)
+        bulk_bookings(interviewers, 2_000)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = admin_client.get(reverse("admin:bookings_booking_changelist"))
+
+        assert response.status_code == 200
+        # No per-row interviewer/user lookups and no full-table exact count
+        assert len(queries) <= 8
+        assert not any(
+            "COUNT(*)" in q["sql"] and "WHERE" not in q["sql"] for q in queries
+        )
+        assert response.context["cl"].result_count >= 1_000
+
+    def test_interviewer_filter_lists_only_selected(self, admin_client):
+        booking = BookingFactory()
+        other = BookingFactory()
+        response = admin_client.get(
+            reverse("admin:bookings_booking_changelist"),
+            {"interviewer": booking.interviewer_id},
+        )
+        assert response.status_code == 200
+        assert list(response.context["cl"].result_list) == [booking]
+        assert str(other.interviewer).encode() not in response.content
+
+    def test_export_csv_action(self, admin_client):
+        bookings = BookingFactory.create_batch(3)
+        response = admin_client.post(
+            reverse("admin:bookings_booking_changelist"),
+            {"action": "export_csv", "_selected_action": [b.pk for b in bookings[:2]]},
+        )
+        assert response.status_code == 200
+        assert response.streaming
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert len(lines) == 3
+
+    def test_search_by_email_prefix(self, admin_client):
+        booking = BookingFactory(customer_email="jane.doe@example.com")
+        BookingFactory(customer_email="someone@example.com")
+        response = admin_client.get(
+            reverse("admin:bookings_booking_changelist"), {"q": "JANE.DOE"}
+        )
+        assert list(response.context["cl"].result_list) == [booking]
+
+    def test_search_by_interviewer_username(self, admin_client):
+        booking = BookingFactory(interviewer=InterviewerFactory(user__username="janedoe"))
+        BookingFactory(interviewer=InterviewerFactory(user__username="johnsmith"))
+        response = admin_client.get(
+            reverse("admin:bookings_booking_changelist"), {"q": "Jane"}
+        )
+        assert list(response.context["cl"].result_list) == [booking]
+
+
+@pytest.mark.django_db
+class TestInterviewerAdmin:
+    def test_changelist_selects_users(self, admin_client, django_assert_max_num_queries):
+        InterviewerFactory.create_batch(10)
+        with django_assert_max_num_queries(10):
+            response = admin_client.get(reverse("admin:interviewers_interviewer_changelist"))
+        assert response.status_code == 200
+
+    def test_autocomplete_search(self, admin_client):
+        interviewer = InterviewerFactory(user__username="janedoe")
+        InterviewerFactory(user__username="johnsmith")
+        response = admin_client.get(
+            reverse("admin:autocomplete"),
+            {
+                "app_label": "bookings",
+                "model_name": "booking",
+                "field_name": "interviewer",
+                "term": "jane",
+            },
+        )
+        assert response.status_code == 200
+        assert [r["id"] for r in response.json()["results"]] == [str(interviewer.pk)]
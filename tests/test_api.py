@@ -0,0 +1,118 @@
+"""Tests for the read-only JSON catalog API."""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from tests.factories import InterviewerFactory, InterviewSubjectFactory, TechnologyFactory
+
+LIST_URL = "/api/v1/interviewers/"
+
+
+@pytest.fixture
+def roster(db):
+    python = TechnologyFactory(name="Python", slug="python")
+    design = InterviewSubjectFactory(name="System Design", slug="system-design")
+    return [
+        InterviewerFactory(technologies=[python], subjects=[design], companies="Acme, Initech"),
+        InterviewerFactory(),
+        InterviewerFactory(),
+    ]
+
+
+@pytest.mark.django_db
+class TestInterviewerList:
+    def test_lists_active_interviewers_newest_first(self, client, roster):
+        InterviewerFactory(is_active=False)
+
+        response = client.get(LIST_URL)
+
+        assert response["Content-Type"] == "application/json"
+        assert response["Access-Control-Allow-Origin"] == "*"
+        data = response.json()
+        assert [row["id"] for row in data["results"]] == [i.pk for i in reversed(roster)]
+        assert data["next"] is None
+
+    def test_serializes_every_field(self, client, roster):
+        interviewer = roster[0]
+
+        row = client.get(LIST_URL, {"technology": "python"}).json()["results"][0]
+
+        assert row == {
+            "id": interviewer.pk,
+            "name": interviewer.display_name,
+            "bio": interviewer.bio,
+            "hourly_rate": str(interviewer.hourly_rate),
+            "companies": ["Acme", "Initech"],
+            "technologies": [{"slug": "python", "name": "Python"}],
+            "subjects": [{"slug": "system-design", "name": "System Design"}],
+            "photo": None,
+        }
+
+    def test_field_selection(self, client, roster):
+        rows = client.get(LIST_URL, {"fields": "name,id"}).json()["results"]
+
+        assert list(rows[0]) == ["id", "name"]
+
+    def test_unknown_field_is_rejected(self, client, roster):
+        response = client.get(LIST_URL, {"fields": "id,password"})
+
+        assert response.status_code == 400
+        assert "error" in response.json()
+
+    def test_cursor_pagination_walks_the_whole_roster(self, client, roster):
+        seen = []
+        url = f"{LIST_URL}?limit=2&fields=id"
+        while url:
+            data = client.get(url).json()
+            seen += [row["id"] for row in data["results"]]
+            url = data["next"]
+
+        assert seen == [i.pk for i in reversed(roster)]
+
+    def test_pages_are_keyset_queries_not_the_whole_roster(self, client, roster):
+        with CaptureQueriesContext(connection) as queries:
+            client.get(LIST_URL, {"limit": "2"})
+
+        selects = [q["sql"] for q in queries if 'FROM "interviewers_interviewer"' in q["sql"]]
+        assert any("LIMIT 3" in sql for sql in selects)
+
+    def test_unknown_filter_is_an_empty_page(self, client, roster):
+        assert client.get(LIST_URL, {"technology": "cobol"}).json() == {"results": [], "next": None}
+
+    @pytest.mark.parametrize("params", [{"cursor": "garbage"}, {"limit": "x"}, {"limit": "0"}])
+    def test_bad_paging_parameters_are_rejected(self, client, roster, params):
+        assert client.get(LIST_URL, params).status_code == 400
+
+    def test_repeat_request_is_not_modified(self, client, roster, django_assert_num_queries):
+        first = client.get(LIST_URL)
+
+        with django_assert_num_queries(1):
+            response = client.get(LIST_URL, headers={"If-None-Match": first["ETag"]})
+
+        assert response.status_code == 304
+
+    def test_writes_are_not_allowed(self, client, roster):
+        assert client.post(LIST_URL).status_code == 405
+
+
+@pytest.mark.django_db
+class TestInterviewerDetail:
+    def test_returns_one_interviewer(self, client, roster):
+        interviewer = roster[0]
+
+        response = client.get(
+            reverse("api:interviewer_detail", kwargs={"pk": interviewer.pk}), {"fields": "id,technologies"}
+        )
+
+        assert response.json() == {"id": interviewer.pk, "technologies": [{"slug": "python", "name": "Python"}]}
+        assert "ETag" in response
+
+    def test_inactive_interviewer_is_not_found(self, client):
+        interviewer = InterviewerFactory(is_active=False)
+
+        response = client.get(reverse("api:interviewer_detail", kwargs={"pk": interviewer.pk}))
+
+        assert response.status_code == 404
+        assert response.json() == {"error": "Not found"}
@@ -0,0 +1,275 @@
+"""Tests for live booking events over LISTEN/NOTIFY and server-sent events."""
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from asgiref.sync import sync_to_async
+from django.db import connection, connections
+from django.test import AsyncClient
+from django.urls import reverse
+from django.utils import timezone
+
+from bookings import views as booking_views
+from bookings.events import (
+    BOOKING_CHANNEL,
+    CANCELLED,
+    CONFIRMED,
+    BookingEventHub,
+    checkout_key,
+    get_hub,
+    interviewer_key,
+    publish_booking_event,
+    sse_message,
+)
+from bookings.models import Booking
+from bookings.webhooks import handle_checkout_completed
+from tests.factories import BookingFactory
+
+EVENT_TIMEOUT = 5
+
+
+@pytest.fixture(autouse=True)
+def close_async_connections():
+    yield
+    # sync_to_async runs queries on one shared thread; hand its connection
+    # back so the test database can be dropped
+    asyncio.run(sync_to_async(connections.close_all)())
+
+
+def unconnected_hub():
+    """A hub whose listener counts as running, so it never connects."""
+    hub = BookingEventHub()
+    hub._listener = asyncio.get_running_loop().create_future()
+    return hub
+
+
+class TestHub:
+    def test_events_reach_the_interviewer_and_checkout_subscribers(self):
+        async def main():
+            hub = unconnected_hub()
+            async with hub.subscribe(interviewer_key(1)) as dashboard, hub.subscribe(checkout_key("cs_1")) as page:
+                async with hub.subscribe(interviewer_key(2)) as other:
+                    hub.dispatch({"event": CONFIRMED, "interviewer": 1, "checkout_session": "cs_1"})
+                    return dashboard.qsize(), page.qsize(), other.qsize()
+
+        assert asyncio.run(main()) == (1, 1, 0)
+
+    def test_unsubscribed_keys_are_forgotten(self):
+        async def main():
+            hub = unconnected_hub()
+            async with hub.subscribe(interviewer_key(1)):
+                pass
+            return dict(hub._subscribers)
+
+        assert asyncio.run(main()) == {}
+
+    def test_sse_message_spans_lines(self):
+        assert sse_message("booking", "<div>\n</div>") == "event: booking\ndata: <div>\ndata: </div>\n\n"
+
+
+@pytest.mark.django_db(transaction=True)
+class TestNotify:
+    def test_committed_change_reaches_the_listener(self):
+        booking = BookingFactory(stripe_checkout_session_id="cs_test")
+
+        async def main():
+            hub = get_hub()
+            async with hub.subscribe(interviewer_key(booking.interviewer_id)) as queue:
+                await asyncio.wait_for(hub.listening.wait(), EVENT_TIMEOUT)
+                await sync_to_async(handle_checkout_completed)(
+                    {"metadata": {"booking_id": str(booking.pk)}, "payment_intent": "pi_1"}
+                )
+                return await asyncio.wait_for(queue.get(), EVENT_TIMEOUT)
+
+        assert asyncio.run(main()) == {
+            "event": CONFIRMED,
+            "booking": booking.pk,
+            "interviewer": booking.interviewer_id,
+            "checkout_session": "cs_test",
+        }
+
+
+    def test_malformed_payload_does_not_stop_the_listener(self, interviewer):
+        booking = BookingFactory(interviewer=interviewer)
+
+        async def main():
+            hub = BookingEventHub()
+            async with hub.subscribe(interviewer_key(interviewer.pk)) as queue:
+                await asyncio.wait_for(hub.listening.wait(), EVENT_TIMEOUT)
+                await sync_to_async(notify)("not json")
+                await sync_to_async(notify)("[1, 2]")
+                await sync_to_async(publish_booking_event)(booking, CONFIRMED)
+                event = await asyncio.wait_for(queue.get(), EVENT_TIMEOUT)
+                hub._listener.cancel()
+                await asyncio.gather(hub._listener, return_exceptions=True)
+                return event, hub.listening.is_set()
+
+        event, listening = asyncio.run(main())
+
+        assert event["booking"] == booking.pk
+        assert not listening
+
+
+def notify(payload):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_notify(%s, %s)", [BOOKING_CHANNEL, payload])
+
+
+async def next_dashboard_event(user, booking, event):
+    """Open the dashboard stream as `user`, publish `event` and return the message it sends."""
+    client = AsyncClient()
+    await client.aforce_login(user)
+    response = await client.get(reverse("dashboard:booking_events"))
+    stream = aiter(response.streaming_content)
+    first = await anext(stream)
+    await asyncio.wait_for(get_hub().listening.wait(), EVENT_TIMEOUT)
+    await sync_to_async(publish_booking_event)(booking, event)
+    message = await asyncio.wait_for(anext(stream), EVENT_TIMEOUT)
+    await stream.aclose()
+    return response, first, message.decode()
+
+
+@pytest.mark.django_db(transaction=True)
+class TestDashboardStream:
+    def test_confirmed_booking_is_pushed_in_date_order(self, interviewer):
+        now = timezone.now()
+        tomorrow = BookingFactory(interviewer=interviewer, scheduled_at=now + timedelta(days=1))
+        later = BookingFactory(interviewer=interviewer, scheduled_at=now + timedelta(days=21))
+
+        response, first, message = asyncio.run(next_dashboard_event(interviewer.user, later, CONFIRMED))
+
+        assert response["Content-Type"] == "text/event-stream"
+        assert first.startswith(b"retry:")
+        assert message.startswith("event: booking\n")
+        assert 'id="upcoming-bookings" hx-swap-oob="true"' in message
+        assert message.index(f'id="booking-{tomorrow.pk}"') < message.index(f'id="booking-{later.pk}"')
+
+    def test_cancelling_the_last_booking_shows_the_empty_list(self, interviewer):
+        booking = BookingFactory(interviewer=interviewer, status=Booking.Status.CANCELLED)
+
+        _, _, message = asyncio.run(next_dashboard_event(interviewer.user, booking, CANCELLED))
+
+        assert f'id="booking-{booking.pk}"' not in message
+        assert "No upcoming interviews scheduled." in message
+
+
+@pytest.mark.django_db
+class TestDashboardStreamFallback:
+    def test_wsgi_request_stops_the_event_source(self, client_with_interviewer):
+        response = client_with_interviewer.get(reverse("dashboard:booking_events"))
+
+        assert response.status_code == 204
+
+    def test_requires_login(self, client):
+        response = client.get(reverse("dashboard:booking_events"))
+
+        assert response.status_code == 302
+
+    def test_dashboard_cards_have_ids_to_swap(self, client_with_interviewer, interviewer):
+        booking = BookingFactory(interviewer=interviewer, scheduled_at=timezone.now() + timedelta(days=1))
+
+        response = client_with_interviewer.get(reverse("dashboard:home"))
+
+        assert f'id="booking-{booking.pk}"'.encode() in response.content
+        assert reverse("dashboard:booking_events").encode() in response.content
+
+
+async def open_stream(url, user=None):
+    """GET an event stream over ASGI; return the response and its iterator past the retry line."""
+    client = AsyncClient()
+    if user is not None:
+        await client.aforce_login(user)
+    response = await client.get(url)
+    stream = aiter(response.streaming_content)
+    await anext(stream)
+    return response, stream
+
+
+@pytest.mark.django_db(transaction=True)
+class TestCheckoutStatusStream:
+    def status_url(self, session_id):
+        return f"{reverse('bookings:checkout_status')}?session_id={session_id}"
+
+    def test_webhook_flips_the_page_to_confirmed(self):
+        booking = BookingFactory(stripe_checkout_session_id="cs_live", status=Booking.Status.PENDING)
+
+        async def main():
+            response, stream = await open_stream(self.status_url("cs_live"))
+            await asyncio.wait_for(get_hub().listening.wait(), EVENT_TIMEOUT)
+            await sync_to_async(handle_checkout_completed)({"metadata": {"booking_id": str(booking.pk)}})
+            message = await asyncio.wait_for(anext(stream), EVENT_TIMEOUT)
+            await stream.aclose()
+            return message
+
+        message = asyncio.run(main())
+
+        assert message.startswith(b"event: status\n")
+        assert b"Booking Confirmed!" in message
+
+    def test_booking_confirmed_before_subscribing_is_sent_at_once(self):
+        BookingFactory(stripe_checkout_session_id="cs_done", status=Booking.Status.CONFIRMED)
+
+        async def main():
+            response, stream = await open_stream(self.status_url("cs_done"))
+            message = await asyncio.wait_for(anext(stream), EVENT_TIMEOUT)
+            await stream.aclose()
+            return message
+
+        assert b"Booking Confirmed!" in asyncio.run(main())
+
+    def test_cancelled_checkout_shows_the_cancellation_and_ends(self):
+        booking = BookingFactory(stripe_checkout_session_id="cs_cancel", status=Booking.Status.PENDING)
+
+        async def main():
+            response, stream = await open_stream(self.status_url("cs_cancel"))
+            await asyncio.wait_for(get_hub().listening.wait(), EVENT_TIMEOUT)
+            await sync_to_async(publish_booking_event)(booking, CANCELLED)
+            message = await asyncio.wait_for(anext(stream), EVENT_TIMEOUT)
+            rest = [chunk async for chunk in stream]
+            return message, rest
+
+        message, rest = asyncio.run(main())
+
+        assert message.startswith(b"event: status\n")
+        assert b"Booking Cancelled" in message
+        assert rest == []
+
+    @pytest.mark.parametrize("session_id", ["cs_unknown", ""])
+    def test_unknown_session_is_not_found(self, client, session_id):
+        BookingFactory(stripe_checkout_session_id="")
+
+        assert client.get(self.status_url(session_id)).status_code == 404
+
+
+@pytest.mark.django_db
+class TestSuccessPage:
+    def get(self, client, monkeypatch, booking):
+        session = SimpleNamespace(metadata={"booking_id": str(booking.pk)})
+        monkeypatch.setattr(booking_views, "retrieve_checkout_session", lambda session_id: session)
+        return client.get(reverse("bookings:success"), {"session_id": "cs_test"})
+
+    def test_pending_booking_subscribes_to_its_status(self, client, monkeypatch, booking):
+        booking.status = Booking.Status.PENDING
+        booking.save()
+
+        response = self.get(client, monkeypatch, booking)
+
+        assert b"Payment Received" in response.content
+        assert reverse("bookings:checkout_status").encode() in response.content
+
+    def test_cancelled_booking_does_not_subscribe(self, client, monkeypatch, booking):
+        booking.status = Booking.Status.CANCELLED
+        booking.save()
+
+        response = self.get(client, monkeypatch, booking)
+
+        assert b"Booking Cancelled" in response.content
+        assert reverse("bookings:checkout_status").encode() not in response.content
+
+    def test_confirmed_booking_does_not_subscribe(self, client, monkeypatch, booking):
+        response = self.get(client, monkeypatch, booking)
+
+        assert b"Booking Confirmed!" in response.content
+        assert b"EventSource" not in response.content
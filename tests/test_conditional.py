@@ -0,0 +1,160 @@
+"""Tests for ETag and Last-Modified on the catalog and dashboard pages."""
+
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from tests.factories import BookingFactory, InterviewerFactory, TechnologyFactory
+
+
+@pytest.fixture
+def client_with_interviewer(client_with_interviewer):
+    """The logged-in client once it holds a CSRF cookie, as after any page view."""
+    client_with_interviewer.get(reverse("pages:home"))
+    return client_with_interviewer
+
+
+def revalidate(client, url, response, **headers):
+    return client.get(url, headers={"If-None-Match": response["ETag"], **headers})
+
+
+@pytest.mark.django_db
+class TestCatalogValidators:
+    @pytest.mark.parametrize("page", ["interviewers:list", "interviewers:featured"])
+    def test_repeat_request_is_not_modified(self, client, page):
+        InterviewerFactory()
+        url = reverse(page)
+        first = client.get(url)
+
+        response = revalidate(client, url, first)
+
+        assert response.status_code == 304
+        assert response["ETag"] == first["ETag"]
+        assert "Last-Modified" in first
+        # nginx may keep revalidating its copy
+        assert "public" in response["Cache-Control"]
+
+    def test_not_modified_costs_one_query(self, client, django_assert_num_queries):
+        InterviewerFactory()
+        url = reverse("interviewers:list")
+        first = client.get(url)
+
+        with django_assert_num_queries(1):
+            response = revalidate(client, url, first)
+
+        assert response.status_code == 304
+
+    def test_if_modified_since_alone_is_honoured(self, client):
+        InterviewerFactory()
+        url = reverse("interviewers:list")
+        first = client.get(url)
+
+        response = client.get(url, headers={"If-Modified-Since": first["Last-Modified"]})
+
+        assert response.status_code == 304
+
+    def test_interviewer_update_changes_the_etag(self, client):
+        interviewer = InterviewerFactory()
+        url = reverse("interviewers:list")
+        first = client.get(url)
+
+        interviewer.bio = "Updated"
+        interviewer.save()
+
+        assert revalidate(client, url, first).status_code == 200
+
+    def test_taxonomy_change_changes_the_etag(self, client, django_capture_on_commit_callbacks):
+        InterviewerFactory()
+        url = reverse("interviewers:list")
+        first = client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            TechnologyFactory()
+
+        assert revalidate(client, url, first).status_code == 200
+
+    def test_partial_and_full_page_have_different_etags(self, client):
+        InterviewerFactory()
+        url = reverse("interviewers:list")
+
+        page = client.get(url)
+        partial = client.get(url, headers={"HX-Request": "true"})
+
+        assert page["ETag"] != partial["ETag"]
+        assert revalidate(client, url, page, hx_request="true").status_code == 200
+
+    def test_logging_in_changes_the_etag(self, client, interviewer):
+        url = reverse("interviewers:list")
+        anonymous = client.get(url)
+
+        client.force_login(interviewer.user)
+
+        assert revalidate(client, url, anonymous).status_code == 200
+
+
+@pytest.mark.django_db
+class TestDetailModalValidators:
+    def test_repeat_request_is_not_modified_until_the_interviewer_changes(self, client):
+        interviewer = InterviewerFactory()
+        url = reverse("interviewers:detail_modal", kwargs={"pk": interviewer.pk})
+        first = client.get(url)
+
+        assert revalidate(client, url, first).status_code == 304
+
+        interviewer.user.first_name = "Renamed"
+        interviewer.user.save()
+        interviewer.save()
+
+        assert revalidate(client, url, first).status_code == 200
+
+    def test_inactive_interviewer_is_still_a_404(self, client):
+        interviewer = InterviewerFactory(is_active=False)
+
+        response = client.get(reverse("interviewers:detail_modal", kwargs={"pk": interviewer.pk}))
+
+        assert response.status_code == 404
+        assert "ETag" not in response
+
+
+@pytest.mark.django_db
+class TestDashboardValidators:
+    def test_repeat_request_is_not_modified(self, client_with_interviewer, booking):
+        url = reverse("dashboard:home")
+        first = client_with_interviewer.get(url)
+
+        response = revalidate(client_with_interviewer, url, first)
+
+        assert response.status_code == 304
+        assert "private" in first["Cache-Control"]
+
+    def test_new_booking_changes_the_etag(self, client_with_interviewer, interviewer):
+        url = reverse("dashboard:home")
+        first = client_with_interviewer.get(url)
+
+        BookingFactory(interviewer=interviewer, scheduled_at=timezone.now() + timedelta(days=2))
+
+        assert revalidate(client_with_interviewer, url, first).status_code == 200
+
+    def test_booking_status_change_changes_the_etag(self, client_with_interviewer, booking):
+        url = reverse("dashboard:home")
+        first = client_with_interviewer.get(url)
+
+        booking.status = booking.Status.CANCELLED
+        booking.save()
+
+        assert revalidate(client_with_interviewer, url, first).status_code == 200
+
+    def test_no_etag_while_the_csrf_token_is_being_issued(self, client, interviewer):
+        client.force_login(interviewer.user)
+
+        response = client.get(reverse("dashboard:home"))
+
+        assert response.status_code == 200
+        assert "ETag" not in response
+
+    def test_user_without_profile_is_still_redirected(self, client_with_user):
+        response = client_with_user.get(reverse("dashboard:home"))
+
+        assert response.status_code == 302
@@ -0,0 +1,114 @@
+"""Tests for read-replica routing and read-your-writes stickiness."""
+
+from time import time
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import reverse
+
+from interview_service import db_router, middleware
+from interview_service.db_router import PrimaryReplicaRouter, replica_databases, route_reads
+from interview_service.middleware import PIN_PRIMARY_COOKIE, ReplicaRoutingMiddleware
+from interviewers.models import Interviewer
+
+router = PrimaryReplicaRouter()
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    def aliases():
+        return ["replica_1"]
+
+    monkeypatch.setattr(db_router, "replica_aliases", aliases)
+    monkeypatch.setattr(middleware, "replica_aliases", aliases)
+
+
+def routed_view(write=False):
+    """A view that reports where its reads went, optionally writing first."""
+
+    def view(request):
+        if write:
+            router.db_for_write(Interviewer)
+        return HttpResponse(router.db_for_read(Interviewer))
+
+    return ReplicaRoutingMiddleware(view)
+
+
+class TestReplicaDatabases:
+    def test_replicas_copy_the_primary_and_mirror_it_under_test(self):
+        primary = {"NAME": "app", "HOST": "db", "PORT": "5432"}
+
+        replicas = replica_databases(primary, ["replica-a", "replica-b:5433"])
+
+        assert replicas == {
+            "replica_1": {"NAME": "app", "HOST": "replica-a", "PORT": "5432", "TEST": {"MIRROR": "default"}},
+            "replica_2": {"NAME": "app", "HOST": "replica-b", "PORT": "5433", "TEST": {"MIRROR": "default"}},
+        }
+
+
+class TestRouter:
+    def test_reads_outside_requests_use_the_primary(self, replica):
+        assert router.db_for_read(Interviewer) == "default"
+
+    def test_reads_use_a_replica_until_the_first_write(self, replica):
+        with route_reads(use_primary=False) as state:
+            assert router.db_for_read(Interviewer) == "replica_1"
+            assert router.db_for_write(Interviewer) == "default"
+            assert router.db_for_read(Interviewer) == "default"
+        assert state.wrote
+
+    def test_sessions_are_always_read_from_the_primary(self, replica):
+        from django.contrib.sessions.models import Session
+
+        with route_reads(use_primary=False):
+            assert router.db_for_read(Session) == "default"
+
+    def test_without_replicas_reads_use_the_primary(self):
+        with route_reads(use_primary=False):
+            assert router.db_for_read(Interviewer) == "default"
+
+    def test_replicas_are_never_migrated(self, replica):
+        assert router.allow_migrate("replica_1", "interviewers") is False
+        assert router.allow_migrate("default", "interviewers") is None
+
+
+class TestReplicaRoutingMiddleware:
+    def test_get_reads_from_a_replica(self, replica):
+        response = routed_view()(RequestFactory().get("/"))
+
+        assert response.content == b"replica_1"
+        assert PIN_PRIMARY_COOKIE not in response.cookies
+
+    def test_post_reads_from_the_primary(self, replica):
+        response = routed_view()(RequestFactory().post("/"))
+
+        assert response.content == b"default"
+
+    def test_write_pins_the_client_to_the_primary(self, replica, settings):
+        response = routed_view(write=True)(RequestFactory().post("/"))
+
+        cookie = response.cookies[PIN_PRIMARY_COOKIE]
+        assert cookie["max-age"] == settings.DB_REPLICA_PIN_SECONDS
+        request = RequestFactory().get("/")
+        request.COOKIES[PIN_PRIMARY_COOKIE] = cookie.value
+        assert routed_view()(request).content == b"default"
+
+    def test_expired_pin_reads_from_a_replica(self, replica):
+        request = RequestFactory().get("/")
+        request.COOKIES[PIN_PRIMARY_COOKIE] = str(int(time()) - 1)
+
+        assert routed_view()(request).content == b"replica_1"
+
+    def test_no_pin_cookie_without_replicas(self):
+        response = routed_view(write=True)(RequestFactory().post("/"))
+
+        assert PIN_PRIMARY_COOKIE not in response.cookies
+
+    @pytest.mark.django_db
+    def test_profile_edit_pins_the_interviewer(self, client, interviewer, replica):
+        client.force_login(interviewer.user)
+
+        response = client.post(reverse("dashboard:profile"), {"bio": "Updated"})
+
+        assert PIN_PRIMARY_COOKIE in response.cookies
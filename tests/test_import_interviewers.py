@@ -0,0 +1,131 @@
+"""Tests for the import_interviewers management command."""
+
+import json
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from interviewers.catalog import list_interviewers
+from interviewers.importer import InterviewerImporter
+from interviewers.models import Interviewer, Technology
+from tests.factories import InterviewerFactory, InterviewSubjectFactory, TechnologyFactory
+
+CSV_HEADER = (
+    "username,email,first_name,last_name,bio,cal_event_type_id,hourly_rate,"
+    "companies,is_active,technologies,subjects\n"
+)
+
+
+def write_csv(tmp_path, rows):
+    path = tmp_path / "interviewers.csv"
+    path.write_text(CSV_HEADER + "".join(rows))
+    return path
+
+
+def make_records(count, technologies=("Python", "Go"), subjects=("Backend",)):
+    return [
+        (
+            i + 1,
+            {
+                "username": f"member{i}",
+                "email": f"member{i}@example.com",
+                "first_name": "Member",
+                "last_name": str(i),
+                "bio": "Engineer",
+                "cal_event_type_id": f"member-{i}/interview",
+                "hourly_rate": "120.00",
+                "technologies": list(technologies),
+                "subjects": list(subjects),
+            },
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.django_db
+class TestImportInterviewers:
+    def test_import_csv_creates_profiles_and_taxonomy(self, tmp_path):
+        path = write_csv(
+            tmp_path,
+            [
+                'jane,jane@example.com,Jane,Doe,Bio,jane/interview,150.00,"Google, Meta",true,Python;React,System Design\n',
+                "john,john@example.com,John,Roe,Bio,john/interview,99.50,,false,Python,\n",
+            ],
+        )
+        out = StringIO()
+        call_command("import_interviewers", str(path), stdout=out)
+
+        assert "Imported 2 interviewers" in out.getvalue()
+        jane = Interviewer.objects.get(user__username="jane")
+        assert jane.display_name == "Jane Doe"
+        assert jane.company_list == ["Google", "Meta"]
+        assert sorted(t.slug for t in jane.technologies.all()) == ["python", "react"]
+        assert [s.slug for s in jane.subjects.all()] == ["system-design"]
+        john = Interviewer.objects.get(user__username="john")
+        assert john.hourly_rate == Decimal("99.50")
+        assert not john.is_active
+        assert not john.user.has_usable_password()
+        assert Technology.objects.filter(name="Python").count() == 1
+
+    def test_reimport_updates_and_replaces_links(self, tmp_path):
+        existing = InterviewerFactory(
+            user__username="jane",
+            technologies=[TechnologyFactory(name="Rust", slug="rust")],
+        )
+        path = write_csv(
+            tmp_path,
+            ["jane,jane@new.com,Jane,Doe,New bio,jane/interview,200,,true,Python,\n"],
+        )
+        call_command("import_interviewers", str(path), stdout=StringIO())
+
+        existing.refresh_from_db()
+        assert Interviewer.objects.count() == 1
+        assert existing.bio == "New bio"
+        assert existing.hourly_rate == Decimal("200")
+        assert existing.user.email == "jane@new.com"
+        assert [t.name for t in existing.technologies.all()] == ["Python"]
+
+    def test_import_json_lines(self, tmp_path):
+        path = tmp_path / "interviewers.jsonl"
+        path.write_text(
+            "\n".join(json.dumps(record) for _, record in make_records(3)) + "\n"
+        )
+        call_command("import_interviewers", str(path), stdout=StringIO())
+        assert Interviewer.objects.count() == 3
+        assert Interviewer.objects.filter(technologies__slug="go").count() == 3
+
+    def test_new_technologies_can_be_filtered_on(self, django_capture_on_commit_callbacks):
+        # Loads the taxonomy snapshot before the import
+        assert list_interviewers(tech_slug="elixir") == []
+
+        with django_capture_on_commit_callbacks(execute=True):
+            InterviewerImporter().run(make_records(2, technologies=("Elixir",)))
+
+        assert len(list_interviewers(tech_slug="elixir")) == 2
+
+    def test_queries_per_batch_are_constant(self):
+        TechnologyFactory(name="Python", slug="python")
+        TechnologyFactory(name="Go", slug="go")
+        InterviewSubjectFactory(name="Backend", slug="backend")
+
+        def batch_queries(count):
+            with CaptureQueriesContext(connection) as queries:
+                InterviewerImporter(batch_size=count).run(make_records(count))
+            return len(queries)
+
+        assert batch_queries(5) == batch_queries(50)
+
+    def test_invalid_rate_raises_command_error(self, tmp_path):
+        path = write_csv(tmp_path, ["jane,,,,,jane/interview,lots,,,,\n"])
+        with pytest.raises(CommandError, match="Line 2: invalid hourly_rate"):
+            call_command("import_interviewers", str(path), stdout=StringIO())
+        assert not Interviewer.objects.exists()
+
+    def test_missing_required_field_raises_command_error(self, tmp_path):
+        path = write_csv(tmp_path, ["jane,,,,,,150,,,,\n"])
+        with pytest.raises(CommandError, match="missing cal_event_type_id"):
+            call_command("import_interviewers", str(path), stdout=StringIO())
@@ -0,0 +1,57 @@
+"""Tests for shedding catalog traffic while requests queue for a worker."""
+
+from time import time
+
+import pytest
+from django.urls import reverse
+from prometheus_client import REGISTRY
+
+
+def shed():
+    return REGISTRY.get_sample_value("load_shed_requests_total") or 0
+
+
+def queued_for(seconds):
+    return {"X-Request-Start": f"t={time() - seconds:.3f}"}
+
+
+@pytest.fixture
+def shedding(settings):
+    settings.LOAD_SHED_QUEUE_MS = 500
+    settings.LOAD_SHED_RETRY_AFTER = 7
+
+
+@pytest.mark.django_db
+class TestLoadShedding:
+    @pytest.mark.parametrize("url", ["/", "/interviewers/", "/api/v1/interviewers/"])
+    def test_catalog_is_shed_when_requests_queue(self, client, shedding, url):
+        before = shed()
+
+        response = client.get(url, headers=queued_for(2))
+
+        assert response.status_code == 503
+        assert response["Retry-After"] == "7"
+        assert shed() == before + 1
+
+    def test_catalog_is_served_when_requests_do_not_queue(self, client, shedding):
+        assert client.get("/interviewers/", headers=queued_for(0.1)).status_code == 200
+
+    def test_payment_routes_are_never_shed(self, client, shedding):
+        response = client.post(reverse("bookings:stripe_webhook"), headers=queued_for(2))
+
+        # Rejected by the signature check, not by the load shedder
+        assert response.status_code == 400
+
+    def test_dashboard_is_never_shed(self, client_with_user, shedding):
+        response = client_with_user.get(reverse("dashboard:home"), headers=queued_for(2))
+
+        assert response.status_code != 503
+
+    @pytest.mark.parametrize("header", [None, "garbage", "t="])
+    def test_requests_without_a_start_time_are_served(self, client, shedding, header):
+        headers = {"X-Request-Start": header} if header is not None else {}
+
+        assert client.get("/interviewers/", headers=headers).status_code == 200
+
+    def test_off_by_default(self, client):
+        assert client.get("/interviewers/", headers=queued_for(60)).status_code == 200
@@ -0,0 +1,213 @@
+"""Tests for the Prometheus metrics."""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, connections
+from django.urls import reverse
+from prometheus_client import REGISTRY
+
+from bookings.models import Booking
+from bookings.stripe import retrieve_checkout_session
+from interview_service.metrics import record_pool_stats
+from tests.factories import BookingFactory, InterviewerFactory
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.mark.django_db
+class TestRequestMetrics:
+    def test_request_latency_and_queries_by_view(self, client):
+        InterviewerFactory()
+        before = sample("django_request_duration_seconds_count", view="interviewers:list", method="GET")
+        queries_before = sample("django_request_db_queries_sum", view="interviewers:list")
+
+        client.get(reverse("interviewers:list"))
+
+        assert sample("django_request_duration_seconds_count", view="interviewers:list", method="GET") == before + 1
+        assert sample("django_request_db_queries_sum", view="interviewers:list") > queries_before
+
+    def test_unresolved_paths_share_a_label(self, client):
+        before = sample("django_requests_total", view="<unresolved>", method="GET", status="404")
+
+        client.get("/no-such-page/")
+        client.get("/another-missing-page/")
+
+        assert sample("django_requests_total", view="<unresolved>", method="GET", status="404") == before + 2
+
+    def test_metrics_endpoint(self, client):
+        client.get(reverse("pages:home"))
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain")
+        assert b'django_request_duration_seconds_bucket{le="0.005",method="GET",view="pages:home"}' in response.content
+
+
+class TestMetricsAccess:
+    def test_other_addresses_are_refused(self, client):
+        assert client.get("/metrics", REMOTE_ADDR="203.0.113.1").status_code == 403
+
+    def test_allowed_network(self, client, settings):
+        settings.METRICS_ALLOWED_IPS = ["172.16.0.0/12"]
+
+        assert client.get("/metrics", REMOTE_ADDR="172.18.0.5").status_code == 200
+
+    def test_requests_through_nginx_need_the_token(self, client, settings):
+        settings.METRICS_TOKEN = "s3cret"
+
+        assert client.get("/metrics", headers={"X-Real-IP": "203.0.113.1"}).status_code == 403
+        response = client.get(
+            "/metrics",
+            REMOTE_ADDR="203.0.113.1",
+            headers={"X-Real-IP": "203.0.113.1", "Authorization": "Bearer s3cret"},
+        )
+        assert response.status_code == 200
+
+    def test_wrong_token_is_refused(self, client, settings):
+        settings.METRICS_TOKEN = "s3cret"
+
+        response = client.get("/metrics", REMOTE_ADDR="203.0.113.1", headers={"Authorization": "Bearer nope"})
+
+        assert response.status_code == 403
+
+
+class TestExternalCallMetrics:
+    def test_stripe_latency_and_errors(self):
+        labels = {"service": "stripe", "operation": "checkout.session.retrieve"}
+        calls_before = sample("external_call_duration_seconds_count", **labels)
+        errors_before = sample("external_call_errors_total", error="RuntimeError", **labels)
+
+        with patch("stripe.checkout.Session.retrieve", side_effect=RuntimeError):
+            with pytest.raises(RuntimeError):
+                retrieve_checkout_session("cs_test")
+
+        assert sample("external_call_duration_seconds_count", **labels) == calls_before + 1
+        assert sample("external_call_errors_total", error="RuntimeError", **labels) == errors_before + 1
+
+    @pytest.mark.django_db
+    def test_smtp_latency(self):
+        from bookings.emails import send_customer_confirmation
+
+        booking = BookingFactory()
+        before = sample("external_call_duration_seconds_count", service="smtp", operation="send_mail")
+
+        send_customer_confirmation(booking)
+
+        assert sample("external_call_duration_seconds_count", service="smtp", operation="send_mail") == before + 1
+
+    @pytest.mark.django_db
+    def test_smtp_errors_are_counted_without_failing_the_booking(self, settings):
+        from bookings.emails import send_customer_confirmation
+
+        # Nothing listens on port 1, so the connection is refused
+        settings.EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+        settings.EMAIL_HOST = "127.0.0.1"
+        settings.EMAIL_PORT = 1
+        settings.EMAIL_TIMEOUT = 1
+        labels = {"service": "smtp", "operation": "send_mail", "error": "ConnectionRefusedError"}
+        before = sample("external_call_errors_total", **labels)
+
+        send_customer_confirmation(BookingFactory())
+
+        assert sample("external_call_errors_total", **labels) == before + 1
+
+
+class TestCacheMetrics:
+    def test_hits_and_misses_are_counted(self):
+        hits = sample("cache_requests_total", cache="default", result="hit")
+        misses = sample("cache_requests_total", cache="default", result="miss")
+
+        cache.set("metrics-test", 1)
+        assert cache.get("metrics-test") == 1
+        assert cache.get("metrics-test-missing", "fallback") == "fallback"
+        assert cache.get_many(["metrics-test", "metrics-test-missing"]) == {"metrics-test": 1}
+
+        assert sample("cache_requests_total", cache="default", result="hit") == hits + 2
+        assert sample("cache_requests_total", cache="default", result="miss") == misses + 2
+
+
+@pytest.mark.django_db
+class TestWebhookLag:
+    @patch("bookings.webhooks.send_interviewer_notification")
+    @patch("bookings.webhooks.send_customer_confirmation")
+    @patch("stripe.Webhook.construct_event")
+    def test_lag_is_observed(self, mock_construct_event, mock_customer_email, mock_interviewer_email, client):
+        booking = BookingFactory(status=Booking.Status.PENDING)
+        mock_construct_event.return_value = {
+            "type": "checkout.session.completed",
+            "created": int(time.time()) - 120,
+            "data": {"object": {"payment_intent": "pi_1", "metadata": {"booking_id": str(booking.id)}}},
+        }
+        labels = {"event_type": "checkout.session.completed"}
+        count = sample("stripe_webhook_lag_seconds_count", **labels)
+        total = sample("stripe_webhook_lag_seconds_sum", **labels)
+
+        client.post(
+            reverse("bookings:stripe_webhook"),
+            data=json.dumps({}),
+            content_type="application/json",
+            HTTP_STRIPE_SIGNATURE="sig",
+        )
+
+        assert sample("stripe_webhook_lag_seconds_count", **labels) == count + 1
+        assert sample("stripe_webhook_lag_seconds_sum", **labels) - total >= 120
+
+
+@pytest.mark.django_db
+class TestConnectionPool:
+    def test_connections_are_pooled_with_a_statement_timeout(self):
+        assert connection.pool is not None
+        with connection.cursor() as cursor:
+            cursor.execute("SHOW statement_timeout")
+            (timeout,) = cursor.fetchone()
+
+        assert timeout == f"{settings.DB_STATEMENT_TIMEOUT_MS // 1000}s"
+
+    def test_management_commands_have_their_own_statement_timeout(self):
+        def command_timeout(**env):
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    "manage.py",
+                    "shell",
+                    "-c",
+                    "from django.conf import settings; print(settings.DB_STATEMENT_TIMEOUT_MS)",
+                ],
+                cwd=settings.BASE_DIR,
+                env={**os.environ, "DB_STATEMENT_TIMEOUT_MS": "30000", **env},
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            return int(result.stdout.split()[-1])
+
+        assert command_timeout() == 0
+        assert command_timeout(DB_COMMAND_STATEMENT_TIMEOUT_MS="600000") == 600000
+
+    def test_pool_stats_are_exported(self):
+        connection.ensure_connection()
+        requests = sample("db_pool_requests_total", alias="default")
+
+        record_pool_stats()
+
+        assert sample("db_pool_connections_max", alias="default") == settings.DB_POOL["max_size"]
+        assert sample("db_pool_connections", alias="default") >= 1
+        assert sample("db_pool_requests_total", alias="default") >= requests
+
+    def test_unused_databases_get_no_pool(self, monkeypatch):
+        monkeypatch.setitem(connections.settings, "unused", {**connections.settings["default"]})
+
+        record_pool_stats()
+
+        assert "unused" not in connection._connection_pools
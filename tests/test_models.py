@@ -1,10 +1,18 @@
 """Tests for Django models."""
 
 import pytest
+from datetime import timedelta
 from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 
 from interviewers.models import Interviewer, Technology, InterviewSubject
-from bookings.models import Booking
+from bookings.analytics import refresh_daily_stats
+from bookings.models import Booking, BookingDailyStats
 from tests.factories import (
     BookingFactory,
     InterviewerFactory,
@@ -104,3 +112,126 @@ class TestBooking:
             scheduled_at="2025-01-01T10:00:00Z",
         )
         assert booking.status == Booking.Status.PENDING
+
+
+@pytest.mark.django_db
+class TestBookingAmountSnapshot:
+    def test_amount_is_snapshotted_at_creation(self):
+        interviewer = InterviewerFactory(hourly_rate=Decimal("150.00"))
+        booking = BookingFactory(interviewer=interviewer, duration_minutes=90)
+        interviewer.hourly_rate = Decimal("200.00")
+        interviewer.save()
+        booking.refresh_from_db()
+        assert booking.amount_cents == 22500
+
+    def test_explicit_amount_is_kept(self):
+        booking = BookingFactory(amount_cents=1234)
+        assert booking.amount_cents == 1234
+
+    def test_backfill_prices_unpriced_bookings_and_refreshes_the_rollup(self):
+        interviewer = InterviewerFactory(hourly_rate=Decimal("100.00"))
+        booking = BookingFactory(interviewer=interviewer, duration_minutes=45)
+        priced = BookingFactory(interviewer=interviewer, amount_cents=1234)
+        Booking.objects.filter(pk=booking.pk).update(amount_cents=0)
+        refresh_daily_stats()
+        backdate_bookings()
+
+        out = StringIO()
+        call_command("backfill_booking_amounts", "--batch-size=1", stdout=out)
+
+        booking.refresh_from_db()
+        priced.refresh_from_db()
+        assert booking.amount_cents == 7500
+        assert priced.amount_cents == 1234
+        assert "Priced 1 bookings." in out.getvalue()
+        assert BookingDailyStats.objects.get(interviewer=interviewer).revenue_cents == 7500 + 1234
+
+
+def backdate_bookings():
+    """Move every booking's updated_at well behind the rollup watermark."""
+    Booking.objects.update(updated_at=timezone.now() - timedelta(hours=1))
+
+
+@pytest.mark.django_db
+class TestBookingDailyStats:
+    def test_rollup_aggregates_per_interviewer_day(self):
+        interviewer = InterviewerFactory(hourly_rate=Decimal("100.00"))
+        day = timezone.now().replace(hour=12)
+        BookingFactory.create_batch(2, interviewer=interviewer, scheduled_at=day)
+        BookingFactory(interviewer=interviewer, scheduled_at=day, status=Booking.Status.CANCELLED)
+        BookingFactory(interviewer=interviewer, scheduled_at=day, status=Booking.Status.PENDING)
+
+        call_command("rollup_booking_stats", stdout=StringIO())
+
+        stats = BookingDailyStats.objects.get(interviewer=interviewer)
+        assert stats.date == day.date()
+        assert stats.bookings == 3
+        assert stats.confirmed == 2
+        assert stats.cancelled == 1
+        assert stats.revenue_cents == 20000
+        assert stats.cancellation_rate == pytest.approx(1 / 3)
+
+    def test_rollup_is_incremental(self):
+        interviewer = InterviewerFactory(hourly_rate=Decimal("100.00"))
+        booking = BookingFactory(interviewer=interviewer)
+        other = BookingFactory(scheduled_at=booking.scheduled_at - timedelta(days=3))
+        assert refresh_daily_stats() == 2
+        backdate_bookings()
+
+        booking.status = Booking.Status.COMPLETED
+        booking.save()
+        # Only the touched day is rewritten
+        assert refresh_daily_stats() == 1
+
+        stats = BookingDailyStats.objects.get(interviewer=interviewer)
+        assert stats.completed == 1
+        assert stats.confirmed == 0
+        assert BookingDailyStats.objects.get(interviewer=other.interviewer).confirmed == 1
+
+    def test_rollup_with_nothing_changed_writes_nothing(self):
+        BookingFactory()
+        refresh_daily_stats()
+        backdate_bookings()
+        with CaptureQueriesContext(connection) as queries:
+            assert refresh_daily_stats() == 0
+        # Stale days, the watermark and the touched days
+        assert len(queries) == 3
+
+    def test_rescheduled_booking_leaves_its_old_day(self):
+        interviewer = InterviewerFactory(hourly_rate=Decimal("100.00"))
+        booking = BookingFactory(interviewer=interviewer)
+        old_day = timezone.localdate(booking.scheduled_at)
+        refresh_daily_stats()
+        backdate_bookings()
+
+        booking.scheduled_at += timedelta(days=2)
+        booking.save()
+        assert refresh_daily_stats() == 2
+
+        old = BookingDailyStats.objects.get(interviewer=interviewer, date=old_day)
+        new = BookingDailyStats.objects.get(interviewer=interviewer, date=old_day + timedelta(days=2))
+        assert (old.bookings, old.revenue_cents) == (0, 0)
+        assert (new.bookings, new.revenue_cents) == (1, 10000)
+
+    def test_deleted_booking_is_subtracted(self):
+        interviewer = InterviewerFactory(hourly_rate=Decimal("100.00"))
+        booking = BookingFactory(interviewer=interviewer)
+        BookingFactory(interviewer=interviewer, scheduled_at=booking.scheduled_at)
+        refresh_daily_stats()
+        backdate_bookings()
+
+        booking.delete()
+        assert refresh_daily_stats() == 1
+
+        stats = BookingDailyStats.objects.get(interviewer=interviewer)
+        assert (stats.bookings, stats.revenue_cents) == (1, 10000)
+
+    def test_stale_marks_are_cleared_once_recomputed(self, monkeypatch):
+        booking = BookingFactory()
+        refresh_daily_stats()
+        booking.delete()
+        monkeypatch.setattr("bookings.analytics.ROLLUP_OVERLAP", timedelta(0))
+
+        refresh_daily_stats()
+
+        assert not BookingDailyStats.objects.filter(stale_since__isnull=False).exists()
@@ -0,0 +1,140 @@
+"""Tests for refreshing nginx's cached catalog pages."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from django.urls import reverse
+
+from interview_service import page_cache
+from interview_service.middleware import PIN_PRIMARY_COOKIE
+from interview_service.page_cache import CatalogRefresher, catalog_paths, refresh_catalog
+from tests.factories import InterviewerFactory, InterviewSubjectFactory, TechnologyFactory
+
+
+@pytest.fixture
+def scheduled(monkeypatch, settings):
+    """Interviewer ids passed to the refresher, one entry per schedule() call."""
+    settings.PAGE_CACHE_REFRESH_URL = "http://nginx:8080"
+    calls = []
+    monkeypatch.setattr(page_cache.refresher, "schedule", calls.append)
+    return calls
+
+
+@pytest.fixture
+def nginx(settings):
+    """A stand-in for nginx's refresh server that records what it is sent."""
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            received.append((self.path, self.headers.get("HX-Request"), self.headers.get("Cookie")))
+            self.send_response(404 if "modal" in self.path else 200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    settings.PAGE_CACHE_REFRESH_URL = f"http://127.0.0.1:{server.server_port}/"
+    yield received
+    server.shutdown()
+    thread.join()
+
+
+@pytest.mark.django_db
+class TestCatalogPaths:
+    def test_lists_every_filter_and_the_changed_modals(self):
+        TechnologyFactory(slug="python")
+        InterviewSubjectFactory(slug="system-design")
+        list_url = reverse("interviewers:list")
+
+        assert catalog_paths([7]) == [
+            reverse("pages:home"),
+            reverse("interviewers:featured"),
+            list_url,
+            f"{list_url}?technology=python",
+            f"{list_url}?subject=system-design",
+            reverse("interviewers:detail_modal", kwargs={"pk": 7}),
+        ]
+
+
+@pytest.mark.django_db
+class TestRefreshCatalog:
+    def test_fetches_pages_and_partials_from_the_primary(self, nginx):
+        failed = refresh_catalog([3])
+
+        assert failed == 0
+        paths = {path for path, _, _ in nginx}
+        assert paths == {"/", "/interviewers/", "/interviewers/featured/", "/interviewers/3/modal/"}
+        assert {hx for _, hx, _ in nginx} == {None, "true"}
+        assert all(cookie.startswith(f"{PIN_PRIMARY_COOKIE}=") for _, _, cookie in nginx)
+
+    def test_counts_unreachable_pages(self, settings):
+        settings.PAGE_CACHE_REFRESH_URL = "http://127.0.0.1:9"
+
+        assert refresh_catalog() == 6
+
+
+@pytest.mark.django_db
+class TestPurgeSignals:
+    def test_interviewer_save_schedules_its_modal(self, scheduled, django_capture_on_commit_callbacks):
+        interviewer = InterviewerFactory()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            interviewer.bio = "Updated"
+            interviewer.save()
+
+        assert scheduled == [interviewer.pk]
+
+    def test_taxonomy_change_refreshes_the_catalog(self, scheduled, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            TechnologyFactory()
+            InterviewSubjectFactory()
+
+        assert scheduled == [None, None]
+
+    def test_profile_edit_refreshes_its_interviewer(
+        self, client, scheduled, interviewer, django_capture_on_commit_callbacks
+    ):
+        client.force_login(interviewer.user)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            client.post(reverse("dashboard:profile"), {"bio": "Updated"})
+
+        assert set(scheduled) == {interviewer.pk}
+
+    def test_nothing_is_scheduled_without_a_refresh_url(
+        self, scheduled, settings, django_capture_on_commit_callbacks, tmp_path
+    ):
+        settings.PAGE_CACHE_REFRESH_URL = ""
+        # Prerendered builds are the watcher's job, not the web worker's
+        settings.PRERENDER_ROOT = str(tmp_path)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            InterviewerFactory()
+
+        assert scheduled == []
+
+
+class TestCatalogRefresher:
+    def test_changes_in_one_burst_share_a_refresh(self, monkeypatch, settings):
+        settings.PAGE_CACHE_REFRESH_DELAY = 0
+        settings.PAGE_CACHE_REFRESH_URL = "http://nginx:8080"
+        refreshed = []
+        monkeypatch.setattr(page_cache, "refresh_catalog", lambda ids: refreshed.append(ids) or 0)
+        submitted = []
+        refresher = CatalogRefresher()
+        refresher._executor = type("Executor", (), {"submit": lambda self, fn: submitted.append(fn)})()
+
+        refresher.schedule(1)
+        refresher.schedule(2)
+        refresher.schedule()
+        worker = threading.Thread(target=submitted[0])
+        worker.start()
+        worker.join()
+
+        assert len(submitted) == 1
+        assert refreshed == [{1, 2}]
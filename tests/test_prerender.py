@@ -0,0 +1,119 @@
+"""Tests for prerendering the public catalog to static files."""
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+
+from interviewers.catalog import bump_catalog_version
+from pages import prerender
+from pages.prerender import prerender_site
+from tests.factories import InterviewerFactory, InterviewSubjectFactory, TechnologyFactory
+
+
+@pytest.fixture
+def catalog(db):
+    python = TechnologyFactory(name="Python", slug="python")
+    go = TechnologyFactory(name="Go", slug="go")
+    design = InterviewSubjectFactory(name="System Design", slug="system-design")
+    return {
+        "pythonista": InterviewerFactory(technologies=[python], subjects=[design]),
+        "gopher": InterviewerFactory(technologies=[go]),
+        "inactive": InterviewerFactory(is_active=False, technologies=[python]),
+    }
+
+
+@pytest.mark.django_db
+class TestPrerenderSite:
+    def test_files_match_what_anonymous_visitors_get(self, client, catalog, tmp_path):
+        prerender_site(tmp_path)
+        current = tmp_path / "current"
+        pythonista = catalog["pythonista"]
+
+        def live(url, **headers):
+            return client.get(url, headers=headers).content.decode()
+
+        list_url = reverse("interviewers:list")
+        assert (current / "index.html").read_text() == live(reverse("pages:home"))
+        assert (current / "interviewers/index.html").read_text() == live(list_url)
+        assert (current / "interviewers/featured.html").read_text() == live(
+            reverse("interviewers:featured"), hx_request="true"
+        )
+        assert (current / "interviewers/grid/python/system-design.html").read_text() == live(
+            f"{list_url}?technology=python&subject=system-design", hx_request="true"
+        )
+        assert (current / "interviewers/grid/_/_.html").read_text() == live(list_url, hx_request="true")
+        assert (current / f"interviewers/{pythonista.pk}/modal.html").read_text() == live(
+            reverse("interviewers:detail_modal", kwargs={"pk": pythonista.pk})
+        )
+
+    def test_every_filter_combination_and_active_modal_is_written(self, catalog, tmp_path):
+        build, count = prerender_site(tmp_path)
+
+        grids = sorted(p.relative_to(build / "interviewers/grid").as_posix() for p in build.glob("interviewers/grid/*/*"))
+        assert grids == [
+            "_/_.html", "_/system-design.html",
+            "go/_.html", "go/system-design.html",
+            "python/_.html", "python/system-design.html",
+        ]
+        assert not (build / f"interviewers/{catalog['inactive'].pk}").exists()
+        # home, list, featured, 6 grids, 2 modals
+        assert count == 11
+
+    def test_rebuild_switches_current_and_keeps_one_previous_build(self, catalog, tmp_path):
+        first, _ = prerender_site(tmp_path)
+        second, _ = prerender_site(tmp_path)
+        third, _ = prerender_site(tmp_path)
+
+        assert (tmp_path / "current").resolve() == third
+        assert sorted((tmp_path / "builds").iterdir()) == [second, third]
+        assert not first.exists()
+
+    def test_failed_build_leaves_the_current_one_in_place(self, catalog, tmp_path, monkeypatch):
+        good, _ = prerender_site(tmp_path)
+
+        def broken(build):
+            (build / "index.html").write_text("half")
+            raise RuntimeError("template error")
+
+        monkeypatch.setattr(prerender, "render_catalog", broken)
+        with pytest.raises(RuntimeError):
+            prerender_site(tmp_path)
+
+        assert (tmp_path / "current").resolve() == good
+        assert list((tmp_path / "builds").iterdir()) == [good]
+
+
+@pytest.mark.django_db
+class TestPrerenderCommand:
+    def test_writes_to_prerender_root(self, catalog, tmp_path, settings):
+        settings.PRERENDER_ROOT = str(tmp_path)
+
+        call_command("prerender_site")
+
+        assert (tmp_path / "current/index.html").exists()
+
+    def test_watch_rebuilds_when_the_catalog_changes(self, tmp_path, monkeypatch):
+        builds = []
+        monkeypatch.setattr(prerender, "prerender_site", lambda root: builds.append(root) or (root, 0))
+        naps = []
+
+        def sleep(seconds):
+            naps.append(seconds)
+            if len(naps) == 1:
+                bump_catalog_version()
+            elif len(naps) == 3:
+                raise KeyboardInterrupt
+
+        monkeypatch.setattr(prerender, "sleep", sleep)
+
+        with pytest.raises(KeyboardInterrupt):
+            call_command("prerender_site", "--output", str(tmp_path), "--watch", "1")
+
+        # At start and after the change; the unchanged third check builds nothing
+        assert builds == [str(tmp_path)] * 2
+
+    def test_requires_an_output_directory(self, settings):
+        settings.PRERENDER_ROOT = ""
+
+        with pytest.raises(CommandError):
+            call_command("prerender_site")
@@ -0,0 +1,83 @@
+"""Tests for the request sampling profiler."""
+
+import time
+
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+
+from interview_service.profiling import Sampler, save_profile
+
+
+def busy_loop(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+@pytest.fixture
+def profile_dir(settings, tmp_path):
+    # Test requests are fast; sample often enough to always catch the view
+    settings.PROFILE_INTERVAL_MS = 0.2
+    settings.PROFILE_DIR = tmp_path / "profiles"
+    return settings.PROFILE_DIR
+
+
+@pytest.fixture
+def staff_client(client, db):
+    staff = User.objects.create_user("staff", "staff@example.com", "testpass123", is_staff=True)
+    client.force_login(staff)
+    return client
+
+
+class TestSampler:
+    def test_collects_collapsed_stacks(self):
+        with Sampler(interval=0.001) as sampler:
+            busy_loop(0.1)
+
+        assert sampler.samples > 10
+        hottest = sampler.collapsed().splitlines()[0]
+        frames, count = hottest.rsplit(" ", 1)
+        assert frames.endswith("tests.test_profiling:busy_loop")
+        assert "tests.test_profiling:TestSampler.test_collects_collapsed_stacks;" in frames
+        assert int(count) > 0
+
+    def test_save_profile_keeps_newest_files(self, tmp_path):
+        for i in range(4):
+            save_profile(tmp_path, f"{i}.folded", "a;b 1\n", keep=2)
+            time.sleep(0.01)
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["2.folded", "3.folded"]
+
+
+@pytest.mark.django_db
+class TestProfilingMiddleware:
+    def test_staff_get_profile_on_demand(self, staff_client, profile_dir):
+        response = staff_client.get(reverse("interviewers:list"), HTTP_X_PROFILE="1")
+
+        assert response["Content-Type"].startswith("text/plain")
+        assert response["X-Profiled-Status"] == "200"
+        assert "-interviewers-list-" in response["Content-Disposition"]
+        assert b"interviewers.views:interviewer_list" in response.content
+        assert len(list(profile_dir.glob("*.folded"))) == 1
+
+    def test_query_flag_also_profiles(self, staff_client, profile_dir):
+        response = staff_client.get(reverse("interviewers:list") + "?_profile=1")
+
+        assert response["X-Profiled-Status"] == "200"
+
+    def test_non_staff_are_ignored(self, client, profile_dir):
+        response = client.get(reverse("interviewers:list"), HTTP_X_PROFILE="1")
+
+        assert "X-Profiled-Status" not in response
+        assert b"<html" in response.content
+        assert not profile_dir.exists()
+
+    def test_random_sampling_writes_to_disk(self, client, settings, profile_dir):
+        settings.PROFILE_SAMPLE_RATE = 1
+
+        response = client.get(reverse("interviewers:list"))
+
+        assert "X-Profiled-Status" not in response
+        (profile,) = profile_dir.glob("*-interviewers-list-*.folded")
+        assert "interviewers.views:interviewer_list" in profile.read_text()
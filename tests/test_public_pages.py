@@ -0,0 +1,64 @@
+"""Tests for the session-free anonymous path through the catalog pages."""
+
+import pytest
+from django.urls import reverse
+
+from tests.factories import InterviewerFactory
+
+PUBLIC_PAGES = ["pages:home", "interviewers:list", "interviewers:featured"]
+
+
+@pytest.mark.django_db
+class TestAnonymousVisitors:
+    @pytest.mark.parametrize("page", PUBLIC_PAGES)
+    def test_page_sets_no_cookies_and_does_not_vary_on_them(self, client, page):
+        InterviewerFactory()
+
+        response = client.get(reverse(page))
+
+        assert response.status_code == 200
+        assert not response.cookies
+        assert "Cookie" not in response.get("Vary", "")
+        assert response["Cache-Control"] == "public, max-age=0, s-maxage=60"
+
+    def test_detail_modal_is_public(self, client):
+        interviewer = InterviewerFactory()
+
+        response = client.get(reverse("interviewers:detail_modal", kwargs={"pk": interviewer.pk}))
+
+        assert not response.cookies
+        assert "public" in response["Cache-Control"]
+
+    def test_missing_interviewer_is_not_cached(self, client):
+        response = client.get(reverse("interviewers:detail_modal", kwargs={"pk": 999}))
+
+        assert response.status_code == 404
+        assert "public" not in response.get("Cache-Control", "")
+
+    def test_interviewer_list_varies_on_htmx(self, client):
+        response = client.get(reverse("interviewers:list"), HTTP_HX_REQUEST="true")
+
+        assert response.templates[0].name == "interviewers/partials/grid.html"
+        assert "HX-Request" in response["Vary"]
+
+    def test_shared_cache_lifetime_is_configurable(self, client, settings):
+        settings.PUBLIC_PAGE_CACHE_SECONDS = 5
+
+        response = client.get(reverse("pages:home"))
+
+        assert "s-maxage=5" in response["Cache-Control"]
+
+
+@pytest.mark.django_db
+class TestLoggedInVisitors:
+    def test_catalog_is_private_and_shows_the_dashboard_link(self, client_with_interviewer):
+        response = client_with_interviewer.get(reverse("interviewers:list"))
+
+        assert "private" in response["Cache-Control"]
+        assert "Cookie" in response["Vary"]
+        assert reverse("dashboard:home").encode() in response.content
+
+    def test_dashboard_pages_send_the_csrf_header_for_htmx(self, client_with_interviewer):
+        response = client_with_interviewer.get(reverse("dashboard:profile"))
+
+        assert b"X-CSRFToken" in response.content
@@ -0,0 +1,105 @@
+"""Tests for the token-bucket rate limits on login and booking creation."""
+
+import pytest
+from django.urls import reverse
+from prometheus_client import REGISTRY
+
+from interview_service.ratelimit import parse_rate, take_token
+
+
+def throttled(scope, bucket):
+    return REGISTRY.get_sample_value("rate_limited_requests_total", {"scope": scope, "bucket": bucket}) or 0
+
+
+class TestTokenBucket:
+    def test_parse_rate(self):
+        assert parse_rate("5/m") == (5, 5 / 60)
+        assert parse_rate("") is None
+
+    def test_burst_then_refill(self):
+        capacity, rate = parse_rate("2/m")
+
+        assert take_token("bucket", capacity, rate, now=0) is None
+        assert take_token("bucket", capacity, rate, now=0) is None
+        assert take_token("bucket", capacity, rate, now=0) == pytest.approx(30)
+        # Half a token later, still waiting for the rest
+        assert take_token("bucket", capacity, rate, now=15) == pytest.approx(15)
+        assert take_token("bucket", capacity, rate, now=30) is None
+
+    def test_buckets_never_hold_more_than_their_capacity(self):
+        capacity, rate = parse_rate("1/s")
+
+        assert take_token("bucket", capacity, rate, now=0) is None
+        assert take_token("bucket", capacity, rate, now=1000) is None
+        assert take_token("bucket", capacity, rate, now=1000) is not None
+
+
+@pytest.mark.django_db
+class TestLoginRateLimit:
+    def post(self, client, username="someone@example.com", ip="203.0.113.1"):
+        return client.post(
+            reverse("accounts:login"), {"username": username, "password": "wrong"}, REMOTE_ADDR=ip
+        )
+
+    def test_repeated_attempts_for_one_address_are_throttled(self, client, settings):
+        settings.RATE_LIMITS = {"login:email": "2/m"}
+        before = throttled("login", "email")
+
+        assert self.post(client).status_code == 200
+        assert self.post(client, ip="203.0.113.2").status_code == 200
+        response = self.post(client, username="SomeOne@example.com ", ip="203.0.113.3")
+
+        assert response.status_code == 429
+        assert 0 < int(response["Retry-After"]) <= 30
+        assert throttled("login", "email") == before + 1
+
+    def test_one_ip_trying_many_addresses_is_throttled(self, client, settings):
+        settings.RATE_LIMITS = {"login:ip": "2/m"}
+
+        assert self.post(client, username="a@example.com").status_code == 200
+        assert self.post(client, username="b@example.com").status_code == 200
+        assert self.post(client, username="c@example.com").status_code == 429
+        assert self.post(client, username="c@example.com", ip="198.51.100.1").status_code == 200
+
+    def test_login_page_itself_is_not_limited(self, client, settings):
+        settings.RATE_LIMITS = {"login:ip": "1/m"}
+
+        for _ in range(3):
+            assert client.get(reverse("accounts:login")).status_code == 200
+
+    def test_proxy_header_names_the_client(self, client, settings):
+        settings.RATE_LIMITS = {"login:ip": "1/m"}
+        settings.RATE_LIMIT_CLIENT_IP_HEADER = "HTTP_X_REAL_IP"
+
+        def post(real_ip):
+            return client.post(
+                reverse("accounts:login"), {"username": "x", "password": "y"}, HTTP_X_REAL_IP=real_ip
+            )
+
+        assert post("203.0.113.1").status_code == 200
+        assert post("203.0.113.2").status_code == 200
+        assert post("203.0.113.1").status_code == 429
+
+    def test_unreachable_cache_lets_requests_through(self, client, settings, monkeypatch):
+        settings.RATE_LIMITS = {"login:ip": "1/m"}
+
+        def down(*args, **kwargs):
+            raise ConnectionError("cache down")
+
+        monkeypatch.setattr("interview_service.ratelimit.take_token", down)
+
+        assert self.post(client).status_code == 200
+        assert self.post(client).status_code == 200
+
+
+@pytest.mark.django_db
+class TestBookingRateLimit:
+    def test_booking_posts_are_throttled_before_any_work(self, client, settings, interviewer):
+        settings.RATE_LIMITS = {"booking:ip": "1/m"}
+        url = reverse("bookings:create", kwargs={"interviewer_id": interviewer.pk})
+
+        client.post(url, {"scheduled_at": "not a date", "customer_email": "a@example.com"})
+        response = client.post(url, {"scheduled_at": "not a date", "customer_email": "a@example.com"})
+
+        assert response.status_code == 429
+        assert throttled("booking", "ip") >= 1
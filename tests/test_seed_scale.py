@@ -0,0 +1,64 @@
+"""Tests for the seed_scale management command."""
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Count, Sum
+
+from bookings.models import Booking
+from interviewers.catalog import list_interviewers
+from interviewers.models import Interviewer
+from tests.factories import BookingFactory
+
+
+def seed(**options):
+    call_command("seed_scale", interviewers=50, bookings=2000, stdout=StringIO(), **options)
+
+
+@pytest.mark.django_db
+class TestSeedScale:
+    def test_generates_requested_volumes(self):
+        seed()
+        assert Interviewer.objects.filter(user__username__startswith="scale-").count() == 50
+        assert Booking.objects.count() == 2000
+        assert not Interviewer.objects.annotate(n=Count("technologies")).filter(n=0).exists()
+        assert not Interviewer.objects.annotate(n=Count("subjects")).filter(n=0).exists()
+
+    def test_is_deterministic_and_replaces_previous_data(self):
+        seed(seed=1)
+        first = Booking.objects.aggregate(Sum("amount_cents"), Sum("duration_minutes"))
+        seed(seed=1)
+        assert Booking.objects.count() == 2000
+        assert Booking.objects.aggregate(Sum("amount_cents"), Sum("duration_minutes")) == first
+
+    def test_leaves_other_data_alone(self):
+        booking = BookingFactory()
+        seed()
+        assert Booking.objects.filter(pk=booking.pk).exists()
+
+    def test_bookings_are_skewed_toward_popular_interviewers(self):
+        seed()
+        per_interviewer = sorted(
+            Booking.objects.values("interviewer").annotate(n=Count("id")).values_list("n", flat=True),
+            reverse=True,
+        )
+        # The busiest 20% of interviewers take well over 20% of bookings
+        top = sum(per_interviewer[: len(per_interviewer) // 5])
+        assert top > 0.3 * sum(per_interviewer)
+
+    def test_generated_interviewers_are_listed(self, django_capture_on_commit_callbacks):
+        # Caches the taxonomy and the empty listing first
+        assert list_interviewers(tech_slug="python") == []
+
+        with django_capture_on_commit_callbacks(execute=True):
+            seed()
+
+        assert list_interviewers(tech_slug="python")
+
+    def test_indexes_are_restored(self):
+        seed()
+        with connection.cursor() as cursor:
+            indexes = connection.introspection.get_constraints(cursor, Booking._meta.db_table)
+        assert "booking_history_idx" in indexes
@@ -0,0 +1,73 @@
+"""Tests for the gunicorn configuration and worker warmup."""
+
+import runpy
+from pathlib import Path
+
+import pytest
+from django.template import engines
+
+from interview_service.warmup import warm_up
+
+GUNICORN_CONF = Path(__file__).resolve().parent.parent / "gunicorn.conf.py"
+
+
+@pytest.fixture
+def load_config(monkeypatch, tmp_path):
+    """Evaluate gunicorn.conf.py with the given environment; return its settings."""
+    # The config sets this with setdefault; keep it from leaking into other tests
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+    def load(**env):
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        return runpy.run_path(str(GUNICORN_CONF))
+
+    return load
+
+
+class TestGunicornConfig:
+    def test_defaults_to_preloaded_gthread_workers(self, load_config):
+        config = load_config()
+        cpus = config["cpu_count"]()
+
+        assert config["worker_class"] == "gthread"
+        assert config["wsgi_app"] == "interview_service.wsgi:application"
+        assert config["workers"] == 2 * cpus + 1
+        assert config["threads"] == 4
+        assert config["preload_app"] is True
+        assert config["max_requests"] == 2000
+        assert config["max_requests_jitter"] == 200
+
+    def test_uvicorn_workers_serve_the_asgi_app(self, load_config):
+        config = load_config(GUNICORN_WORKER_CLASS="uvicorn")
+
+        assert config["worker_class"] == "uvicorn_worker.UvicornWorker"
+        assert config["wsgi_app"] == "interview_service.asgi:application"
+        assert config["workers"] == config["cpu_count"]() + 1
+
+    def test_environment_overrides(self, load_config):
+        config = load_config(
+            GUNICORN_WORKERS="7",
+            GUNICORN_THREADS="8",
+            GUNICORN_MAX_REQUESTS="500",
+            GUNICORN_PRELOAD="false",
+        )
+
+        assert (config["workers"], config["threads"]) == (7, 8)
+        assert (config["max_requests"], config["max_requests_jitter"]) == (500, 50)
+        assert config["preload_app"] is False
+
+
+@pytest.mark.django_db
+class TestWarmUp:
+    def test_compiles_templates_and_checks_databases(self):
+        elapsed, templates = warm_up()
+
+        template_dirs = engines["django"].template_dirs
+        project_templates = sum(1 for d in template_dirs for _ in Path(d).rglob("*.html"))
+        assert templates == project_templates
+        assert elapsed > 0
+
+    def test_master_warmup_skips_databases(self, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            warm_up(databases=False)
@@ -0,0 +1,157 @@
+"""Tests for single-flight cache fills and the cached catalog queries."""
+
+import threading
+from time import sleep
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+from interview_service import db_router, single_flight
+from interview_service.db_router import route_reads
+from interview_service.single_flight import get_or_fill, jittered
+from interviewers import catalog
+from interviewers.catalog import bump_catalog_version
+from interviewers.taxonomy import get_taxonomy
+from tests.factories import InterviewerFactory, TechnologyFactory
+
+
+class Fill:
+    """A fill function that counts its calls."""
+
+    def __init__(self, value="fresh", delay=0):
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        sleep(self.delay)
+        return self.value
+
+
+class TestGetOrFill:
+    def test_value_is_filled_once_then_served_from_the_cache(self):
+        fill = Fill()
+
+        assert get_or_fill("key", fill, 60) == "fresh"
+        assert get_or_fill("key", fill, 60) == "fresh"
+        assert fill.calls == 1
+
+    def test_new_version_is_refilled(self):
+        get_or_fill("key", Fill("old"), 60, version=1)
+
+        assert get_or_fill("key", Fill("new"), 60, version=2) == "new"
+
+    def test_concurrent_misses_share_one_fill(self):
+        fill = Fill(delay=0.2)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_or_fill("key", fill, 60))) for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert fill.calls == 1
+        assert results == ["fresh"] * 5
+
+    def test_expired_value_is_served_while_another_request_refills(self, monkeypatch):
+        monkeypatch.setattr(single_flight, "jittered", lambda seconds: -1)
+        get_or_fill("key", Fill("stale"), 60)
+        cache.add("key:lock", "another worker")
+        fill = Fill()
+
+        assert get_or_fill("key", fill, 60) == "stale"
+        assert fill.calls == 0
+
+    def test_expired_value_is_refilled_by_the_lock_holder(self, monkeypatch):
+        monkeypatch.setattr(single_flight, "jittered", lambda seconds: -1)
+        get_or_fill("key", Fill("stale"), 60)
+
+        assert get_or_fill("key", Fill(), 60) == "fresh"
+        assert cache.get("key:lock") is None
+
+    def test_new_version_is_filled_once_while_the_old_one_refills(self):
+        cache.add("key:lock", "worker refilling version 1")
+        fill = Fill(delay=0.1)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_or_fill("key", fill, 60, version=2)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        sleep(0.1)
+        # The other worker's refill finishes and releases the lock
+        cache.delete("key:lock")
+        for thread in threads:
+            thread.join()
+
+        assert fill.calls == 1
+        assert results == ["fresh"] * 5
+
+    def test_waiting_request_fills_itself_when_the_filler_is_stuck(self, monkeypatch):
+        monkeypatch.setattr(single_flight, "FILL_WAIT_SECONDS", 0.1)
+        cache.add("key:lock", "stuck worker")
+        fill = Fill()
+
+        assert get_or_fill("key", fill, 60) == "fresh"
+        assert fill.calls == 1
+
+    def test_failed_fill_releases_the_lock(self):
+        def broken():
+            raise RuntimeError("database down")
+
+        with pytest.raises(RuntimeError):
+            get_or_fill("key", broken, 60)
+
+        assert cache.get("key:lock") is None
+
+    def test_lifetimes_are_jittered(self):
+        lifetimes = {jittered(100) for _ in range(20)}
+
+        assert len(lifetimes) > 1
+        assert all(90 <= seconds <= 110 for seconds in lifetimes)
+
+
+@pytest.mark.django_db
+class TestCachedCatalog:
+    def test_warm_list_runs_no_interviewer_queries(self, client, django_assert_num_queries):
+        InterviewerFactory(technologies=[TechnologyFactory()])
+        url = reverse("interviewers:list")
+        client.get(url)
+
+        # Only the ETag check
+        with django_assert_num_queries(1):
+            response = client.get(url)
+
+        assert len(response.context["interviewers"]) == 1
+
+    def test_catalog_change_refills_the_cache(self):
+        InterviewerFactory()
+        assert len(catalog.list_interviewers()) == 1
+
+        InterviewerFactory()
+        bump_catalog_version()
+
+        assert len(catalog.list_interviewers()) == 2
+
+    def test_fills_read_from_the_primary(self, monkeypatch):
+        interviewer = InterviewerFactory()
+        get_taxonomy()
+        # Reads routed to this replica would fail: it isn't in DATABASES
+        monkeypatch.setattr(db_router, "replica_aliases", lambda: ["replica_1"])
+
+        with route_reads(use_primary=False):
+            assert catalog.list_interviewers() == [interviewer]
+            assert catalog.get_interviewer(interviewer.pk) == interviewer
+
+    def test_unknown_interviewer_is_none(self):
+        assert catalog.get_interviewer(999) is None
+
+    def test_odd_filters_are_not_cached(self):
+        catalog.list_interviewers("not a slug")
+
+        assert cache.get("catalog:list:not a slug:") is None
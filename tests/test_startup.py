@@ -0,0 +1,110 @@
+"""Import-time budget and boot checks for worker and management command startup."""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from urllib.request import urlopen
+
+# What a gunicorn worker does before serving its first request
+WORKER_BOOT = (
+    "from django.core.wsgi import get_wsgi_application; get_wsgi_application(); "
+    "from django.urls import get_resolver; get_resolver().url_patterns"
+)
+
+# SDKs that must only be imported on first use
+LAZY_MODULES = ["stripe", "boto3", "botocore", "storages", "PIL"]
+
+# Total import time for WORKER_BOOT: measured at about 320ms, against about
+# 950ms while the Stripe SDK was imported eagerly. Override on slow machines.
+IMPORT_TIME_BUDGET_MS = float(os.environ.get("IMPORT_TIME_BUDGET_MS", "600"))
+
+
+def import_times(code):
+    """
+    Run `code` in a fresh interpreter under `-X importtime`.
+
+    Returns ({module: cumulative ms}, total ms of top-level imports).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=os.environ,
+    )
+    modules, total = {}, 0.0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        cumulative_ms = int(cumulative) / 1000
+        modules[name.strip()] = cumulative_ms
+        # Nested imports are indented by two spaces per level
+        if not name.startswith("  "):
+            total += cumulative_ms
+    return modules, total
+
+
+class TestStartupImports:
+    def test_heavy_sdks_are_not_imported_at_startup(self):
+        modules, _ = import_times(WORKER_BOOT)
+
+        assert [name for name in LAZY_MODULES if name in modules] == []
+
+    def test_startup_import_time_is_within_budget(self):
+        # Best of three to keep disk cache and scheduler noise out of it
+        totals = [import_times(WORKER_BOOT)[1] for _ in range(3)]
+
+        assert min(totals) <= IMPORT_TIME_BUDGET_MS, (
+            f"Worker startup imports took {min(totals):.0f}ms "
+            f"(budget {IMPORT_TIME_BUDGET_MS:.0f}ms); run "
+            f'`python -X importtime -c "{WORKER_BOOT}"` to find the new import'
+        )
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestGunicornBoot:
+    def test_serves_metrics_with_the_project_config(self, tmp_path):
+        # With preload the app imports prometheus_client before any server
+        # hook runs, so the config itself must create the multiprocess dir
+        port = free_port()
+        multiproc_dir = tmp_path / "prometheus"
+        env = {
+            **os.environ,
+            "PROMETHEUS_MULTIPROC_DIR": str(multiproc_dir),
+            "GUNICORN_BIND": f"127.0.0.1:{port}",
+            "GUNICORN_WORKERS": "1",
+        }
+        server = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py"],
+            cwd=Path(__file__).resolve().parent.parent,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            status = None
+            deadline = time.monotonic() + 30
+            while status is None and time.monotonic() < deadline:
+                if server.poll() is not None:
+                    break
+                try:
+                    with urlopen(f"http://127.0.0.1:{port}/metrics", timeout=2) as response:
+                        status = response.status
+                except OSError:
+                    time.sleep(0.2)
+        finally:
+            server.terminate()
+            _, errors = server.communicate(timeout=30)
+
+        assert status == 200, errors
+        assert multiproc_dir.is_dir()
@@ -12,7 +12,7 @@ from tests.factories import BookingFactory
 
 @pytest.mark.django_db
 class TestStripeWebhook:
-    @patch("bookings.webhooks.stripe.Webhook.construct_event")
+    @patch("stripe.Webhook.construct_event")
     @patch("bookings.webhooks.send_customer_confirmation")
     @patch("bookings.webhooks.send_interviewer_notification")
     def test_checkout_completed_updates_booking(
@@ -57,7 +57,7 @@ class TestStripeWebhook:
         mock_customer_email.assert_called_once_with(booking)
         mock_interviewer_email.assert_called_once_with(booking)
 
-    @patch("bookings.webhooks.stripe.Webhook.construct_event")
+    @patch("stripe.Webhook.construct_event")
     def test_invalid_signature_returns_400(self, mock_construct_event, client):
         from stripe.error import SignatureVerificationError
 
@@ -74,7 +74,7 @@ class TestStripeWebhook:
 
         assert response.status_code == 400
 
-    @patch("bookings.webhooks.stripe.Webhook.construct_event")
+    @patch("stripe.Webhook.construct_event")
     def test_unknown_event_type_returns_200(self, mock_construct_event, client):
         mock_construct_event.return_value = {
             "type": "some.other.event",
@@ -90,7 +90,7 @@ class TestStripeWebhook:
 
         assert response.status_code == 200
 
-    @patch("bookings.webhooks.stripe.Webhook.construct_event")
+    @patch("stripe.Webhook.construct_event")
     def test_missing_booking_id_handled_gracefully(self, mock_construct_event, client):
         mock_construct_event.return_value = {
             "type": "checkout.session.completed",
@@ -112,7 +112,7 @@ class TestStripeWebhook:
 
         assert response.status_code == 200
 
-    @patch("bookings.webhooks.stripe.Webhook.construct_event")
+    @patch("stripe.Webhook.construct_event")
     def test_nonexistent_booking_handled_gracefully(
         self, mock_construct_event, client
     ):
@@ -0,0 +1,95 @@
+"""Tests for the process-local taxonomy snapshot."""
+
+import pytest
+from django.urls import reverse
+
+from interview_service import db_router
+from interview_service.db_router import route_reads
+from interviewers.taxonomy import bump_taxonomy_version, get_taxonomy
+from tests.factories import InterviewerFactory, InterviewSubjectFactory, TechnologyFactory
+
+
+@pytest.mark.django_db
+class TestTaxonomySnapshot:
+    def test_snapshot_is_reused_without_queries(self, django_assert_num_queries):
+        TechnologyFactory(slug="python")
+        first = get_taxonomy()
+
+        with django_assert_num_queries(0):
+            assert get_taxonomy() is first
+
+    def test_slug_maps(self):
+        python = TechnologyFactory(slug="python")
+        design = InterviewSubjectFactory(slug="system-design")
+
+        taxonomy = get_taxonomy()
+
+        assert taxonomy.technology_ids == {"python": python.pk}
+        assert taxonomy.subject_ids == {"system-design": design.pk}
+        assert taxonomy.technologies == (python,)
+
+    def test_save_reloads_after_commit(self, django_capture_on_commit_callbacks):
+        before = get_taxonomy()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            go = TechnologyFactory(slug="go")
+
+        after = get_taxonomy()
+        assert after is not before
+        assert after.technology_ids == {"go": go.pk}
+
+    def test_another_workers_bump_reloads(self):
+        before = get_taxonomy()
+        TechnologyFactory(slug="go")
+
+        # What another worker's commit leaves in the shared cache
+        bump_taxonomy_version()
+
+        assert get_taxonomy().version != before.version
+        assert "go" in get_taxonomy().technology_ids
+
+    def test_snapshot_is_loaded_from_the_primary(self, monkeypatch):
+        TechnologyFactory(slug="go")
+        # Reads routed to this replica would fail: it isn't in DATABASES
+        monkeypatch.setattr(db_router, "replica_aliases", lambda: ["replica_1"])
+
+        with route_reads(use_primary=False):
+            assert "go" in get_taxonomy().technology_ids
+
+    def test_unknown_form_ids_are_dropped(self):
+        python = TechnologyFactory()
+
+        assert get_taxonomy().known_technology_ids([str(python.pk), "999", "x"]) == [python.pk]
+
+
+@pytest.mark.django_db
+class TestTaxonomyInViews:
+    def test_list_filters_by_slug(self, client):
+        python = TechnologyFactory(slug="python")
+        pythonista = InterviewerFactory(technologies=[python])
+        InterviewerFactory()
+
+        response = client.get(reverse("interviewers:list"), {"technology": "python"})
+
+        assert list(response.context["interviewers"]) == [pythonista]
+        assert response.context["technologies"] == (python,)
+
+    def test_unknown_slug_matches_nothing_without_a_query(self, client, django_assert_num_queries):
+        InterviewerFactory()
+        get_taxonomy()
+
+        # Only the ETag check
+        with django_assert_num_queries(1):
+            response = client.get(reverse("interviewers:list"), {"technology": "cobol"})
+
+        assert response.context["interviewers"] == []
+
+    def test_profile_picker_ignores_unknown_ids(self, client_with_interviewer, interviewer):
+        python = TechnologyFactory()
+
+        client_with_interviewer.post(
+            reverse("dashboard:profile"), {"technologies": [python.pk, 999], "subjects": ["x"]}
+        )
+
+        assert list(interviewer.technologies.all()) == [python]
+        assert not interviewer.subjects.exists()
@@ -0,0 +1,134 @@
+"""Tests for request timing and the slow-request log."""
+
+import logging
+
+import pytest
+from django.http import HttpResponse
+from django.urls import reverse
+
+from interview_service.middleware import ServerTimingMiddleware
+from interview_service.timing import RequestTimings, activate, fingerprint, measure
+from interviewers.models import Interviewer
+from tests.factories import InterviewerFactory
+
+
+def run_query(timings, sql):
+    timings.record_query(lambda *args: None, sql, [], False, {})
+
+
+class TestFingerprint:
+    def test_placeholders_and_literals_are_normalized(self):
+        assert fingerprint(
+            'SELECT "a"."id" FROM "a" WHERE "a"."id" = %s AND "a"."name" = \'x\' LIMIT 21'
+        ) == 'SELECT "a"."id" FROM "a" WHERE "a"."id" = ? AND "a"."name" = ? LIMIT ?'
+
+    def test_in_lists_of_any_length_match(self):
+        assert fingerprint('SELECT 1 FROM "a" WHERE "a"."id" IN (%s, %s)') == fingerprint(
+            'SELECT 1 FROM "a" WHERE "a"."id" IN (%s, %s, %s, %s)'
+        )
+
+    def test_multi_row_inserts_match(self):
+        assert fingerprint('INSERT INTO "a" ("x") VALUES (%s), (%s) RETURNING "a"."id"') == (
+            'INSERT INTO "a" ("x") VALUES (...) RETURNING "a"."id"'
+        )
+
+    def test_identifiers_with_digits_are_kept(self):
+        assert fingerprint('SELECT "t1"."id" FROM "t1"') == 'SELECT "t1"."id" FROM "t1"'
+
+
+class TestRequestTimings:
+    def test_repeated_queries_are_grouped(self):
+        timings = RequestTimings()
+        for pk in range(5):
+            run_query(timings, f'SELECT * FROM "tag" WHERE "tag"."owner_id" = {pk}')
+        run_query(timings, 'SELECT * FROM "owner"')
+
+        assert timings.query_count == 6
+        assert list(timings.repeated_queries(5)) == ['SELECT * FROM "tag" WHERE "tag"."owner_id" = ?']
+
+    def test_nested_measure_is_counted_once(self):
+        timings = RequestTimings()
+        with activate(timings):
+            with measure("tpl"):
+                with measure("tpl"):
+                    pass
+            with measure("stripe"):
+                pass
+
+        assert set(timings.durations) == {"tpl", "stripe"}
+        assert timings.durations["tpl"] >= 0
+
+    def test_measure_outside_a_request_is_a_no_op(self):
+        with measure("stripe"):
+            pass
+
+    def test_header(self):
+        timings = RequestTimings()
+        run_query(timings, "SELECT 1")
+        timings.durations["tpl"] = 2.25
+
+        header = timings.header(10)
+        assert "db;dur=" in header
+        assert 'desc="1 queries"' in header
+        assert "tpl;dur=2.2" in header
+        assert header.endswith("total;dur=10.0")
+
+
+@pytest.mark.django_db
+class TestServerTimingMiddleware:
+    def test_header_reports_db_and_template_time(self, client):
+        InterviewerFactory()
+        response = client.get(reverse("interviewers:list"))
+
+        header = response["Server-Timing"]
+        assert "db;dur=" in header
+        assert "tpl;dur=" in header
+        assert "total;dur=" in header
+
+    def test_slow_request_is_logged_with_fingerprints(self, client, settings, caplog):
+        settings.SLOW_REQUEST_MS = 0
+        InterviewerFactory()
+
+        with caplog.at_level(logging.WARNING, logger="interview_service.timing"):
+            client.get(reverse("interviewers:list"))
+
+        (record,) = caplog.records
+        assert record.getMessage().startswith("Slow request GET /interviewers/ -> 200")
+        assert '"interviewers_interviewer"' in record.getMessage()
+        assert record.query_count > 0
+
+    def test_fast_request_is_not_logged(self, client, settings, caplog):
+        settings.SLOW_REQUEST_MS = 60_000
+
+        with caplog.at_level(logging.WARNING, logger="interview_service.timing"):
+            client.get(reverse("interviewers:list"))
+
+        assert caplog.records == []
+
+    def test_repeated_queries_are_flagged(self, rf, settings, caplog):
+        settings.REPEATED_QUERY_THRESHOLD = 2
+        for _ in range(2):
+            InterviewerFactory()
+
+        def view(request):
+            # One user query per interviewer
+            names = [interviewer.user.username for interviewer in Interviewer.objects.all()]
+            return HttpResponse(", ".join(names))
+
+        with caplog.at_level(logging.WARNING, logger="interview_service.timing"):
+            ServerTimingMiddleware(view)(rf.get("/n-plus-one/"))
+
+        (record,) = caplog.records
+        assert record.getMessage().startswith("Repeated queries in GET /n-plus-one/")
+        assert "2x" in record.getMessage()
+        assert '"auth_user"."id" = ? LIMIT ?  [possible N+1]' in record.getMessage()
+
+    def test_interviewer_list_has_no_repeated_queries(self, client, settings, caplog):
+        settings.REPEATED_QUERY_THRESHOLD = 2
+        for _ in range(3):
+            InterviewerFactory()
+
+        with caplog.at_level(logging.WARNING, logger="interview_service.timing"):
+            client.get(reverse("interviewers:list"))
+
+        assert caplog.records == []
@@ -1,11 +1,21 @@
 """Tests for Django views."""
 
+from datetime import timedelta
+
 import pytest
 from django.urls import reverse
+from django.utils import timezone
 
+from bookings.analytics import refresh_daily_stats
+from bookings.models import Booking
 from tests.factories import InterviewerFactory, BookingFactory, TechnologyFactory
 
 
+def response_template(response):
+    """Return the name of the top-level template rendered for a response."""
+    return response.templates[0].name
+
+
 @pytest.mark.django_db
 class TestHomepage:
     def test_homepage_loads(self, client):
@@ -135,6 +145,120 @@ class TestDashboardViews:
         assert response.status_code == 404
 
 
+@pytest.mark.django_db
+class TestBookingHistory:
+    def test_history_requires_login(self, client):
+        response = client.get(reverse("dashboard:booking_history"))
+        assert response.status_code == 302
+        assert "login" in response.url
+
+    def test_history_shows_status_counts(self, client, interviewer):
+        BookingFactory.create_batch(2, interviewer=interviewer)
+        BookingFactory(interviewer=interviewer, status=Booking.Status.CANCELLED)
+        BookingFactory()  # Other interviewer's booking is not counted
+        client.force_login(interviewer.user)
+        response = client.get(reverse("dashboard:booking_history"))
+        assert response.status_code == 200
+        assert response.context["total_count"] == 3
+        counts = {value: count for value, _, count in response.context["status_counts"]}
+        assert counts[Booking.Status.CONFIRMED] == 2
+        assert counts[Booking.Status.CANCELLED] == 1
+        assert counts[Booking.Status.PENDING] == 0
+
+    def test_history_filters_by_status(self, client, interviewer):
+        cancelled = BookingFactory(interviewer=interviewer, status=Booking.Status.CANCELLED)
+        BookingFactory(interviewer=interviewer, status=Booking.Status.CONFIRMED)
+        client.force_login(interviewer.user)
+        response = client.get(reverse("dashboard:booking_history") + "?status=cancelled")
+        assert list(response.context["bookings"]) == [cancelled]
+
+    def test_history_paginates_with_cursor(self, client, interviewer):
+        now = timezone.now()
+        # Two bookings share a timestamp to exercise the id tie-breaker
+        bookings = [
+            BookingFactory(interviewer=interviewer, scheduled_at=now - timedelta(days=i // 2))
+            for i in range(25)
+        ]
+        client.force_login(interviewer.user)
+        first = client.get(reverse("dashboard:booking_history"))
+        assert len(first.context["bookings"]) == 20
+        assert first.context["next_cursor"]
+
+        second = client.get(
+            reverse("dashboard:booking_history"),
+            {"cursor": first.context["next_cursor"]},
+            HTTP_HX_REQUEST="true",
+        )
+        assert response_template(second) == "dashboard/partials/booking_rows.html"
+        assert len(second.context["bookings"]) == 5
+        assert second.context["next_cursor"] is None
+
+        seen = [b.id for b in first.context["bookings"]] + [b.id for b in second.context["bookings"]]
+        assert sorted(seen) == sorted(b.id for b in bookings)
+
+    def test_history_ignores_invalid_cursor(self, client, interviewer):
+        BookingFactory(interviewer=interviewer)
+        client.force_login(interviewer.user)
+        response = client.get(reverse("dashboard:booking_history") + "?cursor=garbage")
+        assert response.status_code == 200
+        assert len(response.context["bookings"]) == 1
+
+    def test_history_query_count_is_constant(
+        self, client, interviewer, django_assert_max_num_queries
+    ):
+        BookingFactory.create_batch(30, interviewer=interviewer)
+        client.force_login(interviewer.user)
+        # session, user, interviewer, counts aggregate, page
+        with django_assert_max_num_queries(5):
+            client.get(reverse("dashboard:booking_history"))
+
+
+@pytest.mark.django_db
+class TestBookingExport:
+    def test_export_streams_own_bookings(self, client, interviewer):
+        booking = BookingFactory(interviewer=interviewer, customer_name="=HYPERLINK(1)")
+        BookingFactory()
+        client.force_login(interviewer.user)
+        response = client.get(reverse("dashboard:booking_export"))
+        assert response.status_code == 200
+        assert response.streaming
+        assert response["Content-Type"] == "text/csv"
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert lines[0].startswith("Booking ID,Scheduled At")
+        assert len(lines) == 2
+        assert lines[1].startswith(f"{booking.id},")
+        assert ",150.00," in lines[1]
+        assert "'=HYPERLINK(1)" in lines[1]
+
+    def test_export_honours_status_filter(self, client, interviewer):
+        BookingFactory(interviewer=interviewer, status=Booking.Status.CANCELLED)
+        BookingFactory(interviewer=interviewer, status=Booking.Status.CONFIRMED)
+        client.force_login(interviewer.user)
+        response = client.get(reverse("dashboard:booking_export") + "?status=cancelled")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert len(lines) == 2
+        assert ",cancelled," in lines[1]
+
+
+@pytest.mark.django_db
+class TestEarnings:
+    def test_earnings_loads_from_rollup(self, client, interviewer):
+        BookingFactory(interviewer=interviewer, scheduled_at=timezone.now() - timedelta(days=2))
+        refresh_daily_stats()
+        client.force_login(interviewer.user)
+        response = client.get(reverse("dashboard:earnings"))
+        assert response.status_code == 200
+        assert response.context["totals"]["bookings"] == 1
+        assert response.context["totals"]["revenue_cents"] == 15000
+        assert b"$150.00" in response.content
+
+    def test_earnings_falls_back_to_default_period(self, client, interviewer):
+        client.force_login(interviewer.user)
+        response = client.get(reverse("dashboard:earnings") + "?days=7")
+        assert response.context["days"] == 30
+
+
 @pytest.mark.django_db
 class TestAuthViews:
     def test_login_page_loads(self, client):